@@ -5,7 +5,7 @@ DTOs are used to transfer data between layers.
 
 
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -26,6 +26,8 @@ class CandidateDTO:
     raw_extracted_data: Dict[str, Any]
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
+    extraction_provisional: bool = False
+    extractor_version: str = ''
 
 
 @dataclass
@@ -60,6 +62,8 @@ class DocumentSubmissionDTO:
     document_file_url: Optional[str]
     verification_status: str
     uploaded_at: Optional[datetime]
+    thumbnail_url: Optional[str] = None
+    preview_url: Optional[str] = None
 
 
 @dataclass
@@ -81,6 +85,25 @@ class RequestDocumentsRequest:
     """Request DTO for document request."""
     request_type: str
     communication_channel: str
+    use_ai: Optional[bool] = None # None -> configured default message mode
+
+
+@dataclass
+class BulkRequestDocumentsRequest:
+    """Request DTO for requesting documents from many candidates."""
+    candidate_ids: List[int]
+    request_type: str
+    communication_channel: str
+    use_ai: Optional[bool] = None
+
+
+@dataclass
+class BulkDocumentRequestResultDTO:
+    """Per-candidate outcome of a bulk document request."""
+    candidate_id: int
+    status: str # created, not_found or failed
+    document_request: Optional[DocumentRequestDTO] = None
+    error: Optional[str] = None
 
 
 @dataclass
@@ -89,3 +112,57 @@ class SubmitDocumentRequest:
     document_type: str
     document_file: Any # could add file type (or string for filename)
 
+
+@dataclass
+class DashboardStatsDTO:
+    #DTO for dashboard counters.
+    candidates_total: int
+    candidates_by_status: Dict[str, int]
+    document_requests_total: int
+    pending_document_requests: int
+    document_submissions_total: int
+    pending_verifications: int
+
+
+@dataclass
+class DuplicateClusterDTO:
+    #DTO for a group of candidates that look like the same person.
+    matched_on: List[str]
+    candidates: List[CandidateListDTO]
+
+
+@dataclass
+class DuplicateClusterPageDTO:
+    #DTO for one page of duplicate clusters.
+    count: int # clusters in total, not on this page
+    clusters: List[DuplicateClusterDTO]
+
+
+@dataclass
+class ImportErrorDTO:
+    """A record that could not be imported."""
+    line: int
+    error: str
+
+
+@dataclass
+class ImportCandidatesResultDTO:
+    """Running totals of a bulk candidate import."""
+    processed: int = 0
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: List[ImportErrorDTO] = field(default_factory=list)
+
+
+@dataclass
+class ReextractionResultDTO:
+    """Running totals of a re-extraction run."""
+    processed: int = 0
+    updated: int = 0
+    # Extractor fell back (LLM unavailable); stored data was left as it was.
+    fell_back: int = 0
+    failed: int = 0
+    skipped: int = 0
+    # Highest id such that every selected candidate up to it has been handled.
+    last_id: int = 0
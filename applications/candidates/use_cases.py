@@ -4,7 +4,10 @@ Use cases for the candidates application.
 Use cases orchestrate domain objects and coordinate with repositories.
 """
 
-from typing import List
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # importing domains
 
@@ -18,17 +21,27 @@ from domains.candidates.value_objects import (
     RequestType,
     CommunicationChannel,
     DocumentType,
+    CandidateQuery,
+    ExtractedData,
+    ReextractionSelection,
+    RequestStatus,
+    VerificationStatus,
 )
 from domains.candidates.interfaces import (
     ICandidateRepository,
     IDocumentRequestRepository,
     IDocumentSubmissionRepository,
     IEmailService,
+    IResumeTextRepository,
+    IStatsRepository,
 )
 from domains.candidates.domain_services import (
     ResumeTextExtractor,
     ResumeDataExtractor,
     DocumentRequestGenerator,
+    DocumentPreviewGenerator,
+    DocumentFileNormalizer,
+    ExtractionConfidenceCalculator,
 )
 from domains.candidates.exceptions import (
     CandidateNotFoundError,
@@ -46,27 +59,56 @@ from .dto import (
     DocumentSubmissionDTO,
     UploadResumeRequest,
     RequestDocumentsRequest,
+    BulkRequestDocumentsRequest,
+    BulkDocumentRequestResultDTO,
     SubmitDocumentRequest,
+    DashboardStatsDTO,
+    DuplicateClusterDTO,
+    DuplicateClusterPageDTO,
+    ImportErrorDTO,
+    ImportCandidatesResultDTO,
+    ReextractionResultDTO,
 )
 
 
 # importing models
+from django.db import connection, transaction
 from infrastructure.persistence.models import CandidateModel
+from infrastructure.background import run_in_background
+
+
+logger = logging.getLogger(__name__)
 
 
 class UploadResumeUseCase:
     #Use case for uploading and parsing a resume
+    #
+    # With a deadline set, the data extractor runs in the background. If it has
+    # not answered within ``deadline_ms`` the fallback extractor's result is
+    # saved as a provisional extraction (with lowered confidence) and returned,
+    # and the candidate is upgraded once the full extraction finishes.
+    #
+    # With a resume text repository, the parsed text is kept (compressed) so
+    # later stages such as re-extraction do not have to parse the file again.
     
     def __init__(
         self, 
         candidate_repository: ICandidateRepository, 
         text_extractor: ResumeTextExtractor, 
-        data_extractor: ResumeDataExtractor
+        data_extractor: ResumeDataExtractor,
+        fallback_extractor: Optional[ResumeDataExtractor] = None,
+        deadline_ms: Optional[int] = None,
+        provisional_confidence_factor: float = 0.5,
+        resume_text_repository: Optional[IResumeTextRepository] = None,
     ):
     
+        self.resume_text_repository = resume_text_repository
         self.candidate_repository = candidate_repository
         self.text_extractor = text_extractor
         self.data_extractor = data_extractor
+        self.fallback_extractor = fallback_extractor
+        self.deadline_ms = deadline_ms
+        self.provisional_confidence_factor = provisional_confidence_factor
     
     def execute(self, request: UploadResumeRequest) -> CandidateDTO:
         #Execute resume upload and parsing
@@ -92,6 +134,10 @@ class UploadResumeUseCase:
             
             # Extract text from resume
             resume_text = self.text_extractor.extract(file_path)
+            self._store_text(candidate.id, resume_text, model.resume_file.name)
+            
+            if self.deadline_ms and self.fallback_extractor:
+                return self._execute_with_deadline(candidate, resume_text)
             
             # Extract structured data
             extracted_data = self.data_extractor.extract(resume_text)
@@ -110,6 +156,66 @@ class UploadResumeUseCase:
         
         return self._to_dto(candidate)
     
+    def _store_text(self, candidate_id: int, resume_text: str, source_name: str) -> None:
+        #Keep the parsed text; losing it only costs a re-parse later, so errors are logged
+        
+        if self.resume_text_repository is None:
+            return
+        try:
+            self.resume_text_repository.save(candidate_id, resume_text, source_name)
+        except Exception:
+            logger.exception("Could not store resume text for candidate %s", candidate_id)
+    
+    def _execute_with_deadline(self, candidate: Candidate, resume_text: str) -> CandidateDTO:
+        #Wait up to the deadline for the extractor, else save a provisional result
+        
+        future = run_in_background(self.data_extractor.extract, resume_text)
+        try:
+            extracted_data = future.result(timeout=self.deadline_ms / 1000)
+        except FutureTimeoutError:
+            provisional = self.fallback_extractor.extract(resume_text)
+            provisional = replace(
+                provisional,
+                confidence=provisional.confidence * self.provisional_confidence_factor,
+                raw_data={**provisional.raw_data, 'provisional': True},
+            )
+            candidate.update_extraction_data(provisional, provisional=True)
+            candidate = self.candidate_repository.update(candidate)
+            
+            # Registered only after the provisional write, so the upgrade can never
+            # be overwritten by it. Runs immediately if the extractor already finished.
+            candidate_id = candidate.id
+            future.add_done_callback(
+                lambda done: run_in_background(self._upgrade_extraction, candidate_id, done)
+            )
+            return self._to_dto(candidate)
+        
+        candidate.update_extraction_data(extracted_data)
+        candidate = self.candidate_repository.update(candidate)
+        return self._to_dto(candidate)
+    
+    def _upgrade_extraction(self, candidate_id: int, future: Future) -> None:
+        #Replace a provisional extraction with the finished extractor result
+        
+        try:
+            extracted_data = future.result()
+        except Exception:
+            logger.exception("Background extraction failed for candidate %s", candidate_id)
+            return
+        
+        # The extractor falls back instead of raising; a fallback result is no
+        # better than the provisional one, so the record stays provisional.
+        if extracted_data.extractor_version != self.data_extractor.version:
+            logger.warning("Extraction for candidate %s fell back; keeping provisional data", candidate_id)
+            return
+        
+        candidate = self.candidate_repository.get_by_id(candidate_id)
+        if not candidate or not candidate.extraction_provisional:
+            return
+        
+        candidate.update_extraction_data(extracted_data)
+        self.candidate_repository.update(candidate)
+    
     def _to_dto(self, candidate: Candidate) -> CandidateDTO:
         
         
@@ -131,6 +237,8 @@ class UploadResumeUseCase:
             raw_extracted_data=candidate.raw_extracted_data,
             created_at=candidate.created_at,
             updated_at=candidate.updated_at,
+            extraction_provisional=candidate.extraction_provisional,
+            extractor_version=candidate.extractor_version,
         )
 
 
@@ -142,13 +250,20 @@ class GetCandidatesUseCase:
         self.candidate_repository = candidate_repository
     
     
-    def execute(self) -> List[CandidateListDTO]:
-        """Execute get all candidates."""
+    def execute(self, query: Optional[CandidateQuery] = None) -> List[CandidateListDTO]:
+        """Execute get all candidates, or the slice described by ``query``."""
         
         
-        candidates = self.candidate_repository.get_all()
+        if query is None:
+            candidates = self.candidate_repository.get_all()
+        else:
+            candidates = self.candidate_repository.find(query)
         return [self._to_dto(candidate) for candidate in candidates]
     
+    def count(self, query: CandidateQuery) -> int:
+        #Total matches for query, ignoring its limit and offset.
+        return self.candidate_repository.count(query)
+    
     def _to_dto(self, candidate: Candidate) -> CandidateListDTO:
         #Convert entity to list DTO.
         
@@ -212,7 +327,9 @@ class GetCandidateDetailUseCase:
             extraction_confidence=candidate.extraction_confidence,
             raw_extracted_data=candidate.raw_extracted_data,
             created_at=candidate.created_at,
-            updated_at=candidate.updated_at
+            updated_at=candidate.updated_at,
+            extraction_provisional=candidate.extraction_provisional,
+            extractor_version=candidate.extractor_version,
         )
     
     def _request_to_dto(self, request: DocumentRequest) -> DocumentRequestDTO:
@@ -244,6 +361,10 @@ class GetCandidateDetailUseCase:
         )
 
 
+def _document_request_subject(request_type: str) -> str:
+    return f"Document Request: {request_type.replace('_', ' ').title()}"
+
+
 class RequestDocumentsUseCase:
     #Use case for requesting documents.
     
@@ -272,7 +393,8 @@ class RequestDocumentsUseCase:
             candidate_email=candidate.email,
             candidate_phone=candidate.phone,
             request_type=request.request_type,
-            communication_channel=request.communication_channel
+            communication_channel=request.communication_channel,
+            use_ai=request.use_ai,
         )
         
         # Create request entity
@@ -284,18 +406,19 @@ class RequestDocumentsUseCase:
         )
         
         
-        # set up email service
-        # if request.communication_channel in ['email', 'both']:
-        #     subject = f"Document Request: {request.request_type.replace('_', ' ').title()}"
-        #     self.email_service.send_email(
-        #         to_email=candidate.email,
-        #         subject=subject,
-        #         message=message_text,
-        #     )
-        
-        doc_request = self.request_repository.create(doc_request)
-        doc_request.mark_as_sent()
-        doc_request = self.request_repository.update(doc_request) if hasattr(self.request_repository, 'update') else doc_request
+        # The email is queued in the same transaction as the request and
+        # delivered later by the outbox worker, so no SMTP time is spent here.
+        with transaction.atomic():
+            doc_request = self.request_repository.create(doc_request)
+            doc_request.mark_as_sent()
+            doc_request = self.request_repository.update(doc_request)
+            
+            if request.communication_channel in ['email', 'both'] and candidate.email:
+                self.email_service.send_email(
+                    to_email=candidate.email,
+                    subject=_document_request_subject(request.request_type),
+                    message=message_text,
+                )
         
         return DocumentRequestDTO(
             id=doc_request.id,
@@ -307,6 +430,106 @@ class RequestDocumentsUseCase:
         )
 
 
+class BulkRequestDocumentsUseCase:
+    #Use case for requesting documents from many candidates at once.
+    #
+    # Candidates are loaded in one query, messages are generated concurrently and
+    # all requests are inserted in a single batched write.
+    
+    def __init__(
+        self,
+        candidate_repository: ICandidateRepository,
+        request_repository: IDocumentRequestRepository,
+        message_generator: DocumentRequestGenerator,
+        email_service: IEmailService,
+        max_workers: int = 8,
+    ):
+        self.candidate_repository = candidate_repository
+        self.request_repository = request_repository
+        self.message_generator = message_generator
+        self.email_service = email_service
+        self.max_workers = max_workers
+    
+    def execute(self, request: BulkRequestDocumentsRequest) -> List[BulkDocumentRequestResultDTO]:
+        #Execute bulk document request; results follow the order of candidate_ids.
+        
+        request_type = RequestType(request.request_type)
+        channel = CommunicationChannel(request.communication_channel)
+        candidate_ids = list(dict.fromkeys(request.candidate_ids))
+        
+        candidates = self.candidate_repository.get_by_ids(candidate_ids)
+        
+        def generate(candidate: Candidate) -> str:
+            return self.message_generator.generate(
+                candidate_name=candidate.name,
+                candidate_email=candidate.email,
+                candidate_phone=candidate.phone,
+                request_type=request_type.value,
+                communication_channel=channel.value,
+                use_ai=request.use_ai,
+            )
+        
+        results = {
+            candidate_id: BulkDocumentRequestResultDTO(
+                candidate_id=candidate_id,
+                status='not_found',
+                error=f"Candidate with id {candidate_id} not found",
+            )
+            for candidate_id in candidate_ids
+        }
+        
+        doc_requests = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(candidate, executor.submit(generate, candidate)) for candidate in candidates]
+            for candidate, future in futures:
+                try:
+                    message_text = future.result()
+                except Exception as e:
+                    results[candidate.id] = BulkDocumentRequestResultDTO(
+                        candidate_id=candidate.id, status='failed', error=str(e)
+                    )
+                    continue
+                doc_request = DocumentRequest(
+                    candidate_id=candidate.id,
+                    request_type=request_type,
+                    request_message=message_text,
+                    communication_channel=channel,
+                )
+                # Written as sent straight away instead of create-then-update.
+                doc_request.mark_as_sent()
+                doc_requests.append(doc_request)
+        
+        emails_by_candidate = {candidate.id: candidate.email for candidate in candidates}
+        with transaction.atomic():
+            created_requests = self.request_repository.bulk_create(doc_requests)
+            if channel.value in ['email', 'both']:
+                self.email_service.send_bulk([
+                    (
+                        emails_by_candidate[doc_request.candidate_id],
+                        _document_request_subject(request_type.value),
+                        doc_request.request_message,
+                    )
+                    for doc_request in created_requests
+                    if emails_by_candidate.get(doc_request.candidate_id)
+                ])
+        
+        for doc_request in created_requests:
+            results[doc_request.candidate_id] = BulkDocumentRequestResultDTO(
+                candidate_id=doc_request.candidate_id,
+                status='created',
+                document_request=DocumentRequestDTO(
+                    id=doc_request.id,
+                    request_type=doc_request.request_type.value,
+                    request_message=doc_request.request_message,
+                    communication_channel=doc_request.communication_channel.value,
+                    status=doc_request.status.value,
+                    created_at=doc_request.created_at,
+                ),
+            )
+        
+        return [results[candidate_id] for candidate_id in candidate_ids]
+
+
 class SubmitDocumentUseCase:
     #Use case for submitting documents.
     
@@ -314,9 +537,13 @@ class SubmitDocumentUseCase:
         self,
         candidate_repository: ICandidateRepository,
         submission_repository: IDocumentSubmissionRepository,
+        preview_generator: Optional[DocumentPreviewGenerator] = None,
+        file_normalizer: Optional[DocumentFileNormalizer] = None,
     ):
         self.candidate_repository = candidate_repository
         self.submission_repository = submission_repository
+        self.preview_generator = preview_generator
+        self.file_normalizer = file_normalizer
     
     def execute(self, candidate_id: int, request: SubmitDocumentRequest) -> DocumentSubmissionDTO:
         #Execute document submission.
@@ -328,13 +555,26 @@ class SubmitDocumentUseCase:
         
 
 
+        document_file = request.document_file
+        original_file_path = ''
+        if self.file_normalizer:
+            original_file_path = self.file_normalizer.archive_original(document_file)
+            document_file = self.file_normalizer.normalize(document_file)
+
         submission = DocumentSubmission(
             candidate_id=candidate_id,
             document_type=DocumentType(request.document_type),
-            document_file_path=request.document_file
+            document_file_path=document_file,
+            original_file_path=original_file_path,
         )
         
         submission = self.submission_repository.create(submission)
+
+        # Thumbnails are rendered off the request path once the row is committed.
+        if self.preview_generator and submission.id:
+            transaction.on_commit(
+                lambda: run_in_background(self.preview_generator.generate, submission.id)
+            )
         
         return DocumentSubmissionDTO(
             id=submission.id,
@@ -345,3 +585,308 @@ class SubmitDocumentUseCase:
             uploaded_at=submission.uploaded_at
         )
 
+
+class GetDashboardStatsUseCase:
+    #Use case for dashboard counts, read from incrementally maintained counters.
+    
+    def __init__(self, stats_repository: IStatsRepository):
+        self.stats_repository = stats_repository
+    
+    def execute(self) -> DashboardStatsDTO:
+        counts = self.stats_repository.get_counts()
+        
+        return DashboardStatsDTO(
+            candidates_total=counts.get('candidates.total', 0),
+            candidates_by_status={
+                status.value: counts.get(f'candidates.status.{status.value}', 0)
+                for status in ExtractionStatus
+            },
+            document_requests_total=counts.get('document_requests.total', 0),
+            pending_document_requests=counts.get(f'document_requests.status.{RequestStatus.PENDING.value}', 0),
+            document_submissions_total=counts.get('document_submissions.total', 0),
+            pending_verifications=counts.get(f'document_submissions.status.{VerificationStatus.PENDING.value}', 0),
+        )
+
+
+class FindDuplicateCandidatesUseCase:
+    #Use case for finding candidates that share a blocking key.
+    
+    KEY_FIELDS = {
+        'email': 'email_key',
+        'phone': 'phone_key',
+        'name': 'name_key',
+    }
+    
+    def __init__(self, candidate_repository: ICandidateRepository):
+        self.candidate_repository = candidate_repository
+    
+    def execute(self, keys: List[str], limit: Optional[int] = None, offset: int = 0) -> DuplicateClusterPageDTO:
+        # keys: any of 'email', 'phone', 'name'; clusters sharing any of them are merged.
+        
+        key_fields = [self.KEY_FIELDS[key] for key in keys]
+        count, clusters = self.candidate_repository.find_duplicate_clusters(key_fields, limit, offset)
+        field_names = {field: key for key, field in self.KEY_FIELDS.items()}
+        
+        return DuplicateClusterPageDTO(
+            count=count,
+            clusters=[
+                DuplicateClusterDTO(
+                    matched_on=[field_names[field] for field in matched_on],
+                    candidates=[self._to_dto(candidate) for candidate in candidates],
+                )
+                for matched_on, candidates in clusters
+            ],
+        )
+    
+    def _to_dto(self, candidate: Candidate) -> CandidateListDTO:
+        return CandidateListDTO(
+            id=candidate.id or 0,
+            name=candidate.name,
+            email=candidate.email,
+            phone=candidate.phone,
+            company=candidate.company,
+            designation=candidate.designation,
+            extraction_status=candidate.extraction_status.value,
+            created_at=candidate.created_at or candidate.updated_at or None
+        )
+
+
+class ExportCandidatesUseCase:
+    #Use case for streaming candidate rows for export.
+    
+    COLUMNS = [
+        'id', 'name', 'email', 'phone', 'company', 'designation', 'skills',
+        'extraction_status', 'extraction_confidence', 'created_at', 'updated_at',
+        'latest_request_status', 'pan_status', 'aadhaar_status',
+    ]
+    
+    def __init__(self, candidate_repository: ICandidateRepository, chunk_size: int = 2000):
+        self.candidate_repository = candidate_repository
+        self.chunk_size = chunk_size
+    
+    def execute(self, query: CandidateQuery, columns: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        # Rows are produced lazily; nothing is read until the caller iterates.
+        
+        columns = columns or self.COLUMNS
+        unknown = [column for column in columns if column not in self.COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown export columns: {', '.join(unknown)}")
+        return self.candidate_repository.export_rows(query, columns, self.chunk_size)
+
+
+class ImportCandidatesUseCase:
+    #Use case for loading already-structured candidates (e.g. from another ATS).
+    #
+    # Records are validated through ExtractedData and written in batches,
+    # upserting on the email (ignoring case); no resume parsing or LLM calls happen.
+    
+    def __init__(
+        self,
+        candidate_repository: ICandidateRepository,
+        confidence_calculator: Optional[ExtractionConfidenceCalculator] = None,
+        batch_size: int = 1000,
+        max_errors: int = 100,
+    ):
+        self.candidate_repository = candidate_repository
+        self.confidence_calculator = confidence_calculator or ExtractionConfidenceCalculator()
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+    
+    def execute(
+        self,
+        records: Iterable[Tuple[int, Optional[Dict[str, Any]], Optional[str]]],
+        progress: Optional[Callable[[ImportCandidatesResultDTO], None]] = None,
+    ) -> ImportCandidatesResultDTO:
+        #Execute import; progress is called after every written batch.
+        
+        result = ImportCandidatesResultDTO()
+        batch: List[Candidate] = []
+        
+        for line, record, error in records:
+            result.processed += 1
+            if error is None:
+                try:
+                    batch.append(self._to_candidate(record))
+                except (TypeError, ValueError) as e:
+                    error = str(e)
+            if error is not None:
+                result.failed += 1
+                if len(result.errors) < self.max_errors:
+                    result.errors.append(ImportErrorDTO(line=line, error=error))
+            
+            if len(batch) >= self.batch_size:
+                self._flush(batch, result, progress)
+                batch = []
+        
+        if batch:
+            self._flush(batch, result, progress)
+        return result
+    
+    def _flush(self, batch, result, progress) -> None:
+        created, updated = self.candidate_repository.bulk_upsert_by_email(batch)
+        result.created += created
+        result.updated += updated
+        if progress:
+            progress(result)
+    
+    def _to_candidate(self, record: Dict[str, Any]) -> Candidate:
+        fields = {
+            name: str(record.get(name) or '').strip()
+            for name in ('name', 'email', 'phone', 'company', 'designation')
+        }
+        skills = record.get('skills') or []
+        if isinstance(skills, str):
+            skills = [skill.strip() for skill in skills.replace(',', ';').split(';') if skill.strip()]
+        fields['skills'] = skills
+        
+        confidence = record.get('confidence')
+        if confidence in (None, ''):
+            confidence = self.confidence_calculator.calculate(fields)
+        
+        extracted_data = ExtractedData(
+            confidence=float(confidence),
+            raw_data={**record, 'source': 'import'},
+            extractor_version='import',
+            **fields,
+        )
+        
+        candidate = Candidate()
+        candidate.update_extraction_data(extracted_data)
+        return candidate
+
+
+class ReextractCandidatesUseCase:
+    #Use case for running the current data extractor again over stored resumes.
+    #
+    # Candidates are taken in id order, a batch at a time. Each batch's texts
+    # are loaded on a thread pool, then extracted with ``extract_batch`` in one
+    # slice per worker, so batching extractors share requests across resumes.
+    # LLM calls still go through the shared governor, so its concurrency and
+    # rate limits apply whatever the pool size. When the
+    # extractor falls back (result from a different extractor version) the
+    # stored data is kept unless ``accept_fallback`` is set, so an outage never
+    # downgrades earlier extractions. ``progress`` runs after every batch with
+    # ``last_id`` advanced past it, which is what callers checkpoint.
+    #
+    # Text stored by the resume text repository is reused unless ``reparse``
+    # is set; files parsed here have their text stored for the next run.
+    
+    def __init__(
+        self,
+        candidate_repository: ICandidateRepository,
+        text_extractor: ResumeTextExtractor,
+        data_extractor: ResumeDataExtractor,
+        workers: int = 4,
+        batch_size: Optional[int] = None,
+        accept_fallback: bool = False,
+        resume_text_repository: Optional[IResumeTextRepository] = None,
+        reparse: bool = False,
+    ):
+        self.resume_text_repository = resume_text_repository
+        self.reparse = reparse
+        self.candidate_repository = candidate_repository
+        self.text_extractor = text_extractor
+        self.data_extractor = data_extractor
+        self.workers = max(1, workers)
+        self.batch_size = batch_size or self.workers * 4
+        self.accept_fallback = accept_fallback
+    
+    def execute(
+        self,
+        selection: ReextractionSelection,
+        after_id: int = 0,
+        limit: Optional[int] = None,
+        progress: Optional[Callable[[ReextractionResultDTO], None]] = None,
+    ) -> ReextractionResultDTO:
+        #Execute re-extraction of the selected candidates with ids above after_id.
+        
+        result = ReextractionResultDTO(last_id=after_id)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='reextract') as executor:
+            while limit is None or result.processed < limit:
+                page_size = self.batch_size if limit is None else min(self.batch_size, limit - result.processed)
+                candidate_ids = self.candidate_repository.find_ids_for_reextraction(
+                    selection, result.last_id, page_size,
+                )
+                if not candidate_ids:
+                    break
+                for outcome in self._reextract_page(executor, candidate_ids):
+                    result.processed += 1
+                    setattr(result, outcome, getattr(result, outcome) + 1)
+                result.last_id = candidate_ids[-1]
+                if progress:
+                    progress(result)
+        return result
+    
+    def _reextract_page(self, executor: ThreadPoolExecutor, candidate_ids: List[int]) -> List[str]:
+        #Re-extract one page of candidates; returns the ReextractionResultDTO counter to bump for each.
+        
+        outcomes: Dict[int, str] = {}
+        loaded = []
+        for candidate_id, item in zip(candidate_ids, executor.map(self._load, candidate_ids)):
+            if isinstance(item, str):
+                outcomes[candidate_id] = item
+            else:
+                loaded.append(item)
+        
+        slice_size = max(1, -(-len(loaded) // self.workers))
+        slices = [loaded[start:start + slice_size] for start in range(0, len(loaded), slice_size)]
+        for items, extracted in zip(slices, executor.map(self._extract_slice, slices)):
+            for (candidate, _), extracted_data in zip(items, extracted):
+                outcomes[candidate.id] = self._apply(candidate, extracted_data)
+        return [outcomes[candidate_id] for candidate_id in candidate_ids]
+    
+    def _load(self, candidate_id: int):
+        #(candidate, resume text) to extract, or the counter to bump when there is nothing to do.
+        
+        try:
+            candidate = self.candidate_repository.get_by_id(candidate_id)
+            if candidate is None:
+                return 'skipped'
+            
+            model = CandidateModel.objects.get(pk=candidate_id)
+            if not model.resume_file:
+                return 'skipped'
+            return candidate, self._resume_text(candidate_id, model.resume_file)
+        except Exception:
+            logger.exception("Re-extraction failed for candidate %s", candidate_id)
+            return 'failed'
+        finally:
+            # Pool threads end with the run, so their connections are closed here.
+            connection.close()
+    
+    def _extract_slice(self, items) -> List[Optional[ExtractedData]]:
+        
+        try:
+            return self.data_extractor.extract_batch([resume_text for _, resume_text in items])
+        except Exception:
+            logger.exception(
+                "Re-extraction failed for candidates %s", [candidate.id for candidate, _ in items],
+            )
+            return [None] * len(items)
+    
+    def _apply(self, candidate: Candidate, extracted_data: Optional[ExtractedData]) -> str:
+        
+        if extracted_data is None:
+            return 'failed'
+        if extracted_data.extractor_version != self.data_extractor.version and not self.accept_fallback:
+            return 'fell_back'
+        try:
+            candidate.update_extraction_data(extracted_data)
+            self.candidate_repository.update(candidate)
+            return 'updated'
+        except Exception:
+            logger.exception("Re-extraction failed for candidate %s", candidate.id)
+            return 'failed'
+    
+    def _resume_text(self, candidate_id: int, resume_file) -> str:
+        #Stored text for this exact file when there is some, else parse (and store) it
+        
+        if self.resume_text_repository is None:
+            return self.text_extractor.extract(resume_file.path)
+        if not self.reparse:
+            resume_text = self.resume_text_repository.get(candidate_id, source_name=resume_file.name)
+            if resume_text is not None:
+                return resume_text
+        resume_text = self.text_extractor.extract(resume_file.path)
+        self.resume_text_repository.save(candidate_id, resume_text, resume_file.name)
+        return resume_text
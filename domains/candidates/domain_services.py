@@ -1,7 +1,9 @@
 #Domain service
 
-from typing import Dict, Any
-from .value_objects import ExtractedData
+import re
+import unicodedata
+from typing import Dict, Any, List, Optional
+from .value_objects import BlockingKeys, ExtractedData
 
 
 class ExtractionConfidenceCalculator:
@@ -17,6 +19,72 @@ class ExtractionConfidenceCalculator:
         return filled_fields / len(fields) if fields else 0.0
 
 
+class BlockingKeyGenerator:
+    """Domain service to build duplicate-detection keys for a candidate.
+
+    Keys are exact-match values, so duplicates are found with index lookups
+    rather than pairwise comparisons: a canonical email, an E.164 phone
+    number and an order-insensitive name fingerprint.
+    """
+
+    # Providers that ignore dots in the local part of an address.
+    DOTLESS_EMAIL_DOMAINS = ('gmail.com', 'googlemail.com')
+
+    # Most candidates are Indian; numbers without a country code get this one.
+    DEFAULT_COUNTRY_CODE = '91'
+    NATIONAL_NUMBER_LENGTH = 10
+
+    @classmethod
+    def generate(cls, name: str, email: str, phone: str) -> BlockingKeys:
+        return BlockingKeys(
+            email_key=cls.email_key(email),
+            phone_key=cls.phone_key(phone),
+            name_key=cls.name_key(name),
+        )
+
+    @classmethod
+    def email_key(cls, email: str) -> str:
+        """Lowercase, drop +tags, and drop dots for providers that ignore them."""
+        email = (email or '').strip().lower()
+        if email.count('@') != 1:
+            return ''
+        local, domain = email.split('@')
+        local = local.split('+', 1)[0]
+        if domain == 'googlemail.com':
+            domain = 'gmail.com'
+        if domain in cls.DOTLESS_EMAIL_DOMAINS:
+            local = local.replace('.', '')
+        if not local or not domain:
+            return ''
+        return f'{local}@{domain}'
+
+    @classmethod
+    def phone_key(cls, phone: str) -> str:
+        """Best-effort E.164 form (+<country><number>), or '' if unusable."""
+        phone = (phone or '').strip()
+        digits = re.sub(r'\D', '', phone)
+        if phone.startswith('+'):
+            pass
+        elif digits.startswith('00'):
+            digits = digits[2:]
+        elif len(digits) == cls.NATIONAL_NUMBER_LENGTH + 1 and digits.startswith('0'):
+            digits = cls.DEFAULT_COUNTRY_CODE + digits[1:]
+        elif len(digits) == cls.NATIONAL_NUMBER_LENGTH:
+            digits = cls.DEFAULT_COUNTRY_CODE + digits
+        # E.164 allows at most 15 digits; anything shorter than 8 is not a phone number.
+        if not 8 <= len(digits) <= 15:
+            return ''
+        return f'+{digits}'
+
+    @staticmethod
+    def name_key(name: str) -> str:
+        """Accent-free, lowercase name tokens in sorted order."""
+        name = unicodedata.normalize('NFKD', name or '')
+        name = ''.join(c for c in name if not unicodedata.combining(c)).lower()
+        tokens = [token for token in re.split(r'[^a-z]+', name) if len(token) > 1]
+        return ' '.join(sorted(tokens))
+
+
 # Creating classes and its abstract method which is not implemented for now
 # this will be used incase if there are multiple type
 
@@ -30,10 +98,20 @@ class ResumeTextExtractor:
 
 class ResumeDataExtractor:
     
+    # Stored on candidates as ``extractor_version``; change it whenever the
+    # extractor's output would change (model, prompt, rules) so older
+    # extractions can be selected for re-extraction.
+    version: str = ''
+    
     def extract(self, resume_text: str) -> ExtractedData:
 
         raise NotImplementedError("Subclasses must implement extract method")
 
+    def extract_batch(self, resume_texts: List[str]) -> List[ExtractedData]:
+        # Extract several resumes, results in input order.
+        # Subclasses can override this to share one request across resumes.
+        return [self.extract(text) for text in resume_texts]
+
 
 class DocumentRequestGenerator:
     
@@ -44,7 +122,28 @@ class DocumentRequestGenerator:
         candidate_phone: str,
         request_type: str,
         communication_channel: str,
+        use_ai: Optional[bool] = None,
     ) -> str:
         
         raise NotImplementedError("Subclasses must implement generate method")
 
+
+
+class DocumentPreviewGenerator:
+
+    def generate(self, submission_id: int) -> None:
+        # Build the thumbnail and preview images for a submitted document.
+
+        raise NotImplementedError("Subclasses must implement generate method")
+
+
+class DocumentFileNormalizer:
+
+    def normalize(self, document_file):
+        # Return the file to store in place of the uploaded one.
+
+        raise NotImplementedError("Subclasses must implement normalize method")
+
+    def archive_original(self, document_file) -> str:
+        # Keep the untouched upload somewhere cheap; returns its path or ''.
+        return ''
@@ -35,11 +35,17 @@ class Candidate:
     extraction_status: ExtractionStatus = ExtractionStatus.PENDING
     extraction_confidence: float = 0.0
     raw_extracted_data: dict = field(default_factory=dict)
+    extraction_provisional: bool = False
+    extractor_version: str = ''
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    def update_extraction_data(self, extracted_data: ExtractedData) -> None:
-        """Update candidate with extracted data."""
+    def update_extraction_data(self, extracted_data: ExtractedData, provisional: bool = False) -> None:
+        """Update candidate with extracted data.
+
+        Provisional data comes from a fast local extraction and is expected
+        to be replaced once the full extraction finishes.
+        """
         self.name = extracted_data.name
         self.email = extracted_data.email
         self.phone = extracted_data.phone
@@ -48,6 +54,8 @@ class Candidate:
         self.skills = extracted_data.skills
         self.extraction_confidence = extracted_data.confidence
         self.raw_extracted_data = extracted_data.raw_data
+        self.extraction_provisional = provisional
+        self.extractor_version = extracted_data.extractor_version
         self.extraction_status = ExtractionStatus.COMPLETED
 
     def mark_extraction_failed(self, error: str) -> None:
@@ -94,6 +102,7 @@ class DocumentSubmission:
     candidate_id: int = 0
     document_type: DocumentType = DocumentType.PAN
     document_file_path: str = ''
+    original_file_path: str = ''
     verification_status: VerificationStatus = VerificationStatus.PENDING
     uploaded_at: Optional[datetime] = None
 
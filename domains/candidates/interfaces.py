@@ -1,8 +1,9 @@
 
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from .entities import Candidate, DocumentRequest, DocumentSubmission
+from .value_objects import CandidateQuery, ReextractionSelection
 
 
 class ICandidateRepository(ABC):
@@ -15,10 +16,43 @@ class ICandidateRepository(ABC):
     def get_by_id(self, candidate_id: int) -> Optional[Candidate]:
         pass
     
+    @abstractmethod
+    def get_by_ids(self, candidate_ids: List[int]) -> List[Candidate]:
+        pass
+    
     @abstractmethod
     def get_all(self) -> List[Candidate]:
         pass
     
+    @abstractmethod
+    def find(self, query: CandidateQuery) -> List[Candidate]:
+        pass
+    
+    @abstractmethod
+    def count(self, query: CandidateQuery) -> int:
+        pass
+    
+    @abstractmethod
+    def export_rows(self, query: CandidateQuery, columns: List[str], chunk_size: int) -> Iterator[Dict[str, Any]]:
+        pass
+    
+    @abstractmethod
+    def bulk_upsert_by_email(self, candidates: List[Candidate]) -> Tuple[int, int]:
+        # Returns (created, updated); every record counts as exactly one of them.
+        pass
+    
+    @abstractmethod
+    def find_duplicate_clusters(
+        self, key_fields: List[str], limit: Optional[int] = None, offset: int = 0,
+    ) -> Tuple[int, List[Tuple[List[str], List[Candidate]]]]:
+        # (total number of clusters, the requested page of clusters), largest first.
+        pass
+    
+    @abstractmethod
+    def find_ids_for_reextraction(self, selection: ReextractionSelection, after_id: int, limit: int) -> List[int]:
+        # Matching ids above ``after_id`` in ascending order, so callers can resume.
+        pass
+    
     @abstractmethod
     def update(self, candidate: Candidate) -> Candidate:
         pass
@@ -30,6 +64,10 @@ class IDocumentRequestRepository(ABC):
     def create(self, request: DocumentRequest) -> DocumentRequest:
         pass
     
+    @abstractmethod
+    def bulk_create(self, requests: List[DocumentRequest]) -> List[DocumentRequest]:
+        pass
+    
     @abstractmethod
     def get_by_candidate_id(self, candidate_id: int) -> List[DocumentRequest]:
         pass
@@ -50,8 +88,32 @@ class IDocumentSubmissionRepository(ABC):
         pass
 
 
+class IResumeTextRepository(ABC):
+    
+    @abstractmethod
+    def save(self, candidate_id: int, text: str, source_name: str = '') -> None:
+        pass
+    
+    @abstractmethod
+    def get(self, candidate_id: int, source_name: Optional[str] = None) -> Optional[str]:
+        # None when nothing is stored, or when ``source_name`` is given and the
+        # text was parsed from a different file.
+        pass
+
+
+class IStatsRepository(ABC):
+    
+    @abstractmethod
+    def get_counts(self) -> Dict[str, int]:
+        pass
+
+
 class IEmailService(ABC):
     
     @abstractmethod
     def send_email(self, to_email: str, subject: str, message: str) -> bool:
-        pass
\ No newline at end of file
+        pass
+    
+    def send_bulk(self, messages: List[Tuple[str, str, str]]) -> int:
+        # messages are (to_email, subject, message); returns how many were accepted
+        return sum(1 for to_email, subject, message in messages if self.send_email(to_email, subject, message))
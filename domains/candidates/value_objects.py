@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
+from datetime import datetime
 
 
 class ExtractionStatus(Enum):
@@ -56,6 +57,8 @@ class ExtractedData:
     skills: List[str]
     confidence: float
     raw_data: Dict[str, Any]
+    # Identifies the extractor (and model/prompt) that produced the data.
+    extractor_version: str = ''
 
     def __post_init__(self):
         """Validate extracted data."""
@@ -78,3 +81,75 @@ class DocumentRequestMessage:
         if not self.message or not self.message.strip():
             raise ValueError("Message cannot be empty")
 
+
+@dataclass(frozen=True)
+class CandidateQuery:
+    """Value object describing a filtered, sorted slice of the candidate list."""
+    extraction_status: Optional[ExtractionStatus] = None
+    company_prefix: str = ''
+    designation_prefix: str = ''
+    min_confidence: Optional[float] = None
+    max_confidence: Optional[float] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    sort: str = '-created_at'
+    limit: Optional[int] = None
+    offset: int = 0
+
+    SORT_KEYS = (
+        'created_at', '-created_at',
+        'name', '-name',
+        'extraction_confidence', '-extraction_confidence',
+    )
+
+    def __post_init__(self):
+        """Validate query."""
+        if self.sort not in self.SORT_KEYS:
+            raise ValueError(f"Sort must be one of {', '.join(self.SORT_KEYS)}")
+
+        if (
+            self.min_confidence is not None
+            and self.max_confidence is not None
+            and self.min_confidence > self.max_confidence
+        ):
+            raise ValueError("min_confidence cannot be greater than max_confidence")
+
+        if self.limit is not None and self.limit < 1:
+            raise ValueError("Limit must be positive")
+
+        if self.offset < 0:
+            raise ValueError("Offset cannot be negative")
+
+
+@dataclass(frozen=True)
+class ReextractionSelection:
+    """Value object describing which candidates to run the extractor on again."""
+    statuses: Tuple[ExtractionStatus, ...] = ()
+    versions: Tuple[str, ...] = ()
+    exclude_version: Optional[str] = None
+    max_confidence: Optional[float] = None
+
+    def __post_init__(self):
+        """Validate selection."""
+        if self.max_confidence is not None and not 0.0 <= self.max_confidence <= 1.0:
+            raise ValueError("max_confidence must be between 0.0 and 1.0")
+
+        if self.exclude_version is not None and self.exclude_version in self.versions:
+            raise ValueError("A version cannot be both selected and excluded")
+
+    def describe(self) -> Dict[str, Any]:
+        """Plain-data form, used to tie checkpoints to the selection they belong to."""
+        return {
+            'statuses': sorted(status.value for status in self.statuses),
+            'versions': sorted(self.versions),
+            'exclude_version': self.exclude_version,
+            'max_confidence': self.max_confidence,
+        }
+
+
+@dataclass(frozen=True)
+class BlockingKeys:
+    """Normalized keys used to find candidates that are the same person."""
+    email_key: str = ''
+    phone_key: str = ''
+    name_key: str = ''
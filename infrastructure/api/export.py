@@ -0,0 +1,51 @@
+"""
+Streaming renderers for candidate exports.
+
+Each renderer turns an iterator of row dicts into an iterator of text chunks
+for ``StreamingHttpResponse``; only one row is held in memory at a time.
+"""
+import csv
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+class _EchoBuffer:
+    """File-like object whose write() returns the value instead of storing it."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return '; '.join(str(item) for item in value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if value is None:
+        return ''
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def render_csv(rows: Iterable[Dict[str, Any]], columns: List[str]) -> Iterator[str]:
+    writer = csv.writer(_EchoBuffer())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow([_csv_value(row.get(column)) for column in columns])
+
+
+def render_ndjson(rows: Iterable[Dict[str, Any]], columns: List[str]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps({column: row.get(column) for column in columns}, default=_json_default) + '\n'
+
+
+EXPORT_RENDERERS = {
+    'csv': (render_csv, 'text/csv; charset=utf-8'),
+    'ndjson': (render_ndjson, 'application/x-ndjson'),
+}
@@ -0,0 +1,183 @@
+"""
+Authenticated serving of uploaded media (resumes and documents).
+
+Files are only handed out to authenticated API users or to requests carrying
+a valid signature; URLs built with ``media_url()`` are signed, so links in API
+responses keep working for the frontend.
+
+``MEDIA_SERVE_MODE`` selects who moves the bytes:
+
+- ``python``: the view answers conditional requests and single byte ranges
+  itself and returns the file through ``FileResponse``, which lets the WSGI
+  server use ``sendfile`` for full-file responses.
+- ``x-accel``: the view only checks access and returns an empty response with
+  ``X-Accel-Redirect`` pointing at an nginx ``internal`` location mapped to
+  ``MEDIA_ROOT`` (``MEDIA_ACCEL_REDIRECT_PREFIX``).
+- ``x-sendfile``: same, using the ``X-Sendfile`` header (Apache, lighttpd).
+
+With the proxy modes, range and conditional handling are left to the proxy.
+"""
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core import signing
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework.permissions import BasePermission
+from rest_framework.views import APIView
+
+
+SIGNATURE_PARAM = 'sig'
+SIGNING_SALT = 'infrastructure.api.media'
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_signer = signing.TimestampSigner(salt=SIGNING_SALT)
+
+
+def sign_media_path(name: str) -> str:
+    """Return the signature token for a storage-relative file name."""
+    return _signer.sign(name)[len(name) + 1:]
+
+
+def has_valid_signature(name: str, token: str) -> bool:
+    try:
+        _signer.unsign(f'{name}:{token}', max_age=settings.MEDIA_SIGNATURE_MAX_AGE)
+    except signing.BadSignature:
+        return False
+    return True
+
+
+def media_url(request, field_file):
+    """Absolute (and signed) URL for a FileField value, or None when empty."""
+    if not field_file:
+        return None
+    url = field_file.url
+    if getattr(settings, 'MEDIA_REQUIRE_AUTH', True):
+        url = f'{url}?{SIGNATURE_PARAM}={quote(sign_media_path(field_file.name))}'
+    return request.build_absolute_uri(url)
+
+
+class CanReadMedia(BasePermission):
+    """Authenticated users, or anyone holding a valid signed URL."""
+
+    def has_permission(self, request, view):
+        if not getattr(settings, 'MEDIA_REQUIRE_AUTH', True):
+            return True
+        if request.user and request.user.is_authenticated:
+            return True
+        token = request.query_params.get(SIGNATURE_PARAM, '')
+        return bool(token) and has_valid_signature(view.kwargs.get('path', ''), token)
+
+
+class MediaFileView(APIView):
+    """Serve a file from MEDIA_ROOT with Range and conditional request support."""
+
+    permission_classes = [CanReadMedia]
+
+    def get(self, request, path):
+        try:
+            full_path = safe_join(settings.MEDIA_ROOT, path)
+        except ValueError:
+            raise Http404
+        if not os.path.isfile(full_path):
+            raise Http404
+
+        stat = os.stat(full_path)
+        content_type, encoding = mimetypes.guess_type(full_path)
+        content_type = content_type or 'application/octet-stream'
+
+        mode = getattr(settings, 'MEDIA_SERVE_MODE', 'python')
+        if mode in ('x-accel', 'x-sendfile'):
+            response = HttpResponse(content_type=content_type)
+            if mode == 'x-accel':
+                response['X-Accel-Redirect'] = settings.MEDIA_ACCEL_REDIRECT_PREFIX + quote(path)
+            else:
+                response['X-Sendfile'] = full_path
+            return self._finish(response, path, stat)
+
+        etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=int(stat.st_mtime),
+        )
+        if not_modified is not None:
+            return self._finish(not_modified, path, stat, etag)
+
+        byte_range = self._requested_range(request, stat.st_size, etag, int(stat.st_mtime))
+        if byte_range == 'unsatisfiable':
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{stat.st_size}'
+            return self._finish(response, path, stat, etag)
+
+        if byte_range is None:
+            response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+        else:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                self._read_range(full_path, start, end),
+                status=206,
+                content_type=content_type,
+            )
+            response['Content-Length'] = str(end - start + 1)
+            response['Content-Range'] = f'bytes {start}-{end}/{stat.st_size}'
+        if encoding:
+            response['Content-Encoding'] = encoding
+        return self._finish(response, path, stat, etag)
+
+    @staticmethod
+    def _requested_range(request, size: int, etag: str, last_modified: int):
+        header = request.META.get('HTTP_RANGE', '')
+        match = RANGE_PATTERN.match(header.strip())
+        # Multi-range and malformed headers may be ignored per RFC 9110.
+        if not match or size == 0:
+            return None
+
+        # A stale If-Range means the client's partial copy is outdated.
+        if_range = request.META.get('HTTP_IF_RANGE')
+        if if_range and if_range != etag and parse_http_date_safe(if_range) != last_modified:
+            return None
+
+        first, last = match.groups()
+        if first == '' and last == '':
+            return None
+        if first == '':
+            length = int(last)
+            if length == 0:
+                return 'unsatisfiable'
+            return max(size - length, 0), size - 1
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start >= size or start > end:
+            return 'unsatisfiable'
+        return start, end
+
+    @staticmethod
+    def _read_range(full_path: str, start: int, end: int):
+        with open(full_path, 'rb') as handle:
+            handle.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = handle.read(min(STREAM_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    @staticmethod
+    def _finish(response, path: str, stat, etag: str = None):
+        response['Accept-Ranges'] = 'bytes'
+        response['Last-Modified'] = http_date(stat.st_mtime)
+        if etag:
+            response['ETag'] = etag
+        # Content-addressed names never change content, so they can be cached for good.
+        if getattr(default_storage, 'is_content_addressed', lambda name: False)(path):
+            patch_cache_control(response, private=True, max_age=31536000, immutable=True)
+        else:
+            patch_cache_control(response, private=True, max_age=settings.MEDIA_CACHE_MAX_AGE)
+        return response
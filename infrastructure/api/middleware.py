@@ -0,0 +1,113 @@
+"""
+Middleware for the API layer.
+"""
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryRecorder:
+    """Collects timing for every SQL statement executed while installed."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            self.queries.append((context['connection'].alias, sql, duration_ms))
+
+    @property
+    def total_time_ms(self) -> float:
+        return sum(duration for _, _, duration in self.queries)
+
+    def slowest(self, limit: int):
+        return sorted(self.queries, key=lambda q: q[2], reverse=True)[:limit]
+
+    def repeated_templates(self, threshold: int):
+        # Statements reach the wrapper with params still as placeholders, so the
+        # SQL text already is the template; only inlined literals need folding.
+        templates = Counter(_sql_template(sql) for _, sql, _ in self.queries)
+        return {sql: count for sql, count in templates.items() if count > threshold}
+
+
+def _sql_template(sql: str) -> str:
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    sql = re.sub(r'\b\d+\b', '?', sql)
+    sql = re.sub(r'\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)', '(...)', sql)
+    return sql
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Record query count, total SQL time and the slowest statements per request.
+
+    Results are emitted as a ``Server-Timing`` header and a structured log line.
+    Requests where the same SQL template runs more than
+    ``QUERY_INSTRUMENTATION_NPLUSONE_THRESHOLD`` times are flagged as likely
+    N+1 patterns and logged at WARNING level.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'QUERY_INSTRUMENTATION_ENABLED', True)
+        self.slow_query_ms = getattr(settings, 'QUERY_INSTRUMENTATION_SLOW_QUERY_MS', 100)
+        self.slowest_count = getattr(settings, 'QUERY_INSTRUMENTATION_SLOWEST_COUNT', 3)
+        self.nplusone_threshold = getattr(settings, 'QUERY_INSTRUMENTATION_NPLUSONE_THRESHOLD', 5)
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+
+        self._report(request, response, recorder)
+        return response
+
+    def _report(self, request, response, recorder: QueryRecorder) -> None:
+        query_count = len(recorder.queries)
+        total_ms = recorder.total_time_ms
+        slowest = recorder.slowest(self.slowest_count)
+        repeated = recorder.repeated_templates(self.nplusone_threshold)
+
+        timings = [f'db;dur={total_ms:.2f};desc="{query_count} queries"']
+        if slowest:
+            timings.append(f'db-slowest;dur={slowest[0][2]:.2f}')
+        existing = response.get('Server-Timing')
+        response['Server-Timing'] = ', '.join(([existing] if existing else []) + timings)
+
+        log_data = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'query_count': query_count,
+            'sql_time_ms': round(total_ms, 2),
+            'slowest': [
+                {'alias': alias, 'sql': sql, 'duration_ms': round(duration, 2)}
+                for alias, sql, duration in slowest
+                if duration >= self.slow_query_ms
+            ],
+        }
+        if repeated:
+            log_data['nplusone'] = [
+                {'sql': sql, 'count': count} for sql, count in repeated.items()
+            ]
+            logger.warning('sql_instrumentation %s', json.dumps(log_data), extra={'sql_stats': log_data})
+        else:
+            logger.info('sql_instrumentation %s', json.dumps(log_data), extra={'sql_stats': log_data})
@@ -0,0 +1,124 @@
+"""
+On-demand request profiling for API views.
+
+A request is profiled only when profiling is enabled in settings and the
+request carries the configured token in the ``X-Profile`` header or the
+``profile`` query parameter. Artifacts are written to ``PROFILING_OUTPUT_DIR``:
+
+- ``cprofile`` mode writes a ``.prof`` file (open with snakeviz, or convert
+  with flameprof / gprof2dot).
+- ``sampling`` mode writes a ``.folded`` collapsed-stack file that can be fed
+  straight into flamegraph.pl or speedscope.
+"""
+import cProfile
+import hmac
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+PROFILE_QUERY_PARAM = 'profile'
+
+
+class SamplingProfiler:
+    """Samples the stack of one thread at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})')
+                frame = frame.f_back
+            self.samples[';'.join(reversed(stack))] += 1
+
+    def write(self, path: Path) -> None:
+        with open(path, 'w') as output:
+            for stack, count in self.samples.most_common():
+                output.write(f'{stack} {count}\n')
+
+
+def _profiling_requested(request) -> bool:
+    token = getattr(settings, 'PROFILING_TOKEN', '')
+    if not token:
+        return False
+    supplied = request.META.get(PROFILE_HEADER) or request.GET.get(PROFILE_QUERY_PARAM, '')
+    # compare_digest() rejects str with non-ASCII characters, so compare bytes.
+    return bool(supplied) and hmac.compare_digest(supplied.encode(), token.encode())
+
+
+def _artifact_path(view, request, suffix: str) -> Path:
+    output_dir = Path(getattr(settings, 'PROFILING_OUTPUT_DIR'))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    action = getattr(view, 'action', None) or request.method.lower()
+    timestamp = datetime.now().strftime('%Y%m%dT%H%M%S%f')
+    return output_dir / f'{timestamp}-{view.__class__.__name__}-{action}-{os.getpid()}{suffix}'
+
+
+class ProfilingMixin:
+    """
+    View mixin that runs a single request under a profiler when asked to.
+
+    When ``PROFILING_ENABLED`` is off the only cost is one attribute lookup
+    per request.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if not getattr(settings, 'PROFILING_ENABLED', False) or not _profiling_requested(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        mode = getattr(settings, 'PROFILING_MODE', 'cprofile')
+        started = time.perf_counter()
+
+        if mode == 'sampling':
+            profiler = SamplingProfiler(
+                threading.get_ident(),
+                getattr(settings, 'PROFILING_SAMPLE_INTERVAL', 0.005),
+            )
+            profiler.start()
+            try:
+                response = super().dispatch(request, *args, **kwargs)
+            finally:
+                profiler.stop()
+            artifact = _artifact_path(self, request, '.folded')
+            profiler.write(artifact)
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                response = super().dispatch(request, *args, **kwargs)
+            finally:
+                profiler.disable()
+            artifact = _artifact_path(self, request, '.prof')
+            profiler.dump_stats(artifact)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        response['X-Profile-Artifact'] = artifact.name
+        existing = response.get('Server-Timing')
+        timing = f'profile;dur={elapsed_ms:.2f};desc="{mode}"'
+        response['Server-Timing'] = f'{existing}, {timing}' if existing else timing
+        return response
@@ -12,10 +12,34 @@ class CandidateListSerializer(serializers.Serializer):
     created_at = serializers.DateTimeField()
 
 
+class CandidateListQuerySerializer(serializers.Serializer):
+    extraction_status = serializers.ChoiceField(
+        choices=['pending', 'processing', 'completed', 'failed'], required=False,
+    )
+    company = serializers.CharField(required=False, max_length=255)
+    designation = serializers.CharField(required=False, max_length=255)
+    min_confidence = serializers.FloatField(required=False, min_value=0.0, max_value=1.0)
+    max_confidence = serializers.FloatField(required=False, min_value=0.0, max_value=1.0)
+    created_after = serializers.DateTimeField(required=False)
+    created_before = serializers.DateTimeField(required=False)
+    ordering = serializers.ChoiceField(
+        choices=[
+            'created_at', '-created_at',
+            'name', '-name',
+            'extraction_confidence', '-extraction_confidence',
+        ],
+        default='-created_at',
+    )
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=500)
+    offset = serializers.IntegerField(required=False, min_value=0, default=0)
+
+
 class DocumentSubmissionSerializer(serializers.Serializer):
     id = serializers.IntegerField(required=False, allow_null=True)
     document_type = serializers.CharField()
     document_file_url = serializers.URLField(required=False, allow_null=True)
+    thumbnail_url = serializers.URLField(required=False, allow_null=True)
+    preview_url = serializers.URLField(required=False, allow_null=True)
     verification_status = serializers.CharField()
     uploaded_at = serializers.DateTimeField(required=False, allow_null=True)
 
@@ -41,6 +65,8 @@ class CandidateDetailSerializer(serializers.Serializer):
     extraction_status = serializers.CharField()
     extraction_confidence = serializers.FloatField(required=False, allow_null=True)
     raw_extracted_data = serializers.DictField()
+    extraction_provisional = serializers.BooleanField(required=False)
+    extractor_version = serializers.CharField(required=False)
     document_requests = DocumentRequestSerializer(many=True)
     document_submissions = DocumentSubmissionSerializer(many=True)
     created_at = serializers.DateTimeField(required=False, allow_null=True)
@@ -59,9 +85,66 @@ class CandidateUploadSerializer(serializers.Serializer):
 class RequestDocumentsSerializer(serializers.Serializer):
     request_type = serializers.CharField(default='both')
     communication_channel = serializers.CharField(default='email')
+    use_ai = serializers.BooleanField(required=False, allow_null=True, default=None)
+
+
+class BulkRequestDocumentsSerializer(serializers.Serializer):
+    candidate_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+    )
+    request_type = serializers.ChoiceField(choices=['pan', 'aadhaar', 'both'], default='both')
+    communication_channel = serializers.ChoiceField(choices=['email', 'phone', 'both'], default='email')
+    use_ai = serializers.BooleanField(required=False, allow_null=True, default=None)
+
+
+class BulkDocumentRequestResultSerializer(serializers.Serializer):
+    candidate_id = serializers.IntegerField()
+    status = serializers.CharField()
+    document_request = DocumentRequestSerializer(required=False, allow_null=True)
+    error = serializers.CharField(required=False, allow_null=True)
 
 
 class SubmitDocumentSerializer(serializers.Serializer):
     document_type = serializers.CharField()
     document_file = serializers.FileField()
 
+
+class DashboardStatsSerializer(serializers.Serializer):
+    candidates_total = serializers.IntegerField()
+    candidates_by_status = serializers.DictField(child=serializers.IntegerField())
+    document_requests_total = serializers.IntegerField()
+    pending_document_requests = serializers.IntegerField()
+    document_submissions_total = serializers.IntegerField()
+    pending_verifications = serializers.IntegerField()
+
+
+class DuplicateClusterQuerySerializer(serializers.Serializer):
+    # Clusters are paged like the candidate list, but always: there can be
+    # as many clusters as candidates.
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=500, default=50)
+    offset = serializers.IntegerField(required=False, min_value=0, default=0)
+
+
+class DuplicateClusterSerializer(serializers.Serializer):
+    matched_on = serializers.ListField(child=serializers.CharField())
+    candidates = CandidateListSerializer(many=True)
+
+
+class ImportCandidatesSerializer(serializers.Serializer):
+    import_file = serializers.FileField()
+    file_format = serializers.ChoiceField(choices=['csv', 'ndjson'], required=False)
+
+
+class ImportErrorSerializer(serializers.Serializer):
+    line = serializers.IntegerField()
+    error = serializers.CharField()
+
+
+class ImportCandidatesResultSerializer(serializers.Serializer):
+    processed = serializers.IntegerField()
+    created = serializers.IntegerField()
+    updated = serializers.IntegerField()
+    failed = serializers.IntegerField()
+    errors = ImportErrorSerializer(many=True)
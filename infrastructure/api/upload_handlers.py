@@ -0,0 +1,139 @@
+"""
+Upload handler that streams every file to disk while validating it.
+
+Each chunk is written to a temporary file, fed to a SHA-256 hasher and counted
+as it arrives, so memory per upload stays constant. The first chunk is sniffed
+for magic bytes; files of the wrong type or over the size limit are dropped
+as soon as that is known instead of after the whole body has been buffered.
+Rejections are recorded on the request and reported by the views.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.files.uploadhandler import (
+    SkipFile,
+    TemporaryFileUploadHandler,
+)
+from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
+
+
+MAGIC_SIGNATURES = {
+    'pdf': lambda head: b'%PDF-' in head[:1024],
+    'docx': lambda head: head.startswith(b'PK\x03\x04'),
+    'jpeg': lambda head: head.startswith(b'\xff\xd8\xff'),
+    'png': lambda head: head.startswith(b'\x89PNG\r\n\x1a\n'),
+    'webp': lambda head: head[:4] == b'RIFF' and head[8:12] == b'WEBP',
+}
+
+UPLOAD_ERRORS_ATTR = '_upload_errors'
+
+# Room left for multipart boundaries and the non-file form fields.
+FORM_OVERHEAD_BYTES = 1024 * 1024
+
+
+def sniff_type(head: bytes):
+    """Return the detected file kind for the leading bytes, or None."""
+    for kind, matches in MAGIC_SIGNATURES.items():
+        if matches(head):
+            return kind
+    return None
+
+
+def get_upload_errors(request) -> dict:
+    """Field name -> [message] for files rejected while streaming."""
+    request = getattr(request, '_request', request)
+    return getattr(request, UPLOAD_ERRORS_ATTR, {})
+
+
+class StreamingHashUploadHandler(TemporaryFileUploadHandler):
+    """Stream uploads to a temp file, hashing, size-checking and sniffing on the fly."""
+
+    def __init__(self, request=None, allowed_fields=None):
+        super().__init__(request)
+        self.rules = getattr(settings, 'UPLOAD_FIELD_RULES', {})
+        self.default_max_size = getattr(settings, 'UPLOAD_MAX_FILE_SIZE', 10 * 1024 * 1024)
+        # None accepts any file field; views narrow it with UploadFieldsMixin.
+        self.allowed_fields = allowed_fields
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # A body larger than the biggest file this view accepts (plus room for
+        # the other form fields) can be refused before a single byte is read.
+        largest = max(
+            [self.default_max_size]
+            + [self._rule(field).get('max_size', self.default_max_size) for field in self.allowed_fields or ()]
+        )
+        if content_length and content_length > largest + FORM_OVERHEAD_BYTES:
+            self._reject('non_field_errors', f'Request body exceeds {largest} bytes.')
+            # An empty parse result skips reading the body; the view sees the
+            # recorded error and answers 400.
+            return QueryDict(encoding=encoding), MultiValueDict()
+        return None
+
+    def new_file(self, field_name, *args, **kwargs):
+        if self.allowed_fields is not None and field_name not in self.allowed_fields:
+            self._reject(field_name, 'Unexpected file field.')
+            raise SkipFile()
+        super().new_file(field_name, *args, **kwargs)
+        rule = self._rule(field_name)
+        self.max_size = rule.get('max_size', self.default_max_size)
+        self.allowed_types = rule.get('types')
+        self.hasher = hashlib.sha256()
+        self.received = 0
+        self.sniffed_type = None
+
+    def receive_data_chunk(self, raw_data, start):
+        if start == 0:
+            self.sniffed_type = sniff_type(raw_data)
+            if self.allowed_types is not None and self.sniffed_type not in self.allowed_types:
+                self._reject(self.field_name, f"Unsupported file content; expected {', '.join(self.allowed_types)}.")
+                self._discard()
+                raise SkipFile()
+
+        self.received += len(raw_data)
+        if self.received > self.max_size:
+            self._reject(self.field_name, f'File size cannot exceed {self.max_size // (1024 * 1024)}MB.')
+            self._discard()
+            raise SkipFile()
+
+        self.hasher.update(raw_data)
+        self.file.write(raw_data)
+        return None
+
+    def file_complete(self, file_size):
+        uploaded = super().file_complete(file_size)
+        uploaded.content_hash = self.hasher.hexdigest()
+        uploaded.sniffed_type = self.sniffed_type
+        return uploaded
+
+    def _rule(self, field_name: str) -> dict:
+        return self.rules.get(field_name, {})
+
+    def _discard(self) -> None:
+        self.file.close()
+
+    def _reject(self, field_name: str, message: str) -> None:
+        if self.request is None:
+            return
+        errors = getattr(self.request, UPLOAD_ERRORS_ATTR, None)
+        if errors is None:
+            errors = {}
+            setattr(self.request, UPLOAD_ERRORS_ATTR, errors)
+        errors.setdefault(field_name, []).append(message)
+
+
+class UploadFieldsMixin:
+    """
+    Accept uploads only in the file fields a view names in ``upload_fields``.
+
+    The per-field size limits then also bound the whole request body, so a
+    view taking small files is not held to the limit of the largest upload
+    anywhere in the app. ViewSet actions set it with
+    ``@action(..., upload_fields=['field'])``.
+    """
+
+    upload_fields = ()
+
+    def initialize_request(self, request, *args, **kwargs):
+        request.upload_handlers = [StreamingHashUploadHandler(request, allowed_fields=self.upload_fields)]
+        return super().initialize_request(request, *args, **kwargs)
@@ -1,3 +1,6 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -9,11 +12,17 @@ from applications.candidates.use_cases import (
     GetCandidatesUseCase,
     GetCandidateDetailUseCase,
     RequestDocumentsUseCase,
+    BulkRequestDocumentsUseCase,
     SubmitDocumentUseCase,
+    GetDashboardStatsUseCase,
+    FindDuplicateCandidatesUseCase,
+    ExportCandidatesUseCase,
+    ImportCandidatesUseCase,
 )
 from applications.candidates.dto import (
     UploadResumeRequest,
     RequestDocumentsRequest,
+    BulkRequestDocumentsRequest,
     SubmitDocumentRequest,
 )
 from domains.candidates.exceptions import (
@@ -21,36 +30,50 @@ from domains.candidates.exceptions import (
     InvalidResumeFileError,
     ExtractionFailedError,
 )
+from domains.candidates.value_objects import CandidateQuery, ExtractionStatus
 from infrastructure.persistence.repositories import (
     CandidateRepository,
     DocumentRequestRepository,
     DocumentSubmissionRepository,
+    ResumeTextRepository,
+    StatsRepository,
 )
 from infrastructure.external.file_parsers import ResumeTextExtractorFactory
+from infrastructure.external.candidate_import import detect_format, iter_candidate_records
 from infrastructure.external.ai_services import (
+    BasicResumeDataExtractor,
     OpenRouterResumeDataExtractor,
     OpenRouterDocumentRequestGenerator,
 )
-from infrastructure.external.email_services import EmailService
+from infrastructure.external.email_services import OutboxEmailService
+from infrastructure.external.document_previews import PillowDocumentPreviewGenerator
+from infrastructure.external.image_normalization import PillowDocumentFileNormalizer
+from infrastructure.external.llm_governor import get_llm_governor
 
 
 from .serializers import (
     CandidateListSerializer,
+    DashboardStatsSerializer,
+    DuplicateClusterQuerySerializer,
+    DuplicateClusterSerializer,
+    ImportCandidatesSerializer,
+    ImportCandidatesResultSerializer,
+    CandidateListQuerySerializer,
     CandidateUploadSerializer,
     DocumentRequestSerializer,
     DocumentSubmissionSerializer,
     RequestDocumentsSerializer,
+    BulkRequestDocumentsSerializer,
+    BulkDocumentRequestResultSerializer,
     SubmitDocumentSerializer,
 )
+from .export import EXPORT_RENDERERS
+from .media import media_url
+from .profiling import ProfilingMixin
+from .upload_handlers import UploadFieldsMixin, get_upload_errors
 
 
-from domains.candidates.entities import DocumentRequest
-from domains.candidates.value_objects import RequestStatus
-
-
-
-
-class CandidateViewSet(viewsets.ViewSet):
+class CandidateViewSet(ProfilingMixin, UploadFieldsMixin, viewsets.ViewSet):
     
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     
@@ -65,10 +88,13 @@ class CandidateViewSet(viewsets.ViewSet):
             data_extractor=data_extractor,
         )
     
-    @action(detail=False, methods=['post'], url_path='upload')
+    @action(detail=False, methods=['post'], url_path='upload', upload_fields=['resume_file'])
     def upload(self, request):
         
         serializer = CandidateUploadSerializer(data=request.data)
+        upload_errors = get_upload_errors(request)
+        if upload_errors:
+            return Response(upload_errors, status=status.HTTP_400_BAD_REQUEST)
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         
@@ -85,6 +111,10 @@ class CandidateViewSet(viewsets.ViewSet):
                 candidate_repository=candidate_repo,
                 text_extractor=text_extractor,
                 data_extractor=data_extractor,
+                fallback_extractor=BasicResumeDataExtractor(),
+                deadline_ms=settings.RESUME_EXTRACTION_DEADLINE_MS,
+                provisional_confidence_factor=settings.RESUME_PROVISIONAL_CONFIDENCE_FACTOR,
+                resume_text_repository=ResumeTextRepository(),
             )
             
             # Execute use case
@@ -106,15 +136,126 @@ class CandidateViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
     
+    @action(detail=False, methods=['get'], url_path='stats')
+    def stats(self, request):
+        """Dashboard counts from the incrementally maintained counters table."""
+        use_case = GetDashboardStatsUseCase(stats_repository=StatsRepository())
+        serializer = DashboardStatsSerializer(use_case.execute())
+        return Response(serializer.data)
+    
+    @action(detail=False, methods=['get'], url_path='duplicates')
+    def duplicates(self, request):
+        """Clusters of candidates sharing a normalized email or phone (optionally name), paged by limit/offset."""
+        
+        # ?keys=email,phone (default); 'name' is opt-in since common names collide.
+        keys = [key for key in request.query_params.get('keys', 'email,phone').split(',') if key]
+        unknown = sorted(set(keys) - set(FindDuplicateCandidatesUseCase.KEY_FIELDS))
+        if not keys or unknown:
+            return Response(
+                {'keys': [f"Choose from email, phone, name; got {', '.join(unknown) or 'nothing'}."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        
+        query_serializer = DuplicateClusterQuerySerializer(data=request.query_params)
+        if not query_serializer.is_valid():
+            return Response(query_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        params = query_serializer.validated_data
+        
+        use_case = FindDuplicateCandidatesUseCase(candidate_repository=CandidateRepository())
+        page = use_case.execute(keys, limit=params['limit'], offset=params['offset'])
+        response = Response({
+            'count': page.count,
+            'clusters': DuplicateClusterSerializer(page.clusters, many=True).data,
+        })
+        response['X-Total-Count'] = str(page.count)
+        return response
+    
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """Stream matching candidates as CSV or NDJSON (?output=csv|ndjson&columns=...)."""
+        
+        query, errors = self._candidate_query(request)
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        output = request.query_params.get('output', 'csv')
+        if output not in EXPORT_RENDERERS:
+            return Response(
+                {'output': [f"Choose from {', '.join(EXPORT_RENDERERS)}."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        
+        use_case = ExportCandidatesUseCase(
+            candidate_repository=CandidateRepository(),
+            chunk_size=settings.CANDIDATE_EXPORT_CHUNK_SIZE,
+        )
+        columns = [c for c in request.query_params.get('columns', '').split(',') if c] or use_case.COLUMNS
+        try:
+            rows = use_case.execute(query, columns)
+        except ValueError as e:
+            return Response({'columns': [str(e)]}, status=status.HTTP_400_BAD_REQUEST)
+        
+        render, content_type = EXPORT_RENDERERS[output]
+        response = StreamingHttpResponse(render(rows, columns), content_type=content_type)
+        filename = f"candidates-{timezone.now():%Y%m%d-%H%M%S}.{output}"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+    
+    @action(detail=False, methods=['post'], url_path='import', upload_fields=['import_file'])
+    def import_candidates(self, request):
+        """Bulk-load pre-extracted candidates from an uploaded CSV or NDJSON file."""
+        
+        serializer = ImportCandidatesSerializer(data=request.data)
+        upload_errors = get_upload_errors(request)
+        if upload_errors:
+            return Response(upload_errors, status=status.HTTP_400_BAD_REQUEST)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            import_file = serializer.validated_data['import_file']
+            import_file.seek(0)
+            head = import_file.read(64)
+            import_file.seek(0)
+            file_format = serializer.validated_data.get('file_format') or detect_format(import_file.name, head)
+            
+            use_case = ImportCandidatesUseCase(
+                candidate_repository=CandidateRepository(),
+                batch_size=settings.CANDIDATE_IMPORT_BATCH_SIZE,
+            )
+            result = use_case.execute(iter_candidate_records(import_file, file_format))
+            return Response(
+                ImportCandidatesResultSerializer(result).data,
+                status=status.HTTP_201_CREATED if result.created else status.HTTP_200_OK,
+            )
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+    
+    @action(detail=False, methods=['get'], url_path='llm-metrics')
+    def llm_metrics(self, request):
+        """Expose the LLM governor's limiter and circuit-breaker state."""
+        return Response(get_llm_governor().snapshot())
+    
     def list(self, request):
+        query, errors = self._candidate_query(request)
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        
         try:
             use_case = GetCandidatesUseCase(
                 candidate_repository=CandidateRepository(),
             )
-            candidates = use_case.execute()
+            candidates = use_case.execute(query)
             
             serializer = CandidateListSerializer(candidates, many=True)
-            return Response(serializer.data)
+            response = Response(serializer.data)
+            # The body stays a plain list; the total lets the frontend page through it.
+            if query.limit is not None:
+                response['X-Total-Count'] = str(use_case.count(query))
+            return response
         except Exception as e:
             return Response(
                 {'error': str(e)},
@@ -164,32 +305,17 @@ class CandidateViewSet(viewsets.ViewSet):
                 candidate_repository=CandidateRepository(),
                 request_repository=DocumentRequestRepository(),
                 message_generator=OpenRouterDocumentRequestGenerator(),
-                email_service=EmailService(),
+                email_service=OutboxEmailService(),
             )
             
             request_dto = RequestDocumentsRequest(
                 request_type=serializer.validated_data['request_type'],
                 communication_channel=serializer.validated_data['communication_channel'],
+                use_ai=serializer.validated_data.get('use_ai'),
             )
             
             doc_request_dto = use_case.execute(int(pk), request_dto)
             
-
-            if doc_request_dto.id:
-                repo = DocumentRequestRepository()
-                # Get the entity and update it
-                
-                req_entity = DocumentRequest(
-                    id=doc_request_dto.id,
-                    candidate_id=int(pk),
-                    request_type=doc_request_dto.request_type,
-                    request_message=doc_request_dto.request_message,
-                    communication_channel=doc_request_dto.communication_channel,
-                    status=RequestStatus.SENT,
-                )
-                updated = repo.update(req_entity)
-                doc_request_dto.status = updated.status.value
-            
             serializer = DocumentRequestSerializer(doc_request_dto)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
             
@@ -204,12 +330,55 @@ class CandidateViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
     
-    @action(detail=True, methods=['post'], url_path='submit-documents')
+    @action(detail=False, methods=['post'], url_path='bulk-request-documents')
+    def bulk_request_documents(self, request):
+        """Generate and log document requests for many candidates in one call."""
+        
+        serializer = BulkRequestDocumentsSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            use_case = BulkRequestDocumentsUseCase(
+                candidate_repository=CandidateRepository(),
+                request_repository=DocumentRequestRepository(),
+                message_generator=OpenRouterDocumentRequestGenerator(),
+                email_service=OutboxEmailService(),
+                max_workers=settings.BULK_REQUEST_DOCUMENTS_WORKERS,
+            )
+            
+            results = use_case.execute(BulkRequestDocumentsRequest(
+                candidate_ids=serializer.validated_data['candidate_ids'],
+                request_type=serializer.validated_data['request_type'],
+                communication_channel=serializer.validated_data['communication_channel'],
+                use_ai=serializer.validated_data.get('use_ai'),
+            ))
+            
+            created = sum(1 for r in results if r.status == 'created')
+            return Response(
+                {
+                    'created': created,
+                    'not_found': sum(1 for r in results if r.status == 'not_found'),
+                    'failed': sum(1 for r in results if r.status == 'failed'),
+                    'results': BulkDocumentRequestResultSerializer(results, many=True).data,
+                },
+                status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+            )
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+    
+    @action(detail=True, methods=['post'], url_path='submit-documents', upload_fields=['document_file'])
     def submit_documents(self, request, pk=None):
         """Handle document submission."""
         
         
         serializer = SubmitDocumentSerializer(data=request.data)
+        upload_errors = get_upload_errors(request)
+        if upload_errors:
+            return Response(upload_errors, status=status.HTTP_400_BAD_REQUEST)
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         
@@ -223,6 +392,8 @@ class CandidateViewSet(viewsets.ViewSet):
             use_case = SubmitDocumentUseCase(
                 candidate_repository=CandidateRepository(),
                 submission_repository=DocumentSubmissionRepository(),
+                preview_generator=PillowDocumentPreviewGenerator(),
+                file_normalizer=PillowDocumentFileNormalizer(),
             )
             
             submit_request = SubmitDocumentRequest(
@@ -245,6 +416,34 @@ class CandidateViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
     
+    def _candidate_query(self, request):
+        """Build a CandidateQuery from list/export query params; returns (query, errors)."""
+        
+        query_serializer = CandidateListQuerySerializer(data=request.query_params)
+        if not query_serializer.is_valid():
+            return None, query_serializer.errors
+        params = query_serializer.validated_data
+        
+        try:
+            query = CandidateQuery(
+                extraction_status=(
+                    ExtractionStatus(params['extraction_status'])
+                    if params.get('extraction_status') else None
+                ),
+                company_prefix=params.get('company', ''),
+                designation_prefix=params.get('designation', ''),
+                min_confidence=params.get('min_confidence'),
+                max_confidence=params.get('max_confidence'),
+                created_after=params.get('created_after'),
+                created_before=params.get('created_before'),
+                sort=params['ordering'],
+                limit=params.get('limit'),
+                offset=params['offset'],
+            )
+        except ValueError as e:
+            return None, {'error': str(e)}
+        return query, None
+    
     def _candidate_dto_to_dict(self, dto, request):
         """Convert candidate DTO to dict for response."""
         
@@ -255,8 +454,7 @@ class CandidateViewSet(viewsets.ViewSet):
             from infrastructure.persistence.models import CandidateModel
             try:
                 model = CandidateModel.objects.get(pk=dto.id)
-                if model.resume_file:
-                    resume_file_url = request.build_absolute_uri(model.resume_file.url)
+                resume_file_url = media_url(request, model.resume_file)
             except CandidateModel.DoesNotExist:
                 pass
             
@@ -274,6 +472,8 @@ class CandidateViewSet(viewsets.ViewSet):
             'extraction_status': dto.extraction_status,
             'extraction_confidence': dto.extraction_confidence,
             'raw_extracted_data': dto.raw_extracted_data,
+            'extraction_provisional': dto.extraction_provisional,
+            'extractor_version': dto.extractor_version,
             'created_at': dto.created_at,
             'updated_at': dto.updated_at,
         }
@@ -294,23 +494,21 @@ class CandidateViewSet(viewsets.ViewSet):
             }
             for r in dto.document_requests
         ]
-        # Get file URLs for submissions
+        # Get file and derivative URLs for all submissions in one query
         from infrastructure.persistence.models import DocumentSubmissionModel
+        submission_models = DocumentSubmissionModel.objects.only(
+            'id', 'document_file', 'thumbnail', 'preview',
+        ).in_bulk([s.id for s in dto.document_submissions if s.id])
+
         submissions_list = []
         for s in dto.document_submissions:
-            doc_file_url = s.document_file_url
-            if s.id and not doc_file_url:
-                try:
-                    sub_model = DocumentSubmissionModel.objects.get(pk=s.id)
-                    if sub_model.document_file:
-                        doc_file_url = request.build_absolute_uri(sub_model.document_file.url)
-                except DocumentSubmissionModel.DoesNotExist:
-                    pass
-            
+            sub_model = submission_models.get(s.id)
             submissions_list.append({
                 'id': s.id,
                 'document_type': s.document_type,
-                'document_file': doc_file_url,
+                'document_file': s.document_file_url or (media_url(request, sub_model.document_file) if sub_model else None),
+                'thumbnail': s.thumbnail_url or (media_url(request, sub_model.thumbnail) if sub_model else None),
+                'preview': s.preview_url or (media_url(request, sub_model.preview) if sub_model else None),
                 'verification_status': s.verification_status,
                 'uploaded_at': s.uploaded_at,
             })
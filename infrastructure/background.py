@@ -0,0 +1,45 @@
+"""
+Shared thread pool for work that runs off the request path.
+"""
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from decouple import config
+from django.db import close_old_connections
+
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=config('BACKGROUND_WORKERS', default=4, cast=int),
+                    thread_name_prefix='background',
+                )
+    return _executor
+
+
+def _run(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    # Worker threads outlive requests, so they must manage their own DB connections.
+    close_old_connections()
+    try:
+        return fn(*args, **kwargs)
+    except Exception:
+        logger.exception('Background task %s failed', getattr(fn, '__qualname__', fn))
+        raise
+    finally:
+        close_old_connections()
+
+
+def run_in_background(fn: Callable[..., Any], *args, **kwargs) -> Future:
+    """Run ``fn(*args, **kwargs)`` on the shared pool and return its future."""
+    return _get_executor().submit(_run, fn, *args, **kwargs)
@@ -1,29 +1,112 @@
 import os
 import re
 import json
+import logging
+import random
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from openai import OpenAI
 from decouple import config
+from django.core.cache import cache
 
 
 from domains.candidates.domain_services import (
     ResumeDataExtractor,
     DocumentRequestGenerator,
 )
-from domains.candidates.value_objects import ExtractedData
+from domains.candidates.value_objects import ExtractedData, RequestType, CommunicationChannel
 from domains.candidates.domain_services import ExtractionConfidenceCalculator
 
+from .text_reduction import ResumeTextReducer
+from .llm_governor import get_llm_governor
+from infrastructure.background import run_in_background
+
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _create_client():
+    # One client (and HTTP connection pool) per process. Retries are handled
+    # by the shared governor, so the SDK's own are disabled.
+    api_key = config('OPENROUTER_API_KEY', '')
+    base_url = config('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')
+    if not api_key:
+        return None
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        timeout=config('OPENROUTER_TIMEOUT', default=30.0, cast=float),
+        max_retries=0,
+    )
+
+
+class BasicResumeDataExtractor(ResumeDataExtractor):
+    """Regex-based extraction that needs no network access."""
+    
+    version = 'basic:1'
+    
+    def __init__(self):
+        self.confidence_calculator = ExtractionConfidenceCalculator()
+    
+    def extract(self, text: str) -> ExtractedData:
+        """Basic regex-based extraction."""
+        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        phone_pattern = r'[\+]?[(]?[0-9]{3}[)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4,6}'
+        
+        emails = re.findall(email_pattern, text)
+        phones = re.findall(phone_pattern, text)
+        
+        # Try to extract name from first line
+        lines = text.split('\n')
+        name = lines[0].strip() if lines else ''
+        
+        extracted_dict = {
+            'name': name[:255] if name else '',
+            'email': emails[0] if emails else '',
+            'phone': phones[0] if phones else '',
+            'company': '',
+            'designation': '',
+            'skills': [],
+        }
+        
+        confidence = self.confidence_calculator.calculate(extracted_dict)
+        
+        return ExtractedData(
+            
+            name=extracted_dict['name'],
+            email=extracted_dict['email'],
+            
+            phone=extracted_dict['phone'],
+            company=extracted_dict['company'],
+            
+            designation=extracted_dict['designation'],
+            skills=extracted_dict['skills'],
+            
+            confidence=confidence,
+            raw_data=extracted_dict,
+            extractor_version=self.version,
+        )
+
 
 class OpenRouterResumeDataExtractor(ResumeDataExtractor):
     """Extract structured data from resume text using OpenRouter."""
     
     def __init__(self):
-        api_key = config('OPENROUTER_API_KEY', '')
-        base_url = config('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')
-        if api_key:
-            self.client = OpenAI(api_key=api_key, base_url=base_url)
-        else:
-            self.client = None
+        self.client = _create_client()
+        self.governor = get_llm_governor()
         self.confidence_calculator = ExtractionConfidenceCalculator()
+        self.basic_extractor = BasicResumeDataExtractor()
+        self.text_reducer = ResumeTextReducer(
+            token_budget=config('RESUME_PROMPT_TOKEN_BUDGET', default=1000, cast=int),
+        )
+    
+    @property
+    def version(self) -> str:
+        """Model plus prompt revision; bump RESUME_EXTRACTION_PROMPT_VERSION when the prompt changes."""
+        model = config('OPENROUTER_MODEL', 'openai/gpt-3.5-turbo')
+        return f"openrouter:{model}:{config('RESUME_EXTRACTION_PROMPT_VERSION', default='1')}"
     
     def extract(self, resume_text: str) -> ExtractedData:
         """Extract structured data from resume text."""
@@ -33,6 +116,9 @@ class OpenRouterResumeDataExtractor(ResumeDataExtractor):
         try:
             model = config('OPENROUTER_MODEL', 'openai/gpt-3.5-turbo')
             
+            # Sectioned, whitespace-normalized text within the prompt token budget
+            reduced_text = self.text_reducer.reduce(resume_text)
+            
             prompt = f"""Extract the following information from this resume text and return it as a JSON object:
 - name: Full name of the candidate
 - email: Email address
@@ -41,15 +127,16 @@ class OpenRouterResumeDataExtractor(ResumeDataExtractor):
 - designation: Current or most recent job title
 - skills: List of technical skills and competencies
 
-Resume text:
-{resume_text[:3000]}
+Resume text (grouped by section):
+{reduced_text}
 
 Return ONLY a valid JSON object with these exact keys: name, email, phone, company, designation, skills.
 For skills, return an array of strings.
 If any information is not found, use an empty string for strings or empty array for skills.
 """
             
-            response = self.client.chat.completions.create(
+            response = self.governor.call(
+                self.client.chat.completions.create,
                 model=model,
                 messages=[
                     {"role": "system", "content": "You are a resume parser. Extract structured information and return only valid JSON."},
@@ -59,85 +146,234 @@ If any information is not found, use an empty string for strings or empty array
             )
             
             content = response.choices[0].message.content.strip()
+            extracted_dict = self._parse_json_content(content)
             
-            
-            
-            # Remove markdown code blocks if present
-            if content.startswith('```'):
-                content = re.sub(r'^```(?:json)?\n', '', content)
-                content = re.sub(r'\n```$', '', content)
-            
-            extracted_dict = json.loads(content)
-            
-            # Calculate confidence
-            confidence = self.confidence_calculator.calculate(extracted_dict)
-            
-            return ExtractedData(
-                name=extracted_dict.get('name', ''),
-                email=extracted_dict.get('email', ''),
-                phone=extracted_dict.get('phone', ''),
-                company=extracted_dict.get('company', ''),
-                designation=extracted_dict.get('designation', ''),
-                skills=extracted_dict.get('skills', []),
-                confidence=confidence,
-                raw_data=extracted_dict,
-            )
+            return self._to_extracted_data(extracted_dict)
             
             
         except Exception as e:
             # Fallback to basic extraction on error
             return self._basic_extraction(resume_text)
-        
     
-    def _basic_extraction(self, text: str) -> ExtractedData:
-        """Basic regex-based extraction as fallback."""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        phone_pattern = r'[\+]?[(]?[0-9]{3}[)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4,6}'
+    def extract_batch(self, resume_texts: List[str]) -> List[ExtractedData]:
+        """
+        Extract structured data from several resumes with one chat completion
+        per batch of ``RESUME_EXTRACTION_BATCH_SIZE`` resumes.
         
-        emails = re.findall(email_pattern, text)
-        phones = re.findall(phone_pattern, text)
+        Items missing from (or malformed in) the batched response are retried
+        individually through ``extract``.
+        """
+        if not self.client:
+            return [self._basic_extraction(text) for text in resume_texts]
         
-        # Try to extract name from first line
-        lines = text.split('\n')
-        name = lines[0].strip() if lines else ''
+        batch_size = max(1, config('RESUME_EXTRACTION_BATCH_SIZE', default=5, cast=int))
+        results: List[ExtractedData] = []
+        for start in range(0, len(resume_texts), batch_size):
+            batch = resume_texts[start:start + batch_size]
+            batch_results = self._extract_chunk(batch)
+            for index, text in enumerate(batch):
+                result = batch_results.get(index)
+                results.append(result if result is not None else self.extract(text))
+        return results
+    
+    def _extract_chunk(self, resume_texts: List[str]) -> Dict[int, ExtractedData]:
+        """Run one batched request; returns the items that parsed, keyed by index."""
+        if len(resume_texts) == 1:
+            return {}
         
-        extracted_dict = {
-            'name': name[:255] if name else '',
-            'email': emails[0] if emails else '',
-            'phone': phones[0] if phones else '',
-            'company': '',
-            'designation': '',
-            'skills': [],
-        }
+        try:
+            model = config('OPENROUTER_MODEL', 'openai/gpt-3.5-turbo')
+            
+            resumes_block = '\n\n'.join(
+                f'### RESUME {index}\n{self.text_reducer.reduce(text)}'
+                for index, text in enumerate(resume_texts)
+            )
+            prompt = f"""Extract the following information from each of the {len(resume_texts)} resumes below:
+- name: Full name of the candidate
+- email: Email address
+- phone: Phone number
+- company: Current or most recent company
+- designation: Current or most recent job title
+- skills: List of technical skills and competencies
+
+{resumes_block}
+
+Return ONLY a valid JSON array with one object per resume, in the same order.
+Each object must have the keys: index, name, email, phone, company, designation, skills.
+"index" is the number after RESUME. For skills, return an array of strings.
+If any information is not found, use an empty string for strings or empty array for skills.
+"""
+            
+            response = self.governor.call(
+                self.client.chat.completions.create,
+                model=model,
+                messages=[
+                    {"role": "system", "content": "You are a resume parser. Extract structured information and return only valid JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.1,
+            )
+            
+            content = response.choices[0].message.content.strip()
+            items = self._parse_json_content(content)
+        except Exception:
+            return {}
+        
+        if not isinstance(items, list):
+            return {}
         
+        results: Dict[int, ExtractedData] = {}
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+            index = item.pop('index', position)
+            if not isinstance(index, int) or not 0 <= index < len(resume_texts) or index in results:
+                continue
+            try:
+                results[index] = self._to_extracted_data(item)
+            except (TypeError, ValueError):
+                continue
+        return results
+    
+    def _parse_json_content(self, content: str) -> Any:
+        """Parse a JSON response body, stripping markdown code fences if present."""
+        if content.startswith('```'):
+            content = re.sub(r'^```(?:json)?\n', '', content)
+            content = re.sub(r'\n```$', '', content)
+        return json.loads(content)
+    
+    def _to_extracted_data(self, extracted_dict: Dict[str, Any]) -> ExtractedData:
+        """Build the value object from a parsed LLM response."""
         confidence = self.confidence_calculator.calculate(extracted_dict)
         
         return ExtractedData(
-            
-            name=extracted_dict['name'],
-            email=extracted_dict['email'],
-            
-            phone=extracted_dict['phone'],
-            company=extracted_dict['company'],
-            
-            designation=extracted_dict['designation'],
-            skills=extracted_dict['skills'],
-            
+            name=extracted_dict.get('name', ''),
+            email=extracted_dict.get('email', ''),
+            phone=extracted_dict.get('phone', ''),
+            company=extracted_dict.get('company', ''),
+            designation=extracted_dict.get('designation', ''),
+            skills=extracted_dict.get('skills', []),
             confidence=confidence,
             raw_data=extracted_dict,
+            extractor_version=self.version,
         )
+        
+    
+    def _basic_extraction(self, text: str) -> ExtractedData:
+        """Basic regex-based extraction as fallback."""
+        return self.basic_extractor.extract(text)
+
+
+class DocumentRequestTemplateCache:
+    """
+    Pool of vetted document request templates per (request type, channel).
+    
+    Templates contain a ``{candidate_name}`` placeholder and are personalized by
+    plain substitution. Pools live in Django's cache, which must be a shared
+    backend (see CACHES) for workers to reuse each other's pools. A missing
+    pool is built in the background while callers get None and use the static
+    fallback; an empty or failed build is cached for
+    ``DOCUMENT_REQUEST_TEMPLATE_RETRY_SECONDS`` so the LLM is not asked again
+    on every request.
+    """
+    
+    PLACEHOLDER = '{candidate_name}'
+    
+    def __init__(self):
+        self.building = set()
+        self.lock = threading.Lock()
+    
+    def get_template(
+        self,
+        request_type: str,
+        communication_channel: str,
+        build_pool: Callable[[str, str], List[str]],
+    ) -> Optional[str]:
+        """Return a random template for the combination, or None until its pool is built."""
+        key = (request_type, communication_channel)
+        pool = cache.get(self._cache_key(key))
+        if pool is None:
+            self._schedule_build(key, build_pool)
+            return None
+        return random.choice(pool) if pool else None
+    
+    def get_pool(self, request_type: str, communication_channel: str) -> Optional[List[str]]:
+        return cache.get(self._cache_key((request_type, communication_channel)))
+    
+    def build(self, request_type: str, communication_channel: str, build_pool: Callable[[str, str], List[str]]) -> List[str]:
+        """Build, vet and cache the pool for one combination now."""
+        key = (request_type, communication_channel)
+        try:
+            pool = [t for t in build_pool(*key) if self.is_valid(t, request_type)]
+        except Exception:
+            pool = []
+        if pool:
+            timeout = config('DOCUMENT_REQUEST_TEMPLATE_TTL', default=24 * 60 * 60, cast=int)
+        else:
+            timeout = config('DOCUMENT_REQUEST_TEMPLATE_RETRY_SECONDS', default=5 * 60, cast=int)
+        cache.set(self._cache_key(key), pool, timeout)
+        return pool
+    
+    def personalize(self, template: str, candidate_name: str) -> str:
+        return template.replace(self.PLACEHOLDER, candidate_name or 'Candidate')
+    
+    def is_valid(self, template: str, request_type: str) -> bool:
+        """Reject templates that would need manual editing before sending."""
+        if not 80 <= len(template) <= 2000:
+            return False
+        if template.count(self.PLACEHOLDER) < 1:
+            return False
+        leftover = template.replace(self.PLACEHOLDER, '')
+        if re.search(r'[{}]|\[[^\]]*\]|<[^>]*>', leftover):
+            return False
+        lowered = leftover.lower()
+        if request_type in ('pan', 'both') and not re.search(r'\bpan\b', lowered):
+            return False
+        if request_type in ('aadhaar', 'both') and not re.search(r'\baadhaar\b', lowered):
+            return False
+        return True
+    
+    def _schedule_build(self, key: Tuple[str, str], build_pool: Callable[[str, str], List[str]]) -> None:
+        # One build per combination at a time; the lock only guards the set.
+        with self.lock:
+            if key in self.building:
+                return
+            self.building.add(key)
+        run_in_background(self._build_in_background, key, build_pool)
+    
+    def _build_in_background(self, key: Tuple[str, str], build_pool: Callable[[str, str], List[str]]) -> None:
+        try:
+            self.build(*key, build_pool)
+        finally:
+            with self.lock:
+                self.building.discard(key)
+    
+    @staticmethod
+    def _cache_key(key: Tuple[str, str]) -> str:
+        return f'document_request_templates:{key[0]}:{key[1]}'
+
+
+_template_cache = DocumentRequestTemplateCache()
 
 
 class OpenRouterDocumentRequestGenerator(DocumentRequestGenerator):
     """Generate document requests using OpenRouter."""
     
+    SYSTEM_PROMPT = """You are a professional HR assistant. Generate a polite, 
+personalized email or message requesting identity documents (PAN and/or Aadhaar) 
+from a candidate. The message should be:
+- Professional and courteous
+- Clear about what documents are needed
+- Reassuring about data security
+- Personalized with the candidate's name
+Keep it concise (2-3 paragraphs)."""
+    
+    TEMPLATE_SEPARATOR = '====='
+    
     def __init__(self):
-        api_key = config('OPENROUTER_API_KEY', '')
-        base_url = config('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')
-        if api_key:
-            self.client = OpenAI(api_key=api_key, base_url=base_url)
-        else:
-            self.client = None
+        self.client = _create_client()
+        self.governor = get_llm_governor()
+        self.template_cache = _template_cache
     
     def generate(
         self,
@@ -146,11 +382,38 @@ class OpenRouterDocumentRequestGenerator(DocumentRequestGenerator):
         candidate_phone: str,
         request_type: str,
         communication_channel: str,
+        use_ai: Optional[bool] = None,
     ) -> str:
         
         
-        """Generate a personalized document request message."""
+        """Generate a personalized document request message.
+        
+        By default (DOCUMENT_REQUEST_MESSAGE_MODE=llm) the LLM writes a one-off
+        message. In template mode, or with ``use_ai=False``, a cached template
+        is personalized instead; until its pool has been built in the
+        background, template mode keeps using the LLM and an explicit
+        ``use_ai=False`` gets the static fallback text.
+        """
+        template_mode = config('DOCUMENT_REQUEST_MESSAGE_MODE', default='llm') == 'template'
+        if use_ai is False or (use_ai is None and template_mode):
+            template = self.template_cache.get_template(
+                request_type, communication_channel, self._generate_template_pool
+            )
+            if template is not None:
+                return self.template_cache.personalize(template, candidate_name)
+            if use_ai is False:
+                logger.warning(
+                    'No %s/%s template pool yet; sending the static document request message',
+                    request_type, communication_channel,
+                )
+                return self._generate_fallback_request(candidate_name, request_type, communication_channel)
+            logger.info(
+                'No %s/%s template pool yet; generating the document request with the LLM',
+                request_type, communication_channel,
+            )
+        
         if not self.client:
+            logger.warning('No OpenRouter client; sending the static document request message')
             return self._generate_fallback_request(
                 candidate_name, request_type, communication_channel
             )
@@ -158,14 +421,7 @@ class OpenRouterDocumentRequestGenerator(DocumentRequestGenerator):
         try:
             model = config('OPENROUTER_MODEL', 'openai/gpt-3.5-turbo')
             
-            system_prompt = """You are a professional HR assistant. Generate a polite, 
-personalized email or message requesting identity documents (PAN and/or Aadhaar) 
-from a candidate. The message should be:
-- Professional and courteous
-- Clear about what documents are needed
-- Reassuring about data security
-- Personalized with the candidate's name
-Keep it concise (2-3 paragraphs)."""
+            system_prompt = self.SYSTEM_PROMPT
             
             user_prompt = f"""Generate a document request message for:
 Candidate Name: {candidate_name}
@@ -176,7 +432,8 @@ Communication Channel: {communication_channel}
 
 Generate the message now:"""
             
-            response = self.client.chat.completions.create(
+            response = self.governor.call(
+                self.client.chat.completions.create,
                 model=model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -187,10 +444,55 @@ Generate the message now:"""
             
             return response.choices[0].message.content.strip()
         except Exception as e:
+            logger.warning('Document request generation failed, sending the static message: %s', e)
             return self._generate_fallback_request(
                 candidate_name, request_type, communication_channel
             )
     
+    def warm_templates(self, refresh: bool = False) -> Dict[Tuple[str, str], int]:
+        """Build template pools for every combination; returns pool sizes."""
+        sizes = {}
+        for request_type in RequestType:
+            for channel in CommunicationChannel:
+                key = (request_type.value, channel.value)
+                pool = None if refresh else self.template_cache.get_pool(*key)
+                if not pool:
+                    pool = self.template_cache.build(*key, self._generate_template_pool)
+                sizes[key] = len(pool)
+        return sizes
+    
+    def _generate_template_pool(self, request_type: str, communication_channel: str) -> List[str]:
+        """Ask the LLM for a few reusable templates for one combination."""
+        if not self.client:
+            return []
+        
+        pool_size = config('DOCUMENT_REQUEST_TEMPLATE_POOL_SIZE', default=3, cast=int)
+        try:
+            model = config('OPENROUTER_MODEL', 'openai/gpt-3.5-turbo')
+            
+            user_prompt = f"""Write {pool_size} different reusable document request messages.
+Documents Needed: {request_type}
+Communication Channel: {communication_channel}
+
+Address the candidate as {DocumentRequestTemplateCache.PLACEHOLDER} exactly, and use no other
+placeholders, brackets or blanks to fill in. Sign off as "HR Team".
+Separate the messages with a line containing only {self.TEMPLATE_SEPARATOR}"""
+            
+            response = self.governor.call(
+                self.client.chat.completions.create,
+                model=model,
+                messages=[
+                    {"role": "system", "content": self.SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.9,
+            )
+            
+            content = response.choices[0].message.content
+            return [part.strip() for part in content.split(self.TEMPLATE_SEPARATOR) if part.strip()]
+        except Exception as e:
+            return []
+    
     def _generate_fallback_request(
         self,
         candidate_name: str,
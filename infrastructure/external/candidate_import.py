@@ -0,0 +1,61 @@
+"""
+Streaming readers for pre-extracted candidate data (CSV or NDJSON).
+
+Readers yield ``(line_number, record, error)`` one record at a time, so
+files of any size are imported with constant memory. A malformed record
+yields an error instead of aborting the whole file.
+"""
+import codecs
+import csv
+import json
+from typing import IO, Any, Dict, Iterator, Optional, Tuple
+
+
+ImportRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+
+
+def detect_format(name: str, head: bytes) -> str:
+    """Pick csv or ndjson from the file name, falling back to the first byte."""
+    lowered = (name or '').lower()
+    if lowered.endswith(('.ndjson', '.jsonl', '.json')):
+        return 'ndjson'
+    if lowered.endswith('.csv'):
+        return 'csv'
+    return 'ndjson' if head.lstrip(codecs.BOM_UTF8).lstrip()[:1] == b'{' else 'csv'
+
+
+def iter_csv_records(binary: IO[bytes]) -> Iterator[ImportRecord]:
+    text = codecs.getreader('utf-8-sig')(binary)
+    reader = csv.DictReader(text)
+    for record in reader:
+        # DictReader puts surplus cells under the None key.
+        if None in record:
+            yield reader.line_num, None, 'Row has more cells than the header'
+            continue
+        yield reader.line_num, record, None
+
+
+def iter_ndjson_records(binary: IO[bytes]) -> Iterator[ImportRecord]:
+    for line_number, raw_line in enumerate(binary, start=1):
+        line = raw_line.decode('utf-8-sig').strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f'Invalid JSON: {e}'
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, 'Each line must be a JSON object'
+            continue
+        yield line_number, record, None
+
+
+def iter_candidate_records(binary: IO[bytes], file_format: str) -> Iterator[ImportRecord]:
+    if file_format == 'csv':
+        return iter_csv_records(binary)
+    if file_format == 'ndjson':
+        return iter_ndjson_records(binary)
+    raise ValueError(f"Unsupported import format {file_format!r}; expected one of {', '.join(IMPORT_FORMATS)}")
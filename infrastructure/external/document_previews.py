@@ -0,0 +1,141 @@
+"""
+Thumbnail and preview derivatives for submitted documents.
+
+Recruiters mostly need a glance at a PAN/Aadhaar scan, not the full-resolution
+photo. ``PillowDocumentPreviewGenerator`` renders a small thumbnail and a
+larger preview for each submission (WebP when Pillow supports it, JPEG
+otherwise) and stores them on the submission row. PDFs are rendered from
+their first page with pypdfium2 when it is installed; otherwise the first
+embedded image on that page is used, which covers scanned documents.
+"""
+import io
+import logging
+import os
+from functools import partial
+from typing import Optional
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageOps, features
+
+from domains.candidates.domain_services import DocumentPreviewGenerator
+from infrastructure.persistence.models import DocumentSubmissionModel
+
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pypdfium2
+except ImportError:  # optional dependency
+    pypdfium2 = None
+
+
+class PillowDocumentPreviewGenerator(DocumentPreviewGenerator):
+    """Generate cached thumbnail/preview images with Pillow."""
+
+    def __init__(
+        self,
+        thumbnail_size: Optional[int] = None,
+        preview_size: Optional[int] = None,
+        image_format: Optional[str] = None,
+        quality: Optional[int] = None,
+    ):
+        self.thumbnail_size = thumbnail_size or getattr(settings, 'DOCUMENT_THUMBNAIL_SIZE', 256)
+        self.preview_size = preview_size or getattr(settings, 'DOCUMENT_PREVIEW_SIZE', 1280)
+        self.quality = quality or getattr(settings, 'DOCUMENT_DERIVATIVE_QUALITY', 80)
+        image_format = (image_format or getattr(settings, 'DOCUMENT_DERIVATIVE_FORMAT', 'WEBP')).upper()
+        if image_format == 'WEBP' and not features.check('webp'):
+            image_format = 'JPEG'
+        self.image_format = image_format
+
+    @property
+    def extension(self) -> str:
+        return 'webp' if self.image_format == 'WEBP' else 'jpg'
+
+    def generate(self, submission_id: int, force: bool = False) -> bool:
+        """Render and store derivatives; returns False when nothing was written."""
+        model = DocumentSubmissionModel.objects.filter(pk=submission_id).first()
+        if model is None or not model.document_file:
+            return False
+        if model.thumbnail and model.preview and not force:
+            return False
+
+        source = self._open_source(model.document_file)
+        if source is None:
+            return False
+
+        base = os.path.splitext(os.path.basename(model.document_file.name))[0]
+        # The preview is rendered first so the thumbnail can be derived from it
+        # instead of decoding the full-resolution image a second time.
+        preview = self._render(source, self.preview_size)
+        thumbnail = self._render(preview, self.thumbnail_size)
+        source.close()
+
+        # Each save takes a new reference, even for identical content, so the
+        # old one is always released; both happen in one transaction with the
+        # row update.
+        with transaction.atomic():
+            for field_name, image in (('preview', preview), ('thumbnail', thumbnail)):
+                field_file = getattr(model, field_name)
+                old_name = field_file.name
+                field_file.save(f'{base}.{self.extension}', ContentFile(self._encode(image)), save=False)
+                if old_name:
+                    transaction.on_commit(partial(field_file.storage.delete, old_name))
+            DocumentSubmissionModel.objects.filter(pk=model.pk).update(
+                thumbnail=model.thumbnail.name,
+                preview=model.preview.name,
+            )
+        return True
+
+    def _open_source(self, field_file) -> Optional[Image.Image]:
+        with field_file.open('rb') as handle:
+            data = handle.read()
+        if data.startswith(b'%PDF') or b'%PDF-' in data[:1024]:
+            return self._open_pdf_first_page(data, field_file.name)
+        try:
+            image = Image.open(io.BytesIO(data))
+            # draft() lets the JPEG decoder downscale while decoding.
+            image.draft('RGB', (self.preview_size, self.preview_size))
+            return ImageOps.exif_transpose(image)
+        except Exception as e:
+            logger.warning('Cannot open %s for previews: %s', field_file.name, e)
+            return None
+
+    def _open_pdf_first_page(self, data: bytes, name: str) -> Optional[Image.Image]:
+        try:
+            if pypdfium2 is not None:
+                pdf = pypdfium2.PdfDocument(data)
+                try:
+                    page = pdf[0]
+                    width, height = page.get_size()
+                    scale = self.preview_size / max(width, height, 1)
+                    return page.render(scale=max(scale, 0.1)).to_pil()
+                finally:
+                    pdf.close()
+
+            from PyPDF2 import PdfReader
+            page = PdfReader(io.BytesIO(data)).pages[0]
+            images = list(page.images)
+            if not images:
+                return None
+            return Image.open(io.BytesIO(images[0].data))
+        except Exception as e:
+            logger.warning('Cannot render first page of %s: %s', name, e)
+            return None
+
+    @staticmethod
+    def _render(image: Image.Image, size: int) -> Image.Image:
+        rendered = image.convert('RGB') if image.mode != 'RGB' else image.copy()
+        rendered.thumbnail((size, size), Image.Resampling.LANCZOS)
+        return rendered
+
+    def _encode(self, image: Image.Image) -> bytes:
+        output = io.BytesIO()
+        options = {'quality': self.quality}
+        if self.image_format == 'JPEG':
+            options.update(optimize=True, progressive=True)
+        else:
+            options['method'] = 4
+        image.save(output, format=self.image_format, **options)
+        return output.getvalue()
@@ -1,6 +1,13 @@
-from django.core.mail import send_mail
+import uuid
+from datetime import timedelta
+from typing import List, Tuple
+
+from django.core.mail import send_mail, get_connection, EmailMessage
 from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
 from domains.candidates.interfaces import IEmailService
+from infrastructure.persistence.models import EmailOutboxModel
 
 
 class EmailService(IEmailService):
@@ -18,4 +25,114 @@ class EmailService(IEmailService):
             return True
         except Exception as e:
             print(f"Failed to send email: {e}")
-            return False
\ No newline at end of file
+            return False
+
+
+class OutboxEmailService(IEmailService):
+    """Queue emails in the outbox table instead of talking to SMTP.
+    
+    Rows join the caller's transaction, so an email exists only if the
+    document request that triggered it was committed.
+    """
+    
+    def send_email(self, to_email: str, subject: str, message: str) -> bool:
+        EmailOutboxModel.objects.create(to_email=to_email, subject=subject[:255], body=message)
+        return True
+    
+    def send_bulk(self, messages: List[Tuple[str, str, str]]) -> int:
+        rows = [
+            EmailOutboxModel(to_email=to_email, subject=subject[:255], body=message)
+            for to_email, subject, message in messages
+        ]
+        EmailOutboxModel.objects.bulk_create(rows, batch_size=500)
+        return len(rows)
+
+
+class EmailOutboxWorker:
+    """Deliver queued emails in batches over a single backend connection."""
+    
+    def __init__(self, batch_size: int = 100, max_attempts: int = 5, retry_base_seconds: int = 60, claim_timeout_seconds: int = 600):
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.claim_timeout_seconds = claim_timeout_seconds
+    
+    def drain_once(self) -> dict:
+        """Claim and deliver one batch; returns counts by outcome."""
+        rows = self._claim_batch()
+        result = {'sent': 0, 'retry': 0, 'failed': 0}
+        if not rows:
+            return result
+        
+        from_email = getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@example.com')
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            for row in rows:
+                result[self._record_failure(row, e)] += 1
+            return result
+        
+        try:
+            for row in rows:
+                message = EmailMessage(
+                    subject=row.subject,
+                    body=row.body,
+                    from_email=from_email,
+                    to=[row.to_email],
+                    connection=connection,
+                )
+                try:
+                    connection.send_messages([message])
+                except Exception as e:
+                    result[self._record_failure(row, e)] += 1
+                    continue
+                EmailOutboxModel.objects.filter(pk=row.pk).update(
+                    status='sent',
+                    attempts=row.attempts + 1,
+                    sent_at=timezone.now(),
+                    last_error='',
+                    claim_token='',
+                )
+                result['sent'] += 1
+        finally:
+            connection.close()
+        return result
+    
+    def _claim_batch(self) -> List[EmailOutboxModel]:
+        # Claiming with a token lets several workers drain the same table; rows
+        # stuck in "sending" (worker crashed) are picked up again after a timeout.
+        now = timezone.now()
+        stale = now - timedelta(seconds=self.claim_timeout_seconds)
+        due = (
+            Q(status='pending', next_attempt_at__lte=now)
+            | Q(status='sending', claimed_at__lt=stale)
+        )
+        ids = list(
+            EmailOutboxModel.objects.filter(due)
+            .order_by('next_attempt_at')
+            .values_list('pk', flat=True)[:self.batch_size]
+        )
+        if not ids:
+            return []
+        token = uuid.uuid4().hex
+        EmailOutboxModel.objects.filter(due, pk__in=ids).update(
+            status='sending', claim_token=token, claimed_at=now,
+        )
+        return list(EmailOutboxModel.objects.filter(claim_token=token, status='sending'))
+    
+    def _record_failure(self, row: EmailOutboxModel, error: Exception) -> str:
+        attempts = row.attempts + 1
+        if attempts >= self.max_attempts:
+            outcome, status, next_attempt_at = 'failed', 'failed', row.next_attempt_at
+        else:
+            delay = self.retry_base_seconds * (2 ** (attempts - 1))
+            outcome, status, next_attempt_at = 'retry', 'pending', timezone.now() + timedelta(seconds=delay)
+        EmailOutboxModel.objects.filter(pk=row.pk).update(
+            status=status,
+            attempts=attempts,
+            last_error=str(error)[:2000],
+            next_attempt_at=next_attempt_at,
+            claim_token='',
+        )
+        return outcome
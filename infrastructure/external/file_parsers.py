@@ -1,42 +1,156 @@
 """
 File parsing implementations for resume text extraction.
 """
+import posixpath
 import re
+import zipfile
 from pathlib import Path
-from typing import Dict, Any
-import PyPDF2
-from docx import Document
+from typing import Dict, Any, List, Optional, Tuple
+from lxml import etree
 from domains.candidates.domain_services import ResumeTextExtractor
 from domains.candidates.exceptions import InvalidResumeFileError
+from .pdf_backends import extract_pdf_pages
+
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+W_P, W_T, W_TAB, W_BR, W_CR = W_NS + 'p', W_NS + 't', W_NS + 'tab', W_NS + 'br', W_NS + 'cr'
+W_TBL, W_TR, W_TC = W_NS + 'tbl', W_NS + 'tr', W_NS + 'tc'
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+DOCX_MAIN_PART = 'word/document.xml'
+DOCX_MAIN_RELS = 'word/_rels/document.xml.rels'
 
 
 class PDFTextExtractor(ResumeTextExtractor):
-    """Extract text from PDF files."""
+    """Extract text from PDF files with the configured backend (see pdf_backends)."""
+    
+    def __init__(self, backend: Optional[str] = None, parallel_min_pages: Optional[int] = None):
+        self.backend = backend
+        self.parallel_min_pages = parallel_min_pages
     
     def extract(self, file_path: str) -> str:
         """Extract text from PDF file."""
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ''
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + '\n'
-                return text
+            pages = extract_pdf_pages(file_path, self.backend, self.parallel_min_pages)
+            return ''.join(page + '\n' for page in pages)
         except Exception as e:
             raise InvalidResumeFileError(f"Error reading PDF: {str(e)}")
 
 
 class DOCXTextExtractor(ResumeTextExtractor):
-    """Extract text from DOCX files."""
+    """
+    Extract text from DOCX files by streaming their XML parts with lxml.
+    
+    Headers come first (that is where contact blocks usually live), then the
+    body, then footers. Paragraphs, table rows (cells joined by tabs) and text
+    box content are emitted in document order; ``mc:Fallback`` branches, which
+    repeat text box content for older readers, are skipped. Elements are
+    cleared as soon as they are consumed, so memory stays flat however large
+    the document is.
+    """
     
     def extract(self, file_path: str) -> str:
         """Extract text from DOCX file."""
         try:
-            doc = Document(file_path)
-            text = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-            return text
+            with zipfile.ZipFile(file_path) as archive:
+                headers, footers = self._header_footer_parts(archive)
+                lines: List[str] = []
+                seen_headers = set()
+                for name in headers:
+                    # First-page, odd and even headers often repeat the same block.
+                    header_lines = self._part_lines(archive, name)
+                    if tuple(header_lines) not in seen_headers:
+                        seen_headers.add(tuple(header_lines))
+                        lines.extend(header_lines)
+                lines.extend(self._part_lines(archive, DOCX_MAIN_PART))
+                for name in footers:
+                    lines.extend(self._part_lines(archive, name))
+            return '\n'.join(lines)
         except Exception as e:
             raise InvalidResumeFileError(f"Error reading DOCX: {str(e)}")
+    
+    @staticmethod
+    def _header_footer_parts(archive: zipfile.ZipFile) -> Tuple[List[str], List[str]]:
+        try:
+            rels = etree.fromstring(
+                archive.read(DOCX_MAIN_RELS),
+                parser=etree.XMLParser(resolve_entities=False, no_network=True),
+            )
+        except KeyError:
+            return [], []
+        parts: Dict[str, List[str]] = {'header': [], 'footer': []}
+        for rel in rels:
+            kind = rel.get('Type', '').rsplit('/', 1)[-1]
+            if kind not in parts or rel.get('TargetMode') == 'External':
+                continue
+            target = rel.get('Target', '')
+            name = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('word', target))
+            if name in archive.namelist() and name not in parts[kind]:
+                parts[kind].append(name)
+        return parts['header'], parts['footer']
+    
+    @staticmethod
+    def _part_lines(archive: zipfile.ZipFile, name: str) -> List[str]:
+        lines: List[str] = []
+        runs: List[List[str]] = []      # text of each open paragraph (text boxes nest them)
+        tables: List[Dict[str, Any]] = []  # open tables: current row cells and cell lines
+        skipping = 0
+        
+        def emit(text: str) -> None:
+            # Into the innermost open table cell (rows of a nested table land
+            # in the enclosing cell), else straight to the output.
+            for table in reversed(tables):
+                if table['cell'] is not None:
+                    table['cell'].append(text)
+                    return
+            if text.strip():
+                lines.append(text)
+        
+        with archive.open(name) as stream:
+            for event, element in etree.iterparse(
+                stream, events=('start', 'end'), resolve_entities=False, no_network=True,
+            ):
+                tag = element.tag
+                if tag == MC_FALLBACK:
+                    skipping += 1 if event == 'start' else -1
+                    continue
+                if skipping:
+                    continue
+                
+                if event == 'start':
+                    if tag == W_P:
+                        runs.append([])
+                    elif tag == W_TBL:
+                        tables.append({'row': [], 'cell': None})
+                    elif tag == W_TC and tables:
+                        tables[-1]['cell'] = []
+                    continue
+                
+                if tag == W_T and runs:
+                    runs[-1].append(element.text or '')
+                elif tag == W_TAB and runs:
+                    runs[-1].append('\t')
+                elif tag in (W_BR, W_CR) and runs:
+                    runs[-1].append('\n')
+                elif tag == W_P and runs:
+                    emit(''.join(runs.pop()))
+                elif tag == W_TC and tables:
+                    cell = ' '.join(text.strip() for text in tables[-1]['cell'] if text.strip())
+                    tables[-1]['row'].append(cell)
+                    tables[-1]['cell'] = None
+                elif tag == W_TR and tables:
+                    row = '\t'.join(tables[-1]['row'])
+                    tables[-1]['row'] = []
+                    emit(row)
+                elif tag == W_TBL and tables:
+                    tables.pop()
+                
+                # Drop consumed top-level blocks (and what preceded them).
+                if tag in (W_P, W_TBL) and not runs and not tables:
+                    element.clear()
+                    parent = element.getparent()
+                    while parent is not None and element.getprevious() is not None:
+                        del parent[0]
+        return lines
 
 
 class ResumeTextExtractorFactory:
@@ -54,3 +168,10 @@ class ResumeTextExtractorFactory:
         else:
             raise InvalidResumeFileError(f"Unsupported file format: {file_ext}")
 
+
+
+class ResumeFileTextExtractor(ResumeTextExtractor):
+    """Extract text from any supported resume file, choosing the parser per file."""
+    
+    def extract(self, file_path: str) -> str:
+        return ResumeTextExtractorFactory.create(file_path).extract(file_path)
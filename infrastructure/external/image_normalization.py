@@ -0,0 +1,106 @@
+"""
+Normalization of submitted document photos.
+
+Phone photos of ID cards arrive as multi-megabyte JPEG/PNG files with EXIF
+orientation and location tags. ``PillowDocumentFileNormalizer`` applies the
+orientation, drops all metadata, caps the longest side and re-encodes at a
+target quality before the file is stored. PDFs and anything Pillow cannot
+read are stored unchanged. When ``DOCUMENT_KEEP_ORIGINALS`` is on, the raw
+upload is first copied to the ``originals`` storage (cold storage in
+production).
+"""
+import io
+import logging
+import os
+from typing import Optional
+
+from django.conf import settings
+from django.core.files.base import ContentFile, File
+from django.core.files.storage import storages
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+from domains.candidates.domain_services import DocumentFileNormalizer
+
+
+logger = logging.getLogger(__name__)
+
+NORMALIZED_SOURCE_FORMATS = {'JPEG', 'PNG', 'WEBP', 'MPO'}
+
+
+class PillowDocumentFileNormalizer(DocumentFileNormalizer):
+    """Auto-orient, strip metadata, downsize and re-encode document images."""
+
+    def __init__(
+        self,
+        max_dimension: Optional[int] = None,
+        quality: Optional[int] = None,
+        image_format: Optional[str] = None,
+        keep_originals: Optional[bool] = None,
+    ):
+        self.max_dimension = max_dimension or getattr(settings, 'DOCUMENT_MAX_DIMENSION', 2000)
+        self.quality = quality or getattr(settings, 'DOCUMENT_NORMALIZED_QUALITY', 85)
+        image_format = (image_format or getattr(settings, 'DOCUMENT_NORMALIZED_FORMAT', 'JPEG')).upper()
+        if image_format == 'WEBP' and not features.check('webp'):
+            image_format = 'JPEG'
+        self.image_format = image_format
+        self.keep_originals = (
+            keep_originals if keep_originals is not None
+            else getattr(settings, 'DOCUMENT_KEEP_ORIGINALS', False)
+        )
+
+    def normalize(self, document_file):
+        # The upload handler has already sniffed the type; PDFs go through as-is.
+        if getattr(document_file, 'sniffed_type', None) == 'pdf':
+            return document_file
+        document_file.seek(0)
+        try:
+            image = Image.open(document_file)
+            source_format = image.format
+            if source_format not in NORMALIZED_SOURCE_FORMATS:
+                return document_file
+            # draft() lets the JPEG decoder downscale by a power of two while decoding.
+            image.draft('RGB', (self.max_dimension, self.max_dimension))
+            image = ImageOps.exif_transpose(image)
+            image = self._flatten(image)
+            image.thumbnail((self.max_dimension, self.max_dimension), Image.Resampling.LANCZOS)
+
+            output = io.BytesIO()
+            # No exif/icc arguments are passed, so all metadata is dropped.
+            image.save(output, format=self.image_format, **self._save_options())
+        except UnidentifiedImageError:
+            document_file.seek(0)
+            return document_file
+        except Exception as e:
+            logger.warning('Could not normalize %s, storing as uploaded: %s', getattr(document_file, 'name', ''), e)
+            document_file.seek(0)
+            return document_file
+
+        base = os.path.splitext(os.path.basename(document_file.name or 'document'))[0]
+        extension = 'webp' if self.image_format == 'WEBP' else 'jpg'
+        return ContentFile(output.getvalue(), name=f'{base}.{extension}')
+
+    def archive_original(self, document_file) -> str:
+        if not self.keep_originals:
+            return ''
+        document_file.seek(0)
+        # Saving the upload itself would let the storage move its temporary
+        # file away; a plain File over the same handle is copied instead.
+        name = storages['originals'].save(
+            f'documents/{os.path.basename(document_file.name)}',
+            File(document_file.file, name=document_file.name),
+        )
+        document_file.seek(0)
+        return name
+
+    @staticmethod
+    def _flatten(image: Image.Image) -> Image.Image:
+        if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+            background = Image.new('RGB', image.size, 'white')
+            background.paste(image.convert('RGBA'), mask=image.convert('RGBA').getchannel('A'))
+            return background
+        return image.convert('RGB') if image.mode != 'RGB' else image
+
+    def _save_options(self) -> dict:
+        if self.image_format == 'JPEG':
+            return {'quality': self.quality, 'optimize': True, 'progressive': True}
+        return {'quality': self.quality, 'method': 4}
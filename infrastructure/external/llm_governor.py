@@ -0,0 +1,262 @@
+"""
+Client-side governor for calls to the LLM provider.
+
+All OpenRouter calls in a process share one ``LLMGovernor`` which applies, in
+order: a circuit breaker (fail fast while the upstream is unhealthy), a
+concurrency semaphore, a token-bucket rate limit, and jittered exponential
+retries for 429/5xx and connection errors. Callers catch ``LLMUnavailableError``
+(or any other exception) and use their local fallback.
+"""
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import openai
+from decouple import config
+
+
+class LLMUnavailableError(Exception):
+    """Raised when the governor refuses or gives up on an LLM call."""
+    pass
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``rate`` tokens per second up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            if time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    @property
+    def available(self) -> float:
+        with self.lock:
+            elapsed = time.monotonic() - self.updated_at
+            return min(self.capacity, self.tokens + elapsed * self.rate)
+
+
+class CircuitBreaker:
+    """
+    Classic closed / open / half-open breaker.
+
+    Opens after ``failure_threshold`` consecutive upstream failures, stays open
+    for ``recovery_timeout`` seconds, then lets a single trial call through.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+                self.state = self.HALF_OPEN
+                self.trial_in_flight = False
+            if self.state == self.HALF_OPEN and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+            return False
+
+    def release_trial(self) -> None:
+        # The trial call never reached the upstream; let the next caller try.
+        with self.lock:
+            self.trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self.trial_in_flight = False
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, (openai.RateLimitError, openai.APIConnectionError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, 'response', None)
+    value = response.headers.get('retry-after') if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class LLMGovernor:
+    """Concurrency, rate, retry and circuit-breaker policy for LLM calls."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        rate_per_second: float = 2.0,
+        burst: int = 4,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        acquire_timeout: float = 10.0,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ):
+        self.max_concurrency = max_concurrency
+        self.semaphore = threading.BoundedSemaphore(max_concurrency)
+        self.bucket = TokenBucket(rate_per_second, burst)
+        self.breaker = CircuitBreaker(failure_threshold, recovery_timeout)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.acquire_timeout = acquire_timeout
+
+        self.metrics_lock = threading.Lock()
+        self.in_flight = 0
+        self.counters = {
+            'calls': 0,
+            'successes': 0,
+            'failures': 0,
+            'retries': 0,
+            'rate_limited': 0,
+            'short_circuited': 0,
+            'saturated': 0,
+        }
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``fn`` under the governor's policies."""
+        self._count('calls')
+        if not self.breaker.allow():
+            self._count('short_circuited')
+            raise LLMUnavailableError('LLM circuit breaker is open')
+
+        if not self.semaphore.acquire(timeout=self.acquire_timeout):
+            self._count('saturated')
+            self.breaker.release_trial()
+            raise LLMUnavailableError('LLM concurrency limit reached')
+
+        with self.metrics_lock:
+            self.in_flight += 1
+        try:
+            return self._call_with_retries(fn, *args, **kwargs)
+        finally:
+            with self.metrics_lock:
+                self.in_flight -= 1
+            self.semaphore.release()
+
+    def _call_with_retries(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        attempt = 0
+        while True:
+            if not self.bucket.acquire(timeout=self.acquire_timeout):
+                self._count('saturated')
+                self.breaker.release_trial()
+                raise LLMUnavailableError('LLM rate limit budget exhausted')
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if isinstance(e, openai.RateLimitError):
+                    self._count('rate_limited')
+                if not _is_retryable(e):
+                    # A 4xx still proves the upstream is answering; anything
+                    # else is a local problem and says nothing about its health.
+                    if isinstance(e, openai.APIStatusError):
+                        self.breaker.record_success()
+                    else:
+                        self.breaker.release_trial()
+                    raise
+                if attempt >= self.max_retries:
+                    self._count('failures')
+                    self.breaker.record_failure()
+                    raise LLMUnavailableError(f'LLM call failed after {attempt + 1} attempts: {e}') from e
+                self._count('retries')
+                time.sleep(self._backoff(attempt, _retry_after(e)))
+                attempt += 1
+                continue
+            self._count('successes')
+            self.breaker.record_success()
+            return result
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        # Full jitter: sleep a random amount up to the exponential cap.
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def _count(self, name: str) -> None:
+        with self.metrics_lock:
+            self.counters[name] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current breaker state, limiter headroom and counters."""
+        with self.metrics_lock:
+            counters = dict(self.counters)
+            in_flight = self.in_flight
+        return {
+            'circuit_state': self.breaker.state,
+            'consecutive_failures': self.breaker.consecutive_failures,
+            'in_flight': in_flight,
+            'max_concurrency': self.max_concurrency,
+            'rate_tokens_available': round(self.bucket.available, 2),
+            **counters,
+        }
+
+
+_governor: Optional[LLMGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_llm_governor() -> LLMGovernor:
+    """Return the process-wide governor, creating it from config on first use."""
+    global _governor
+    if _governor is None:
+        with _governor_lock:
+            if _governor is None:
+                _governor = LLMGovernor(
+                    max_concurrency=config('LLM_MAX_CONCURRENCY', default=4, cast=int),
+                    rate_per_second=config('LLM_RATE_PER_SECOND', default=2.0, cast=float),
+                    burst=config('LLM_RATE_BURST', default=4, cast=int),
+                    max_retries=config('LLM_MAX_RETRIES', default=3, cast=int),
+                    base_delay=config('LLM_RETRY_BASE_DELAY', default=0.5, cast=float),
+                    max_delay=config('LLM_RETRY_MAX_DELAY', default=8.0, cast=float),
+                    acquire_timeout=config('LLM_ACQUIRE_TIMEOUT', default=10.0, cast=float),
+                    failure_threshold=config('LLM_BREAKER_FAILURE_THRESHOLD', default=5, cast=int),
+                    recovery_timeout=config('LLM_BREAKER_RECOVERY_TIMEOUT', default=30.0, cast=float),
+                )
+    return _governor
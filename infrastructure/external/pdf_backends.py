@@ -0,0 +1,253 @@
+"""
+Interchangeable PDF text backends for resume parsing.
+
+PyPDF2 is always installed; pypdf, pdfminer.six and pypdfium2 are used when
+present. ``RESUME_PDF_BACKEND`` picks one by name, ``auto`` takes the first
+installed backend in ``BACKEND_PREFERENCE`` (fastest first), and
+``benchmark`` times every installed backend on ``RESUME_PDF_BENCHMARK_CORPUS``
+once per process and keeps the fastest.
+
+Documents with at least ``RESUME_PDF_PARALLEL_MIN_PAGES`` pages are split into
+page ranges that are extracted on a shared process pool; every worker opens
+the file itself, so nothing but the path and the page numbers is pickled.
+"""
+import glob
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import PyPDF2
+from django.conf import settings
+
+try:
+    import pypdf
+except ImportError:  # optional dependency
+    pypdf = None
+
+try:
+    from pdfminer.high_level import extract_text as pdfminer_extract_text
+    from pdfminer.pdfpage import PDFPage
+except ImportError:  # optional dependency
+    pdfminer_extract_text = PDFPage = None
+
+try:
+    import pypdfium2
+except ImportError:  # optional dependency
+    pypdfium2 = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class PDFBackend:
+    """Page-addressable text extraction with one PDF library."""
+
+    name = ''
+
+    @classmethod
+    def available(cls) -> bool:
+        raise NotImplementedError("Subclasses must implement available method")
+
+    def page_count(self, file_path: str) -> int:
+        raise NotImplementedError("Subclasses must implement page_count method")
+
+    def extract_pages(self, file_path: str, start: int, stop: int) -> List[str]:
+        # Text of pages [start, stop), one string per page.
+        raise NotImplementedError("Subclasses must implement extract_pages method")
+
+
+class PyPDF2Backend(PDFBackend):
+
+    name = 'pypdf2'
+    library = PyPDF2
+
+    @classmethod
+    def available(cls) -> bool:
+        return cls.library is not None
+
+    def page_count(self, file_path: str) -> int:
+        with open(file_path, 'rb') as handle:
+            return len(self.library.PdfReader(handle).pages)
+
+    def extract_pages(self, file_path: str, start: int, stop: int) -> List[str]:
+        with open(file_path, 'rb') as handle:
+            pages = self.library.PdfReader(handle).pages
+            return [pages[index].extract_text() or '' for index in range(start, min(stop, len(pages)))]
+
+
+class PypdfBackend(PyPDF2Backend):
+
+    # pypdf is the maintained successor of PyPDF2 with the same reader API.
+    name = 'pypdf'
+    library = pypdf
+
+
+class PdfminerBackend(PDFBackend):
+
+    name = 'pdfminer'
+
+    @classmethod
+    def available(cls) -> bool:
+        return pdfminer_extract_text is not None
+
+    def page_count(self, file_path: str) -> int:
+        with open(file_path, 'rb') as handle:
+            return sum(1 for _ in PDFPage.get_pages(handle))
+
+    def extract_pages(self, file_path: str, start: int, stop: int) -> List[str]:
+        # pdfminer ends every page with a form feed.
+        text = pdfminer_extract_text(file_path, page_numbers=range(start, stop))
+        pages = text.split('\f')
+        return pages[:-1] if pages and pages[-1] == '' else pages
+
+
+class Pypdfium2Backend(PDFBackend):
+
+    name = 'pypdfium2'
+
+    @classmethod
+    def available(cls) -> bool:
+        return pypdfium2 is not None
+
+    def page_count(self, file_path: str) -> int:
+        document = pypdfium2.PdfDocument(file_path)
+        try:
+            return len(document)
+        finally:
+            document.close()
+
+    def extract_pages(self, file_path: str, start: int, stop: int) -> List[str]:
+        document = pypdfium2.PdfDocument(file_path)
+        try:
+            pages = []
+            for index in range(start, min(stop, len(document))):
+                page = document[index]
+                text_page = page.get_textpage()
+                pages.append(text_page.get_text_range().replace('\r\n', '\n'))
+                text_page.close()
+                page.close()
+            return pages
+        finally:
+            document.close()
+
+
+PDF_BACKENDS: Dict[str, type] = {
+    backend.name: backend
+    for backend in (Pypdfium2Backend, PdfminerBackend, PypdfBackend, PyPDF2Backend)
+}
+# Fastest first, for RESUME_PDF_BACKEND=auto.
+BACKEND_PREFERENCE = ('pypdfium2', 'pypdf', 'pypdf2', 'pdfminer')
+
+
+def available_backends() -> List[str]:
+    return [name for name in BACKEND_PREFERENCE if PDF_BACKENDS[name].available()]
+
+
+def get_backend(name: str) -> PDFBackend:
+    backend = PDF_BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown PDF backend {name!r}; choose from {', '.join(PDF_BACKENDS)}")
+    if not backend.available():
+        raise ValueError(f"PDF backend {name!r} is not installed")
+    return backend()
+
+
+def benchmark_backends(file_paths: List[str], backends: Optional[List[str]] = None) -> Dict[str, float]:
+    """Seconds each backend needs for the given files; failing backends are left out."""
+    timings = {}
+    for name in backends or available_backends():
+        backend = get_backend(name)
+        started = time.perf_counter()
+        try:
+            for file_path in file_paths:
+                backend.extract_pages(file_path, 0, backend.page_count(file_path))
+        except Exception as e:
+            logger.warning('PDF backend %s failed during benchmark: %s', name, e)
+            continue
+        timings[name] = time.perf_counter() - started
+    return timings
+
+
+def benchmark_corpus() -> List[str]:
+    corpus = getattr(settings, 'RESUME_PDF_BENCHMARK_CORPUS', '')
+    if not corpus:
+        return []
+    return sorted(glob.glob(os.path.join(corpus, '**', '*.pdf'), recursive=True))[:20]
+
+
+@lru_cache(maxsize=1)
+def configured_backend_name() -> str:
+    """Backend named by RESUME_PDF_BACKEND, resolving ``auto`` and ``benchmark`` once per process."""
+    choice = getattr(settings, 'RESUME_PDF_BACKEND', 'auto')
+    installed = available_backends()
+    if choice == 'benchmark':
+        corpus = benchmark_corpus()
+        timings = benchmark_backends(corpus) if corpus else {}
+        if timings:
+            fastest = min(timings, key=timings.get)
+            logger.info('PDF backend benchmark on %d files: %s; using %s', len(corpus), timings, fastest)
+            return fastest
+        logger.warning('No PDF benchmark corpus at RESUME_PDF_BENCHMARK_CORPUS; choosing automatically')
+        choice = 'auto'
+    if choice == 'auto':
+        return installed[0]
+    get_backend(choice)
+    return choice
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def pool_workers() -> int:
+    return getattr(settings, 'RESUME_PDF_WORKERS', 0) or os.cpu_count() or 1
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # spawn: forking a process that runs threads (web server,
+                # background pool) can copy held locks into the child.
+                _pool = ProcessPoolExecutor(
+                    max_workers=pool_workers(),
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+    return _pool
+
+
+def _extract_range(backend_name: str, file_path: str, start: int, stop: int) -> List[str]:
+    return PDF_BACKENDS[backend_name]().extract_pages(file_path, start, stop)
+
+
+def extract_pdf_pages(
+    file_path: str,
+    backend_name: Optional[str] = None,
+    parallel_min_pages: Optional[int] = None,
+) -> List[str]:
+    """Text of every page, extracted in parallel page ranges for long documents."""
+    backend_name = backend_name or configured_backend_name()
+    backend = get_backend(backend_name)
+    if parallel_min_pages is None:
+        parallel_min_pages = getattr(settings, 'RESUME_PDF_PARALLEL_MIN_PAGES', 40)
+
+    page_count = backend.page_count(file_path)
+    if not parallel_min_pages or page_count < parallel_min_pages:
+        return backend.extract_pages(file_path, 0, page_count)
+
+    pool = _get_pool()
+    chunk = max(1, -(-page_count // pool_workers()))
+    futures = [
+        pool.submit(_extract_range, backend_name, file_path, start, min(start + chunk, page_count))
+        for start in range(0, page_count, chunk)
+    ]
+    pages: List[str] = []
+    for future in futures:
+        pages.extend(future.result())
+    return pages
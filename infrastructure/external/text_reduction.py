@@ -0,0 +1,176 @@
+"""
+Resume text reduction for LLM prompts.
+
+Raw text from PDF/DOCX parsers is full of non-breaking spaces, bullet glyphs
+and blank lines, and the interesting sections are not always near the top.
+``ResumeTextReducer`` normalizes the text, splits it into sections and builds
+a compact payload that fits a token budget while keeping the sections the
+extractor actually needs (contact block, skills, most recent experience).
+"""
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+# Rough average for English text with OpenAI-style tokenizers.
+CHARS_PER_TOKEN = 4
+
+# A line is a heading only when it is one of these keywords, optionally
+# followed by a colon or by "& ..." / "and ..." (e.g. "Skills & Tools"), so
+# content lines that merely mention a keyword are never mistaken for one.
+SECTION_KEYWORDS = {
+    'summary': (
+        'summary', 'professional summary', 'career summary', 'profile',
+        'professional profile', 'objective', 'career objective', 'about me',
+    ),
+    'experience': (
+        'experience', 'work experience', 'professional experience', 'relevant experience',
+        'employment', 'employment history', 'work history', 'career history',
+        'professional background',
+    ),
+    'skills': (
+        'skills', 'technical skills', 'key skills', 'core skills', 'competencies',
+        'core competencies', 'technologies', 'tech stack', 'technical expertise', 'tools',
+    ),
+    'education': ('education', 'academic background', 'academics', 'qualifications'),
+    'projects': ('projects',),
+    'certifications': ('certifications', 'certificates', 'licenses'),
+    'achievements': ('achievements', 'awards', 'honors', 'accomplishments'),
+}
+
+# Order in which sections are given budget, with the share of the total
+# budget each one may take in the first pass. Leftover budget is handed out
+# again in the same order.
+SECTION_PRIORITY = [
+    ('contact', 0.15),
+    ('skills', 0.30),
+    ('experience', 0.35),
+    ('summary', 0.10),
+    ('projects', 0.05),
+    ('education', 0.05),
+    ('certifications', 0.0),
+    ('achievements', 0.0),
+]
+
+EMAIL_PATTERN = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+PHONE_PATTERN = re.compile(r'\+?\(?\d[\d\s().-]{7,}\d')
+
+_DASHES = dict.fromkeys(map(ord, '\u2010\u2011\u2012\u2013\u2014\u2015\u2212'), '-')
+_BULLETS = re.compile(r'^[\u2022\u25cf\u25aa\u25a0\u2023\u2043\u2219\u27a2\uf0b7\uf0a7*\-]+\s*')
+_CONTROL = re.compile(r'[\u200b\u200c\u200d\ufeff]')
+_SPACES = re.compile(r'[ \t]+')
+_HEADINGS = {
+    name: re.compile(
+        r'^(?:{})(?:\s*(?:&|\band\b).*)?\s*:?$'.format('|'.join(map(re.escape, keywords)))
+    )
+    for name, keywords in SECTION_KEYWORDS.items()
+}
+
+
+@dataclass
+class ResumeSections:
+    """Resume text split by section name, in document order."""
+    sections: Dict[str, List[str]] = field(default_factory=dict)
+
+    def add(self, name: str, line: str) -> None:
+        self.sections.setdefault(name, []).append(line)
+
+
+class ResumeTextReducer:
+    """Builds a compact, token-budgeted prompt payload from resume text."""
+
+    def __init__(self, token_budget: int = 1000):
+        self.token_budget = token_budget
+
+    def reduce(self, text: str) -> str:
+        """Return the reduced payload for ``text``."""
+        lines = self.normalize(text)
+        sections = self.split_sections(lines)
+        return self._build_payload(sections)
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+    def normalize(self, text: str) -> List[str]:
+        """Normalize unicode, bullets and whitespace; drop empty lines."""
+        text = unicodedata.normalize('NFKC', text).translate(_DASHES)
+        lines = []
+        for raw_line in text.splitlines():
+            line = _CONTROL.sub(' ', raw_line)
+            line = _SPACES.sub(' ', line).strip()
+            line = _BULLETS.sub('- ', line) if _BULLETS.match(line) else line
+            if len(line.strip('-. ')) == 0:
+                continue
+            lines.append(line)
+        return lines
+
+    def split_sections(self, lines: List[str]) -> ResumeSections:
+        """Assign each line to a section based on the nearest heading above it."""
+        sections = ResumeSections()
+        current = 'contact'
+        for line in lines:
+            # Only recognised headings are consumed; anything else, including
+            # all-caps company names, stays in the current section.
+            heading = self._heading_name(line)
+            if heading:
+                current = heading
+                continue
+            # Contact details are often in a sidebar or footer rather than the header.
+            if current != 'contact' and (EMAIL_PATTERN.search(line) or self._is_phone_line(line)):
+                sections.add('contact', line)
+                continue
+            sections.add(current, line)
+        return sections
+
+    def _heading_name(self, line: str) -> str:
+        candidate = line.strip().lower()
+        words = candidate.split()
+        if not words or len(words) > 5 or len(candidate) > 50:
+            return ''
+        for name, pattern in _HEADINGS.items():
+            if pattern.match(candidate):
+                return name
+        return ''
+
+    @staticmethod
+    def _is_phone_line(line: str) -> bool:
+        match = PHONE_PATTERN.search(line)
+        return bool(match) and len(line) < 120 and sum(c.isdigit() for c in match.group()) >= 10
+
+    def _build_payload(self, sections: ResumeSections) -> str:
+        budget = self.token_budget * CHARS_PER_TOKEN
+        texts = {name: '\n'.join(lines) for name, lines in sections.sections.items()}
+
+        allowance = {name: 0 for name, _ in SECTION_PRIORITY}
+        remaining = budget
+        for name, share in SECTION_PRIORITY:
+            take = min(len(texts.get(name, '')), int(budget * share), remaining)
+            allowance[name] = take
+            remaining -= take
+        for name, _ in SECTION_PRIORITY:
+            if remaining <= 0:
+                break
+            extra = min(len(texts.get(name, '')) - allowance[name], remaining)
+            if extra > 0:
+                allowance[name] += extra
+                remaining -= extra
+
+        parts = []
+        for name, _ in SECTION_PRIORITY:
+            text = self._truncate(texts.get(name, ''), allowance[name])
+            if text:
+                parts.append(f'[{name.upper()}]\n{text}')
+        return '\n'.join(parts)
+
+    @staticmethod
+    def _truncate(text: str, limit: int) -> str:
+        """Cut ``text`` to ``limit`` characters, preferring a line boundary."""
+        if len(text) <= limit:
+            return text
+        cut = text[:limit]
+        newline = cut.rfind('\n')
+        if newline > limit // 2:
+            return cut[:newline]
+        return cut.rsplit(' ', 1)[0] if ' ' in cut else cut
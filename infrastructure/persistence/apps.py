@@ -9,3 +9,6 @@ class PersistenceConfig(AppConfig):
     name = 'infrastructure.persistence'
     label = 'persistence'
 
+    def ready(self):
+        from . import signals  # noqa: F401
+
@@ -0,0 +1,89 @@
+"""
+Incrementally maintained dashboard counters.
+
+Saves and deletes of counted rows call ``adjust_counters`` from signal
+handlers inside their transaction (bulk repository writes call it directly),
+so the counters always agree with the rows they describe and the dashboard
+reads a handful of rows instead of scanning every table. ``rebuild_counters``
+recomputes everything from scratch (see the ``rebuild_stats_counters``
+command) in case the counters were bypassed, e.g. by raw SQL.
+"""
+from collections import Counter
+from typing import Dict
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from .models import (
+    CandidateModel,
+    DocumentRequestModel,
+    DocumentSubmissionModel,
+    StatsCounterModel,
+)
+
+
+def candidate_status_key(status: str) -> str:
+    return f'candidates.status.{status}'
+
+
+def request_status_key(status: str) -> str:
+    return f'document_requests.status.{status}'
+
+
+def verification_status_key(status: str) -> str:
+    return f'document_submissions.status.{status}'
+
+
+CANDIDATES_TOTAL = 'candidates.total'
+REQUESTS_TOTAL = 'document_requests.total'
+SUBMISSIONS_TOTAL = 'document_submissions.total'
+
+
+def adjust_counters(deltas: Dict[str, int]) -> None:
+    """Apply ``deltas`` atomically; callers already inside a transaction join it."""
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    with transaction.atomic():
+        # Sorted keys give every writer the same lock order.
+        for key in sorted(deltas):
+            updated = StatsCounterModel.objects.filter(key=key).update(value=F('value') + deltas[key])
+            if not updated:
+                _, created = StatsCounterModel.objects.get_or_create(
+                    key=key, defaults={'value': deltas[key]},
+                )
+                if not created:
+                    StatsCounterModel.objects.filter(key=key).update(value=F('value') + deltas[key])
+
+
+def status_change(key_for, old_status: str, new_status: str) -> Dict[str, int]:
+    if old_status == new_status:
+        return {}
+    return {key_for(old_status): -1, key_for(new_status): 1}
+
+
+def read_counters() -> Dict[str, int]:
+    return dict(StatsCounterModel.objects.values_list('key', 'value'))
+
+
+def rebuild_counters() -> Dict[str, int]:
+    """Recompute every counter from the underlying tables."""
+    values = Counter()
+    sources = [
+        (CandidateModel, 'extraction_status', CANDIDATES_TOTAL, candidate_status_key),
+        (DocumentRequestModel, 'status', REQUESTS_TOTAL, request_status_key),
+        (DocumentSubmissionModel, 'verification_status', SUBMISSIONS_TOTAL, verification_status_key),
+    ]
+    with transaction.atomic():
+        for model, field, total_key, key_for in sources:
+            rows = model.objects.order_by().values(field).annotate(n=Count('pk'))
+            for row in rows:
+                values[key_for(row[field])] += row['n']
+                values[total_key] += row['n']
+            values.setdefault(total_key, 0)
+
+        StatsCounterModel.objects.all().delete()
+        StatsCounterModel.objects.bulk_create(
+            [StatsCounterModel(key=key, value=value) for key, value in values.items()]
+        )
+    return dict(values)
@@ -0,0 +1,121 @@
+"""
+Benchmark the installed PDF text backends and check that they agree.
+
+For every backend this times sequential and parallel (process pool)
+extraction over a corpus of PDFs, then checks two things:
+
+- parallel extraction returns exactly the pages sequential extraction does;
+- each backend's text matches the reference backend's closely enough, by
+  word-sequence similarity (backends differ in spacing and line breaks, so
+  exact equality is not expected).
+
+Any failure raises CommandError, so it can run in CI:
+
+    python manage.py bench_pdf_backends media/resumes --min-similarity 0.9
+"""
+import difflib
+import glob
+import os
+import re
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from infrastructure.external.pdf_backends import (
+    available_backends,
+    extract_pdf_pages,
+    get_backend,
+)
+
+
+def _words(text: str):
+    return re.findall(r'\w+', text.lower())
+
+
+class Command(BaseCommand):
+    help = 'Time the installed PDF backends on a corpus and check their output is equivalent.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', help='PDF files or directories (default: MEDIA_ROOT/resumes).')
+        parser.add_argument('--backends', help='Comma-separated backends (default: all installed).')
+        parser.add_argument('--reference', default='pypdf2', help='Backend the others are compared with.')
+        parser.add_argument('--min-similarity', type=float, default=0.9)
+        parser.add_argument(
+            '--parallel-min-pages', type=int, default=2,
+            help='Page threshold used for the parallel run (low, so the corpus exercises the pool).',
+        )
+
+    def handle(self, *args, **options):
+        files = self._corpus(options['paths'] or [os.path.join(settings.MEDIA_ROOT, 'resumes')])
+        if not files:
+            raise CommandError('No PDF files found.')
+        backends = options['backends'].split(',') if options['backends'] else available_backends()
+        reference = options['reference']
+        if reference not in backends:
+            backends.append(reference)
+        try:
+            for name in backends:
+                get_backend(name)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        total_pages = 0
+        outputs = {}
+        failures = []
+        for name in backends:
+            backend = get_backend(name)
+            sequential, parallel = {}, {}
+            started = time.perf_counter()
+            for path in files:
+                sequential[path] = backend.extract_pages(path, 0, backend.page_count(path))
+            sequential_time = time.perf_counter() - started
+
+            # Warm the pool first so worker start-up is not counted.
+            extract_pdf_pages(files[0], name, options['parallel_min_pages'])
+            started = time.perf_counter()
+            for path in files:
+                parallel[path] = extract_pdf_pages(path, name, options['parallel_min_pages'])
+            parallel_time = time.perf_counter() - started
+
+            pages = sum(len(result) for result in sequential.values())
+            total_pages = max(total_pages, pages)
+            self.stdout.write(
+                f'{name:>10}: sequential {sequential_time:7.2f}s ({pages / sequential_time:7.1f} pages/s), '
+                f'parallel {parallel_time:7.2f}s ({pages / parallel_time:7.1f} pages/s)'
+            )
+            for path in files:
+                if parallel[path] != sequential[path]:
+                    failures.append(f'{name}: parallel output differs from sequential for {path}')
+            outputs[name] = sequential
+
+        for name in backends:
+            if name == reference:
+                continue
+            for path in files:
+                similarity = difflib.SequenceMatcher(
+                    None,
+                    _words('\n'.join(outputs[reference][path])),
+                    _words('\n'.join(outputs[name][path])),
+                    autojunk=False,
+                ).ratio()
+                if similarity < options['min_similarity']:
+                    failures.append(f'{name}: {similarity:.3f} similar to {reference} for {path}')
+
+        for failure in failures:
+            self.stderr.write(f'FAIL {failure}')
+        if failures:
+            raise CommandError(f'{len(failures)} equivalence checks failed.')
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(files)} files, {total_pages} pages: all backends equivalent to {reference}.'
+        ))
+
+    @staticmethod
+    def _corpus(paths):
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                files.extend(sorted(glob.glob(os.path.join(path, '**', '*.pdf'), recursive=True)))
+            elif os.path.isfile(path):
+                files.append(path)
+        return files
@@ -0,0 +1,147 @@
+"""
+Concurrency benchmark for SQLite journal settings.
+
+Runs the same mixed workload (writer threads inserting candidate-like rows,
+reader threads running list/detail style queries) against a scratch database
+twice: once with SQLite defaults and once with ``SQLITE_PRAGMAS``. It reports
+throughput, lock errors and latency percentiles for each mode.
+"""
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+SCHEMA = """
+CREATE TABLE candidates (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    raw_extracted_data TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX candidates_created_idx ON candidates (created_at);
+"""
+
+
+class Command(BaseCommand):
+    help = 'Compare default and tuned SQLite settings under concurrent reads and writes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=4)
+        parser.add_argument('--readers', type=int, default=8)
+        parser.add_argument('--seconds', type=float, default=5.0)
+        parser.add_argument('--seed-rows', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        tuned = getattr(settings, 'SQLITE_PRAGMAS', {}) or {
+            'journal_mode': 'WAL', 'synchronous': 'NORMAL', 'busy_timeout': 5000,
+        }
+        modes = [
+            ('default', {}, 5.0, 'DEFERRED'),
+            ('tuned', tuned, tuned.get('busy_timeout', 5000) / 1000, 'IMMEDIATE'),
+        ]
+        for label, pragmas, timeout, isolation in modes:
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'bench.sqlite3')
+                self._seed(path, options['seed_rows'])
+                result = self._run(path, pragmas, timeout, isolation, options)
+            self._report(label, result, options['seconds'])
+
+    def _connect(self, path, pragmas, timeout, isolation):
+        # Default mode mirrors Django's stock sqlite settings (5s driver timeout,
+        # deferred transactions); the tuned mode uses the configured pragmas.
+        connection = sqlite3.connect(
+            path,
+            timeout=timeout,
+            isolation_level=isolation,
+            check_same_thread=False,
+        )
+        for name, value in pragmas.items():
+            connection.execute(f'PRAGMA {name} = {value}')
+        return connection
+
+    def _seed(self, path, rows):
+        connection = sqlite3.connect(path)
+        connection.executescript(SCHEMA)
+        connection.executemany(
+            'INSERT INTO candidates (name, email, raw_extracted_data, created_at) VALUES (?, ?, ?, ?)',
+            [(f'Seed {i}', f'seed{i}@example.com', '{}' * 50, time.time()) for i in range(rows)],
+        )
+        connection.commit()
+        connection.close()
+
+    def _run(self, path, pragmas, timeout, isolation, options):
+        stop = threading.Event()
+        lock = threading.Lock()
+        result = {'writes': [], 'reads': [], 'errors': 0}
+
+        def record(kind, started):
+            with lock:
+                result[kind].append((time.perf_counter() - started) * 1000)
+
+        def writer(worker):
+            connection = self._connect(path, pragmas, timeout, isolation)
+            counter = 0
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    with connection:
+                        connection.execute(
+                            'INSERT INTO candidates (name, email, raw_extracted_data, created_at) '
+                            'VALUES (?, ?, ?, ?)',
+                            (f'W{worker}-{counter}', f'w{worker}-{counter}@example.com', '{}' * 50, time.time()),
+                        )
+                    record('writes', started)
+                except sqlite3.OperationalError:
+                    with lock:
+                        result['errors'] += 1
+                counter += 1
+            connection.close()
+
+        def reader():
+            connection = self._connect(path, pragmas, timeout, isolation)
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    connection.execute(
+                        'SELECT id, name, email FROM candidates ORDER BY created_at DESC LIMIT 20'
+                    ).fetchall()
+                    connection.execute(
+                        'SELECT * FROM candidates WHERE id = ?', (random.randint(1, 1000),)
+                    ).fetchall()
+                    record('reads', started)
+                except sqlite3.OperationalError:
+                    with lock:
+                        result['errors'] += 1
+            connection.close()
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(options['writers'])]
+        threads += [threading.Thread(target=reader) for _ in range(options['readers'])]
+        for thread in threads:
+            thread.start()
+        time.sleep(options['seconds'])
+        stop.set()
+        for thread in threads:
+            thread.join()
+        return result
+
+    def _report(self, label, result, seconds):
+        def percentile(values, fraction):
+            if not values:
+                return 0.0
+            return statistics.quantiles(values, n=100)[int(fraction * 100) - 1] if len(values) > 1 else values[0]
+
+        self.stdout.write(
+            f'{label:>8}: {len(result["writes"]) / seconds:8.1f} writes/s '
+            f'(p95 {percentile(result["writes"], 0.95):6.1f} ms), '
+            f'{len(result["reads"]) / seconds:8.1f} reads/s '
+            f'(p95 {percentile(result["reads"], 0.95):6.1f} ms), '
+            f'{result["errors"]} lock errors'
+        )
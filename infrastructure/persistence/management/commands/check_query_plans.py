@@ -0,0 +1,108 @@
+"""
+Fail when a hot query stops using the index it was tuned for.
+
+Each entry below is one of the queries the API runs on every page load,
+built by the repositories themselves where they expose it, together with
+the index its plan must use. On SQLite the plan must also avoid a temporary
+B-tree for ORDER BY, which is what silently appears when an index no longer
+covers the sort. Run it in CI after migrations:
+
+    python manage.py check_query_plans
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from domains.candidates.value_objects import CandidateQuery, ExtractionStatus
+from infrastructure.persistence.models import (
+    CandidateModel,
+    DocumentRequestModel,
+    DocumentSubmissionModel,
+)
+from infrastructure.persistence.repositories import CandidateRepository
+
+
+def hot_queries():
+    """(label, queryset, index the plan must use, whether a sort step is acceptable)."""
+    candidates = CandidateRepository()
+    queries = [
+        (
+            'candidate list',
+            candidates.list_queryset(CandidateQuery(limit=20)),
+            'candidates_created_idx',
+            False,
+        ),
+        (
+            'candidates by extraction status',
+            candidates.list_queryset(CandidateQuery(extraction_status=ExtractionStatus.PENDING, limit=20)),
+            'candidates_status_created_idx',
+            False,
+        ),
+        (
+            # A range on the prefix index cannot also deliver created_at order;
+            # only the prefix matches are sorted, never the whole table.
+            'candidates by company prefix',
+            candidates.list_queryset(CandidateQuery(company_prefix='acme', limit=20)),
+            'candidates_comp_lower_idx',
+            True,
+        ),
+        (
+            'candidate by email',
+            CandidateModel.objects.filter(email='someone@example.com'),
+            'candidates_email_idx',
+            False,
+        ),
+        (
+            'document requests for candidate',
+            DocumentRequestModel.objects.filter(candidate_id=1),
+            'doc_requests_cand_created_idx',
+            False,
+        ),
+        (
+            'document submissions for candidate',
+            DocumentSubmissionModel.objects.filter(candidate_id=1),
+            'doc_subs_cand_uploaded_idx',
+            False,
+        ),
+    ]
+    sort_indexes = {
+        'created_at': 'candidates_created_idx',
+        'name': 'candidates_name_idx',
+        'extraction_confidence': 'candidates_confidence_idx',
+    }
+    for sort in CandidateQuery.SORT_KEYS:
+        queries.append((
+            f'candidate list sorted by {sort}',
+            candidates.list_queryset(CandidateQuery(sort=sort, limit=20)),
+            sort_indexes[sort.lstrip('-')],
+            False,
+        ))
+    return queries
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN the hot queries and fail if any of them no longer uses its index.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plans', action='store_true', help='Print every plan, not only failures.')
+
+    def handle(self, *args, **options):
+        failures = []
+        for label, queryset, index_name, sort_allowed in hot_queries():
+            plan = queryset.explain()
+            problems = []
+            if index_name not in plan:
+                problems.append(f'does not use {index_name}')
+            if connection.vendor == 'sqlite' and 'USE TEMP B-TREE' in plan and not sort_allowed:
+                problems.append('sorts with a temporary B-tree')
+
+            if problems:
+                failures.append(label)
+                self.stderr.write(f'FAIL {label}: {", ".join(problems)}\n{plan}')
+            else:
+                self.stdout.write(f'ok   {label}')
+                if options['verbose_plans']:
+                    self.stdout.write(plan)
+
+        if failures:
+            raise CommandError(f'{len(failures)} hot queries regressed: {", ".join(failures)}')
+        self.stdout.write(self.style.SUCCESS('All hot queries use their indexes.'))
@@ -0,0 +1,48 @@
+"""
+Deliver queued emails from the outbox table.
+"""
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from infrastructure.external.email_services import EmailOutboxWorker
+
+
+class Command(BaseCommand):
+    help = 'Send pending outbox emails in batches over one reused backend connection.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.EMAIL_OUTBOX_BATCH_SIZE)
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling for new emails instead of exiting once the outbox is empty.',
+        )
+        parser.add_argument('--interval', type=float, default=5.0, help='Seconds between polls in --loop mode.')
+
+    def handle(self, *args, **options):
+        worker = EmailOutboxWorker(
+            batch_size=options['batch_size'],
+            max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+            retry_base_seconds=settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS,
+        )
+        totals = {'sent': 0, 'retry': 0, 'failed': 0}
+        try:
+            while True:
+                result = worker.drain_once()
+                for key, value in result.items():
+                    totals[key] += value
+                if any(result.values()):
+                    self.stdout.write(
+                        f"sent={result['sent']} retry={result['retry']} failed={result['failed']}"
+                    )
+                    continue
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(
+            f"Done: sent={totals['sent']} retry={totals['retry']} failed={totals['failed']}"
+        ))
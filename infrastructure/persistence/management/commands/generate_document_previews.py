@@ -0,0 +1,51 @@
+"""
+Generate thumbnails and previews for document submissions that lack them.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.db.models import Q
+
+from infrastructure.external.document_previews import PillowDocumentPreviewGenerator
+from infrastructure.persistence.models import DocumentSubmissionModel
+
+
+class Command(BaseCommand):
+    help = 'Backfill thumbnail and preview images for submitted documents.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Regenerate derivatives that already exist.')
+        parser.add_argument('--workers', type=int, default=4)
+        parser.add_argument('--chunk-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        generator = PillowDocumentPreviewGenerator()
+        queryset = DocumentSubmissionModel.objects.exclude(document_file='')
+        if not options['force']:
+            queryset = queryset.filter(Q(thumbnail='') | Q(preview=''))
+        ids = queryset.order_by('pk').values_list('pk', flat=True).iterator(chunk_size=options['chunk_size'])
+
+        def generate(submission_id):
+            close_old_connections()
+            try:
+                return submission_id, generator.generate(submission_id, force=options['force']), None
+            except Exception as e:
+                return submission_id, False, e
+            finally:
+                close_old_connections()
+
+        generated = skipped = failed = 0
+        with ThreadPoolExecutor(max_workers=options['workers']) as pool:
+            for submission_id, written, error in pool.map(generate, list(ids)):
+                if error is not None:
+                    failed += 1
+                    self.stderr.write(f'Submission {submission_id}: {error}')
+                elif written:
+                    generated += 1
+                else:
+                    skipped += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated previews for {generated} submissions; {skipped} skipped, {failed} failed.'
+        ))
@@ -0,0 +1,56 @@
+"""
+Bulk-load pre-extracted candidates from a CSV or NDJSON file.
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from applications.candidates.use_cases import ImportCandidatesUseCase
+from infrastructure.external.candidate_import import (
+    IMPORT_FORMATS,
+    detect_format,
+    iter_candidate_records,
+)
+from infrastructure.persistence.repositories import CandidateRepository
+
+
+class Command(BaseCommand):
+    help = 'Import candidates (name, email, phone, company, designation, skills, confidence) from CSV or NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=IMPORT_FORMATS, help='Defaults to detection by extension/content.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--max-errors', type=int, default=100, help='How many failed records to list.')
+
+    def handle(self, *args, **options):
+        try:
+            source = open(options['path'], 'rb')
+        except OSError as e:
+            raise CommandError(str(e))
+
+        started = time.perf_counter()
+
+        def progress(result):
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'{result.processed} records ({result.processed / elapsed:.0f}/s): '
+                f'{result.created} created, {result.updated} updated, {result.failed} failed'
+            )
+
+        with source:
+            file_format = options['format'] or detect_format(options['path'], source.peek(64)[:64])
+            use_case = ImportCandidatesUseCase(
+                candidate_repository=CandidateRepository(),
+                batch_size=options['batch_size'],
+                max_errors=options['max_errors'],
+            )
+            result = use_case.execute(iter_candidate_records(source, file_format), progress=progress)
+
+        for error in result.errors:
+            self.stderr.write(f'line {error.line}: {error.error}')
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {result.processed} records in {elapsed:.1f}s: '
+            f'{result.created} created, {result.updated} updated, {result.failed} failed.'
+        ))
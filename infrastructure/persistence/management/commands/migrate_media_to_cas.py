@@ -0,0 +1,72 @@
+"""
+Move existing resume and document files into content-addressed storage.
+"""
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+
+from infrastructure.persistence.models import CandidateModel, DocumentSubmissionModel
+
+
+FILE_FIELDS = [
+    (CandidateModel, 'resume_file'),
+    (DocumentSubmissionModel, 'document_file'),
+]
+
+
+class Command(BaseCommand):
+    help = 'Re-store flat media files by content hash and point model rows at the new names.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report what would move without changing anything.')
+        parser.add_argument(
+            '--keep-originals',
+            action='store_true',
+            help='Leave the old flat files in place after their rows are updated.',
+        )
+        parser.add_argument('--chunk-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        storage = default_storage
+        if not hasattr(storage, 'is_content_addressed'):
+            raise CommandError('The default storage is not ContentAddressedStorage; enable CONTENT_ADDRESSED_STORAGE first.')
+
+        moved = missing = skipped = 0
+        for model, field_name in FILE_FIELDS:
+            queryset = (
+                model.objects.exclude(**{field_name: ''})
+                .order_by('pk')
+                .values_list('pk', field_name)
+            )
+            for pk, name in queryset.iterator(chunk_size=options['chunk_size']):
+                if storage.is_content_addressed(name):
+                    skipped += 1
+                    continue
+                if not storage.exists(name):
+                    missing += 1
+                    self.stderr.write(f'{model.__name__} {pk}: missing file {name}')
+                    continue
+                if options['dry_run']:
+                    moved += 1
+                    self.stdout.write(f'{model.__name__} {pk}: would move {name}')
+                    continue
+
+                with storage.open(name, 'rb') as content:
+                    new_name = storage.save(name, content)
+                # update() keeps updated_at/auto_now fields untouched
+                model.objects.filter(pk=pk).update(**{field_name: new_name})
+                moved += 1
+                self.stdout.write(f'{model.__name__} {pk}: {name} -> {new_name}')
+
+                if not options['keep_originals'] and not self._still_referenced(name):
+                    storage.delete(name)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{"Would move" if options["dry_run"] else "Moved"} {moved} files; '
+            f'{skipped} already content-addressed, {missing} missing.'
+        ))
+
+    def _still_referenced(self, name: str) -> bool:
+        return any(
+            model.objects.filter(**{field_name: name}).exists()
+            for model, field_name in FILE_FIELDS
+        )
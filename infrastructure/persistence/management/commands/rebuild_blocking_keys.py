@@ -0,0 +1,41 @@
+"""
+Recompute duplicate-detection keys for every candidate.
+"""
+from django.core.management.base import BaseCommand
+
+from domains.candidates.domain_services import BlockingKeyGenerator
+from infrastructure.persistence.models import CandidateModel
+
+
+KEY_FIELDS = ['email_key', 'phone_key', 'name_key']
+
+
+class Command(BaseCommand):
+    help = 'Backfill or refresh the email/phone/name blocking keys on candidates.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        queryset = CandidateModel.objects.order_by('pk').only('pk', 'name', 'email', 'phone', *KEY_FIELDS)
+
+        changed, scanned, batch = 0, 0, []
+        for model in queryset.iterator(chunk_size=chunk_size):
+            scanned += 1
+            keys = BlockingKeyGenerator.generate(model.name, model.email, model.phone)
+            if (model.email_key, model.phone_key, model.name_key) == (keys.email_key, keys.phone_key, keys.name_key):
+                continue
+            model.email_key = keys.email_key
+            model.phone_key = keys.phone_key
+            model.name_key = keys.name_key
+            batch.append(model)
+            if len(batch) >= chunk_size:
+                CandidateModel.objects.bulk_update(batch, KEY_FIELDS)
+                changed += len(batch)
+                batch = []
+        if batch:
+            CandidateModel.objects.bulk_update(batch, KEY_FIELDS)
+            changed += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'Scanned {scanned} candidates; updated keys on {changed}.'))
@@ -0,0 +1,98 @@
+"""
+Recount content-addressed file references from the model file fields.
+
+Reference counts can drift when a file is stored but the row that would
+have held it is never saved, or when a row is changed with update(). This
+sets every ``StoredFileModel.ref_count`` to the number of rows that actually
+name the file, deletes files nothing references, and adds records for
+referenced files that have none. Content-addressed files on disk without a
+record (left behind by rolled-back saves) are removed as well.
+
+Run it while no uploads are in progress: a file stored by a request whose
+row is not committed yet has no reference to count.
+"""
+import os
+from collections import Counter
+
+from django.core.files.storage import FileSystemStorage, storages
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from infrastructure.persistence.models import StoredFileModel
+from infrastructure.persistence.signals import FILE_FIELDS
+from infrastructure.persistence.storage import CONTENT_ADDRESSED_NAME
+
+
+class Command(BaseCommand):
+    help = 'Recount content-addressed file references and remove unreferenced files.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report drift without changing anything.')
+
+    def handle(self, *args, **options):
+        storage = storages['default']
+        if not hasattr(storage, 'is_content_addressed'):
+            raise CommandError('The default storage is not ContentAddressedStorage; nothing to reconcile.')
+        dry_run = options['dry_run']
+
+        references = Counter()
+        for model, field_names in FILE_FIELDS.items():
+            for field_name in field_names:
+                names = model.objects.exclude(**{field_name: ''}).values_list(field_name, flat=True)
+                references.update(name for name in names.iterator() if storage.is_content_addressed(name))
+
+        recounted = unreferenced = added = 0
+        with transaction.atomic():
+            for stored in StoredFileModel.objects.select_for_update().order_by('pk'):
+                count = references.pop(stored.name, 0)
+                if count == stored.ref_count:
+                    continue
+                self.stdout.write(f'{stored.name}: {stored.ref_count} -> {count} references')
+                if not count:
+                    unreferenced += 1
+                    if not dry_run:
+                        stored.delete()
+                        transaction.on_commit(lambda name=stored.name: self._remove(storage, name))
+                    continue
+                recounted += 1
+                if not dry_run:
+                    StoredFileModel.objects.filter(pk=stored.pk).update(ref_count=count)
+
+            # Referenced files without a record; only those still on disk can be kept.
+            for name, count in sorted(references.items()):
+                if not storage.exists(name):
+                    self.stderr.write(f'{name}: referenced {count} times but missing')
+                    continue
+                self.stdout.write(f'{name}: no record, {count} references')
+                added += 1
+                if not dry_run:
+                    digest = os.path.splitext(os.path.basename(name))[0]
+                    StoredFileModel.objects.create(
+                        name=name, content_hash=digest, size=storage.size(name), ref_count=count,
+                    )
+
+        recorded = set(StoredFileModel.objects.values_list('name', flat=True))
+        orphans = [name for name in self._content_addressed_files(storage) if name not in recorded]
+        for name in orphans:
+            self.stdout.write(f'{name}: on disk without a record')
+            if not dry_run:
+                self._remove(storage, name)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{"Would recount" if dry_run else "Recounted"} {recounted} files, '
+            f'{"would remove" if dry_run else "removed"} {unreferenced} unreferenced and '
+            f'{len(orphans)} unrecorded files, {"would add" if dry_run else "added"} {added} records.'
+        ))
+
+    @staticmethod
+    def _remove(storage, name: str) -> None:
+        # The plain file system delete; the reference counting is what is being repaired.
+        FileSystemStorage.delete(storage, name)
+
+    @staticmethod
+    def _content_addressed_files(storage):
+        for directory, _, files in os.walk(storage.location):
+            for filename in files:
+                path = os.path.relpath(os.path.join(directory, filename), storage.location).replace(os.sep, '/')
+                if CONTENT_ADDRESSED_NAME.search(path):
+                    yield path
@@ -0,0 +1,143 @@
+"""
+Run the current resume data extractor again over stored candidates.
+
+Use it after changing ``OPENROUTER_MODEL`` or bumping
+``RESUME_EXTRACTION_PROMPT_VERSION``:
+
+    python manage.py reextract --outdated
+    python manage.py reextract --status failed --workers 8
+    python manage.py reextract --extractor-version basic:1 --max-confidence 0.5
+
+Candidates are processed in id order on a worker pool. After every batch the
+highest finished id is written to the checkpoint file, so an interrupted run
+picks up where it stopped when started again with the same selection. LLM
+calls go through the shared governor (``LLM_MAX_CONCURRENCY``,
+``LLM_RATE_PER_SECOND``), which caps request rate regardless of ``--workers``.
+
+Resume text stored at upload (or by an earlier run) is used instead of
+parsing the file again, unless ``--reparse`` is given.
+"""
+import json
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from applications.candidates.use_cases import ReextractCandidatesUseCase
+from domains.candidates.value_objects import ExtractionStatus, ReextractionSelection
+from infrastructure.external.ai_services import OpenRouterResumeDataExtractor
+from infrastructure.external.file_parsers import ResumeFileTextExtractor
+from infrastructure.persistence.repositories import CandidateRepository, ResumeTextRepository
+
+
+DEFAULT_CHECKPOINT = '.reextract-checkpoint.json'
+
+
+class Command(BaseCommand):
+    help = 'Re-extract candidate data from stored resumes with the current extractor, resumably.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--status', action='append', choices=[status.value for status in ExtractionStatus],
+            help='Extraction status to select (repeatable). Defaults to completed and failed.',
+        )
+        parser.add_argument(
+            '--extractor-version', action='append', dest='versions', default=[],
+            help='Only candidates extracted by this extractor version (repeatable; "" for unversioned).',
+        )
+        parser.add_argument(
+            '--outdated', action='store_true',
+            help='Only candidates not already extracted by the current extractor version.',
+        )
+        parser.add_argument('--max-confidence', type=float, help='Only candidates at or below this confidence.')
+        parser.add_argument('--workers', type=int, default=settings.REEXTRACT_WORKERS)
+        parser.add_argument('--batch-size', type=int, help='Candidates per checkpoint (default: 4 x workers).')
+        parser.add_argument('--limit', type=int, help='Stop after this many candidates.')
+        parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT, help='Checkpoint file path.')
+        parser.add_argument('--restart', action='store_true', help='Ignore an existing checkpoint.')
+        parser.add_argument(
+            '--accept-fallback', action='store_true',
+            help='Store fallback (regex) results when the LLM is unavailable instead of keeping existing data.',
+        )
+        parser.add_argument('--reparse', action='store_true', help='Parse resume files even when their text is stored.')
+
+    def handle(self, *args, **options):
+        data_extractor = OpenRouterResumeDataExtractor()
+        statuses = options['status'] or [ExtractionStatus.COMPLETED.value, ExtractionStatus.FAILED.value]
+        try:
+            selection = ReextractionSelection(
+                statuses=tuple(ExtractionStatus(status) for status in statuses),
+                versions=tuple(options['versions']),
+                exclude_version=data_extractor.version if options['outdated'] else None,
+                max_confidence=options['max_confidence'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        if not data_extractor.client:
+            self.stderr.write('OPENROUTER_API_KEY is not set; every candidate will fall back to regex extraction.')
+
+        checkpoint_path = options['checkpoint']
+        after_id = 0 if options['restart'] else self._load_checkpoint(checkpoint_path, selection)
+        if after_id:
+            self.stdout.write(f'Resuming after candidate {after_id} from {checkpoint_path}')
+
+        use_case = ReextractCandidatesUseCase(
+            candidate_repository=CandidateRepository(),
+            text_extractor=ResumeFileTextExtractor(),
+            data_extractor=data_extractor,
+            workers=options['workers'],
+            batch_size=options['batch_size'],
+            accept_fallback=options['accept_fallback'],
+            resume_text_repository=ResumeTextRepository(),
+            reparse=options['reparse'],
+        )
+        started = time.perf_counter()
+
+        def progress(result):
+            self._save_checkpoint(checkpoint_path, selection, data_extractor.version, result.last_id)
+            self.stdout.write(self._summary(result, time.perf_counter() - started))
+
+        self.stdout.write(f'Extractor version {data_extractor.version}, {use_case.workers} workers')
+        try:
+            result = use_case.execute(selection, after_id=after_id, limit=options['limit'], progress=progress)
+        except KeyboardInterrupt:
+            raise CommandError(f'Interrupted; run again to resume from {checkpoint_path}.')
+
+        self.stdout.write(self.style.SUCCESS(f'Done. {self._summary(result, time.perf_counter() - started)}'))
+        if options['limit'] is None and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+    @staticmethod
+    def _summary(result, elapsed: float) -> str:
+        rate = result.processed / elapsed if elapsed else 0.0
+        return (
+            f'{result.processed} candidates in {elapsed:.1f}s ({rate:.2f}/s): '
+            f'{result.updated} updated, {result.fell_back} fell back, '
+            f'{result.failed} failed, {result.skipped} skipped; last id {result.last_id}'
+        )
+
+    @staticmethod
+    def _load_checkpoint(path: str, selection: ReextractionSelection) -> int:
+        try:
+            with open(path) as handle:
+                checkpoint = json.load(handle)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Unreadable checkpoint {path}: {e}')
+        if checkpoint.get('selection') != selection.describe():
+            raise CommandError(
+                f'{path} belongs to a different selection {checkpoint.get("selection")}; '
+                'use --restart or another --checkpoint.'
+            )
+        return int(checkpoint.get('last_id', 0))
+
+    @staticmethod
+    def _save_checkpoint(path: str, selection: ReextractionSelection, version: str, last_id: int) -> None:
+        # Written to a temporary file and renamed, so a crash mid-write never
+        # leaves a truncated checkpoint behind.
+        temporary = f'{path}.tmp'
+        with open(temporary, 'w') as handle:
+            json.dump({'selection': selection.describe(), 'extractor_version': version, 'last_id': last_id}, handle)
+        os.replace(temporary, path)
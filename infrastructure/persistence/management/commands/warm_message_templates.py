@@ -0,0 +1,41 @@
+"""
+Build the document request template pools ahead of the first request.
+
+Pools are only used with DOCUMENT_REQUEST_MESSAGE_MODE=template, or for
+requests made with use_ai=false.
+
+Pools are written to the default cache, so this only helps the web workers
+when that cache is shared between processes.
+"""
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+
+from infrastructure.external.ai_services import OpenRouterDocumentRequestGenerator
+
+
+class Command(BaseCommand):
+    help = 'Generate and cache document request templates for every request type and channel.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='Build new pools even where cached ones exist.',
+        )
+
+    def handle(self, *args, **options):
+        if isinstance(caches['default'], (LocMemCache, DummyCache)):
+            raise CommandError(
+                'The default cache is local to this process, so the web workers would not see '
+                'the templates. Configure a shared cache backend (CACHES) first.'
+            )
+        sizes = OpenRouterDocumentRequestGenerator().warm_templates(refresh=options['refresh'])
+        for (request_type, channel), size in sizes.items():
+            if size:
+                self.stdout.write(f'{request_type}/{channel}: {size} templates')
+            else:
+                self.stdout.write(self.style.WARNING(
+                    f'{request_type}/{channel}: no valid templates, fallback will be used'
+                ))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 06:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidatemodel',
+            name='extraction_provisional',
+            field=models.BooleanField(default=False),
+        ),
+    ]
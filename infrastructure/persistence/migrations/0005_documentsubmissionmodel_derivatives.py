@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-19 06:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0004_storedfilemodel'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentsubmissionmodel',
+            name='preview',
+            field=models.ImageField(blank=True, upload_to='documents/previews/'),
+        ),
+        migrations.AddField(
+            model_name='documentsubmissionmodel',
+            name='thumbnail',
+            field=models.ImageField(blank=True, upload_to='documents/thumbnails/'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 06:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0005_documentsubmissionmodel_derivatives'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentsubmissionmodel',
+            name='original_file_path',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+    ]
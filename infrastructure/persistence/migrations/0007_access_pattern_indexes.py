@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-19 06:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0006_documentsubmissionmodel_original_file_path'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(fields=['-created_at'], name='candidates_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(fields=['extraction_status', '-created_at'], name='candidates_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(fields=['email', '-created_at'], name='candidates_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='documentrequestmodel',
+            index=models.Index(fields=['candidate', '-created_at'], name='doc_requests_cand_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='documentsubmissionmodel',
+            index=models.Index(fields=['candidate', '-uploaded_at'], name='doc_subs_cand_uploaded_idx'),
+        ),
+    ]
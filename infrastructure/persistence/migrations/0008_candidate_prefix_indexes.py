@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-19 06:45
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0007_access_pattern_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(django.db.models.functions.text.Lower('company'), name='candidates_comp_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(django.db.models.functions.text.Lower('designation'), name='candidates_desig_lower_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.8 on 2026-10-19 06:46
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def seed_counters(apps, schema_editor):
+    StatsCounterModel = apps.get_model('persistence', 'StatsCounterModel')
+    sources = [
+        ('CandidateModel', 'extraction_status', 'candidates'),
+        ('DocumentRequestModel', 'status', 'document_requests'),
+        ('DocumentSubmissionModel', 'verification_status', 'document_submissions'),
+    ]
+    counters = []
+    for model_name, field, prefix in sources:
+        model = apps.get_model('persistence', model_name)
+        total = 0
+        for row in model.objects.order_by().values(field).annotate(n=Count('pk')):
+            counters.append(StatsCounterModel(key=f'{prefix}.status.{row[field]}', value=row['n']))
+            total += row['n']
+        counters.append(StatsCounterModel(key=f'{prefix}.total', value=total))
+    StatsCounterModel.objects.bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0008_candidate_prefix_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatsCounterModel',
+            fields=[
+                ('key', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'stats_counters',
+            },
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.8 on 2026-10-19 06:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0009_statscountermodel'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidatemodel',
+            name='email_key',
+            field=models.CharField(blank=True, max_length=254),
+        ),
+        migrations.AddField(
+            model_name='candidatemodel',
+            name='name_key',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='candidatemodel',
+            name='phone_key',
+            field=models.CharField(blank=True, max_length=16),
+        ),
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(fields=['email_key'], name='candidates_email_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(fields=['phone_key'], name='candidates_phone_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(fields=['name_key'], name='candidates_name_key_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-19 06:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0010_candidate_blocking_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidatemodel',
+            name='extractor_version',
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(fields=['extractor_version', 'id'], name='candidates_extractor_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-19 06:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0011_candidate_extractor_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeTextModel',
+            fields=[
+                ('candidate', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='resume_text', serialize=False, to='persistence.candidatemodel')),
+                ('codec', models.CharField(max_length=10)),
+                ('data', models.BinaryField()),
+                ('text_length', models.PositiveIntegerField(default=0)),
+                ('source_name', models.CharField(blank=True, max_length=255)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'resume_texts',
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-19 07:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0012_resume_texts'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='candidatemodel',
+            name='candidates_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='candidatemodel',
+            name='candidates_status_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(fields=['-created_at', '-id'], name='candidates_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(fields=['extraction_status', '-created_at', '-id'], name='candidates_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(fields=['name', 'id'], name='candidates_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(fields=['extraction_confidence', 'id'], name='candidates_confidence_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 07:21
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0013_candidate_sort_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='candidatemodel',
+            index=models.Index(django.db.models.functions.text.Lower('email'), name='candidates_email_lower_idx'),
+        ),
+    ]
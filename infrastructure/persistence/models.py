@@ -1,8 +1,24 @@
-from django.db import models
+from django.db import models, router, transaction
 from django.core.validators import FileExtensionValidator
+from django.db.models.functions import Lower
+from django.utils import timezone
 
 
-class CandidateModel(models.Model):
+class CountedModel(models.Model):
+    # Rows behind the dashboard counters. The counter signal handlers run
+    # during save(), so the save is made atomic: a plain save() outside a
+    # transaction then commits or rolls back the row and its counters together.
+    
+    class Meta:
+        abstract = True
+    
+    def save(self, *args, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+
+
+class CandidateModel(CountedModel):
     
     name = models.CharField(max_length=255, blank=True)
     email = models.EmailField(blank=True)
@@ -30,6 +46,14 @@ class CandidateModel(models.Model):
     )
     extraction_confidence = models.FloatField(default=0.0, null=True, blank=True)
     raw_extracted_data = models.JSONField(default=dict, blank=True)
+    # True while the stored data is a fast local extraction awaiting the LLM result
+    extraction_provisional = models.BooleanField(default=False)
+    # Extractor (model + prompt revision) that produced the stored data.
+    extractor_version = models.CharField(max_length=100, blank=True)
+    # Normalized duplicate-detection keys (see BlockingKeyGenerator).
+    email_key = models.CharField(max_length=254, blank=True)
+    phone_key = models.CharField(max_length=16, blank=True)
+    name_key = models.CharField(max_length=255, blank=True)
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
@@ -38,12 +62,29 @@ class CandidateModel(models.Model):
     class Meta:
         db_table = 'candidates'
         ordering = ['-created_at']
+        indexes = [
+            # Every list sort key is followed by id as the tie-breaker (see
+            # CandidateRepository.list_queryset), so each index ends with id.
+            models.Index(fields=['-created_at', '-id'], name='candidates_created_idx'),
+            models.Index(fields=['extraction_status', '-created_at', '-id'], name='candidates_status_created_idx'),
+            models.Index(fields=['name', 'id'], name='candidates_name_idx'),
+            models.Index(fields=['extraction_confidence', 'id'], name='candidates_confidence_idx'),
+            models.Index(fields=['email', '-created_at'], name='candidates_email_idx'),
+            # Import upserts match emails case-insensitively.
+            models.Index(Lower('email'), name='candidates_email_lower_idx'),
+            models.Index(Lower('company'), name='candidates_comp_lower_idx'),
+            models.Index(Lower('designation'), name='candidates_desig_lower_idx'),
+            models.Index(fields=['email_key'], name='candidates_email_key_idx'),
+            models.Index(fields=['phone_key'], name='candidates_phone_key_idx'),
+            models.Index(fields=['name_key'], name='candidates_name_key_idx'),
+            models.Index(fields=['extractor_version', 'id'], name='candidates_extractor_idx'),
+        ]
     
     def __str__(self) -> str:
         return f"{self.name or 'Unknown'} - {self.email or 'No email'}"
 
 
-class DocumentRequestModel(models.Model):
+class DocumentRequestModel(CountedModel):
     
     candidate = models.ForeignKey(
         CandidateModel,
@@ -84,12 +125,15 @@ class DocumentRequestModel(models.Model):
     class Meta:
         db_table = 'document_requests'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['candidate', '-created_at'], name='doc_requests_cand_created_idx'),
+        ]
     
     def __str__(self) -> str:
         return f"Document request for {self.candidate.name} - {self.status}"
 
 
-class DocumentSubmissionModel(models.Model):
+class DocumentSubmissionModel(CountedModel):
     
     candidate = models.ForeignKey(
         CandidateModel,
@@ -107,6 +151,11 @@ class DocumentSubmissionModel(models.Model):
         upload_to='documents/',
         validators=[FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'pdf'])],
     )
+    # Untouched upload in the originals storage, when originals are kept.
+    original_file_path = models.CharField(max_length=255, blank=True)
+    # Downscaled derivatives generated in the background; blank until ready.
+    thumbnail = models.ImageField(upload_to='documents/thumbnails/', blank=True)
+    preview = models.ImageField(upload_to='documents/previews/', blank=True)
     verification_status = models.CharField(
         max_length=20,
         choices=[
@@ -121,7 +170,100 @@ class DocumentSubmissionModel(models.Model):
     class Meta:
         db_table = 'document_submissions'
         ordering = ['-uploaded_at']
+        indexes = [
+            models.Index(fields=['candidate', '-uploaded_at'], name='doc_subs_cand_uploaded_idx'),
+        ]
     
     def __str__(self) -> str:
         return f"{self.document_type} for {self.candidate.name}"
 
+
+
+class EmailOutboxModel(models.Model):
+    
+    # Written in the same transaction as the document request; delivered by
+    # the drain_email_outbox worker.
+    to_email = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ('pending', 'Pending'),
+            ('sending', 'Sending'),
+            ('sent', 'Sent'),
+            ('failed', 'Failed'),
+        ],
+        default='pending',
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claim_token = models.CharField(max_length=32, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'email_outbox'
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='email_outbox_due_idx'),
+        ]
+    
+    def __str__(self) -> str:
+        return f"Email to {self.to_email} - {self.status}"
+
+
+class StoredFileModel(models.Model):
+    
+    # Reference counts for files written by ContentAddressedStorage
+    name = models.CharField(max_length=255, unique=True)
+    content_hash = models.CharField(max_length=64, db_index=True)
+    size = models.BigIntegerField(default=0)
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'stored_files'
+    
+    def __str__(self) -> str:
+        return f"{self.name} ({self.ref_count} refs)"
+
+
+class StatsCounterModel(models.Model):
+    
+    # Dashboard counters, adjusted in the same transaction as the writes they
+    # count (see infrastructure/persistence/counters.py).
+    key = models.CharField(max_length=100, primary_key=True)
+    value = models.BigIntegerField(default=0)
+    
+    class Meta:
+        db_table = 'stats_counters'
+    
+    def __str__(self) -> str:
+        return f"{self.key} = {self.value}"
+
+
+class ResumeTextModel(models.Model):
+    
+    # Extracted resume text, compressed (see text_compression.py). Kept out of
+    # the candidates table so list and detail queries never read it.
+    candidate = models.OneToOneField(
+        CandidateModel,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='resume_text',
+    )
+    codec = models.CharField(max_length=10)
+    data = models.BinaryField()
+    text_length = models.PositiveIntegerField(default=0)
+    # Resume file the text was parsed from; a different file makes it stale.
+    source_name = models.CharField(max_length=255, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'resume_texts'
+    
+    def __str__(self) -> str:
+        return f"Resume text for candidate {self.candidate_id} ({self.codec}, {len(self.data)} bytes)"
@@ -1,6 +1,11 @@
 
-from typing import List, Optional
+import string
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+from django.db import connection, transaction
+from django.utils import timezone
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Lower
 from domains.candidates.entities import (
     Candidate,
     DocumentRequest,
@@ -13,17 +18,41 @@ from domains.candidates.value_objects import (
     DocumentType,
     RequestStatus,
     VerificationStatus,
+    CandidateQuery,
+    ReextractionSelection,
 )
+from domains.candidates.domain_services import BlockingKeyGenerator
 from domains.candidates.interfaces import (
     ICandidateRepository,
     IDocumentRequestRepository,
     IDocumentSubmissionRepository,
+    IResumeTextRepository,
+    IStatsRepository,
 )
 from .models import (
     CandidateModel,
     DocumentRequestModel,
     DocumentSubmissionModel,
+    ResumeTextModel,
 )
+from .text_compression import compress_text, decompress_text
+from .counters import (
+    CANDIDATES_TOTAL,
+    REQUESTS_TOTAL,
+    adjust_counters,
+    read_counters,
+    candidate_status_key,
+    request_status_key,
+)
+
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _ascii_lower(value: str) -> str:
+    # SQLite's LOWER() folds ASCII letters only; lowering values the same way
+    # keeps comparisons against Lower() expressions (and their indexes) exact.
+    return value.translate(_ASCII_LOWER)
 
 
 class CandidateRepository(ICandidateRepository):
@@ -44,6 +73,9 @@ class CandidateRepository(ICandidateRepository):
             extraction_status=candidate.extraction_status.value,
             extraction_confidence=candidate.extraction_confidence,
             raw_extracted_data=candidate.raw_extracted_data,
+            extraction_provisional=candidate.extraction_provisional,
+            extractor_version=candidate.extractor_version,
+            **self._blocking_keys(candidate),
         )
         return self._to_entity(model)
     
@@ -54,15 +86,196 @@ class CandidateRepository(ICandidateRepository):
         except CandidateModel.DoesNotExist:
             return None
     
+    def get_by_ids(self, candidate_ids: List[int]) -> List[Candidate]:
+        # in_bulk splits the IN clause to stay under the backend's parameter limit
+        models = CandidateModel.objects.in_bulk(candidate_ids)
+        return [self._to_entity(models[pk]) for pk in candidate_ids if pk in models]
+    
     def get_all(self) -> List[Candidate]:
         models = CandidateModel.objects.all()
         return [self._to_entity(m) for m in models]
     
+    def find(self, query: CandidateQuery) -> List[Candidate]:
+        return [self._to_entity(m) for m in self.list_queryset(query)]
+    
+    def list_queryset(self, query: CandidateQuery):
+        # The id tie-breaker runs in the sort's direction, so one index per sort
+        # key (ending in id) serves both directions without a temp B-tree.
+        tie_breaker = '-id' if query.sort.startswith('-') else 'id'
+        queryset = self._filtered(query).order_by(query.sort, tie_breaker)
+        if query.limit is not None:
+            return queryset[query.offset:query.offset + query.limit]
+        if query.offset:
+            return queryset[query.offset:]
+        return queryset
+    
+    def count(self, query: CandidateQuery) -> int:
+        return self._filtered(query).count()
+    
+    def export_rows(self, query: CandidateQuery, columns: List[str], chunk_size: int) -> Iterator[Dict[str, Any]]:
+        # values() + iterator() streams plain dicts chunk by chunk, so memory
+        # stays flat however many rows match. Document statuses are correlated
+        # subqueries served by the (candidate, created/uploaded) indexes.
+        annotations = {
+            'latest_request_status': Subquery(
+                DocumentRequestModel.objects.filter(candidate_id=OuterRef('pk'))
+                .order_by('-created_at').values('status')[:1]
+            ),
+            'pan_status': self._latest_submission_status('pan'),
+            'aadhaar_status': self._latest_submission_status('aadhaar'),
+        }
+        queryset = self.list_queryset(query).annotate(
+            **{name: expression for name, expression in annotations.items() if name in columns}
+        )
+        return queryset.values(*columns).iterator(chunk_size=chunk_size)
+    
+    @staticmethod
+    def _latest_submission_status(document_type: str) -> Subquery:
+        return Subquery(
+            DocumentSubmissionModel.objects.filter(candidate_id=OuterRef('pk'), document_type=document_type)
+            .order_by('-uploaded_at').values('verification_status')[:1]
+        )
+    
+    def _filtered(self, query: CandidateQuery):
+        queryset = CandidateModel.objects.all()
+        if query.extraction_status:
+            queryset = queryset.filter(extraction_status=query.extraction_status.value)
+        # Prefixes become a range on the lower() expression indexes; a range
+        # can use the index where LIKE 'abc%' on an expression cannot. Only
+        # ASCII letters are folded, as SQLite's LOWER() does, so non-ASCII
+        # letters in a prefix match case-sensitively.
+        for field, prefix in (('company', query.company_prefix), ('designation', query.designation_prefix)):
+            if prefix:
+                lowered = _ascii_lower(prefix)
+                queryset = queryset.annotate(**{f'{field}_lower': Lower(field)}).filter(**{
+                    f'{field}_lower__gte': lowered,
+                    f'{field}_lower__lt': lowered[:-1] + chr(ord(lowered[-1]) + 1),
+                })
+        if query.min_confidence is not None:
+            queryset = queryset.filter(extraction_confidence__gte=query.min_confidence)
+        if query.max_confidence is not None:
+            queryset = queryset.filter(extraction_confidence__lte=query.max_confidence)
+        if query.created_after:
+            queryset = queryset.filter(created_at__gte=query.created_after)
+        if query.created_before:
+            queryset = queryset.filter(created_at__lt=query.created_before)
+        return queryset
+    
+    def find_ids_for_reextraction(self, selection: ReextractionSelection, after_id: int, limit: int) -> List[int]:
+        # Keyset pagination on the primary key: each page is one range scan,
+        # however far into the table a (resumed) run has got.
+        queryset = CandidateModel.objects.filter(pk__gt=after_id)
+        if selection.statuses:
+            queryset = queryset.filter(extraction_status__in=[status.value for status in selection.statuses])
+        if selection.versions:
+            queryset = queryset.filter(extractor_version__in=selection.versions)
+        if selection.exclude_version is not None:
+            queryset = queryset.exclude(extractor_version=selection.exclude_version)
+        if selection.max_confidence is not None:
+            queryset = queryset.filter(extraction_confidence__lte=selection.max_confidence)
+        return list(queryset.order_by('pk').values_list('pk', flat=True)[:limit])
+    
     def update(self, candidate: Candidate) -> Candidate:
         if not candidate.id:
             raise ValueError("Candidate must have an ID to update")
         
-        model = CandidateModel.objects.get(pk=candidate.id)
+        with transaction.atomic():
+            model = CandidateModel.objects.select_for_update().get(pk=candidate.id)
+            model.name = candidate.name
+            model.email = candidate.email
+            model.phone = candidate.phone
+            model.company = candidate.company
+            model.designation = candidate.designation
+            model.skills = candidate.skills
+            model.extraction_status = candidate.extraction_status.value
+            model.extraction_confidence = candidate.extraction_confidence
+            model.raw_extracted_data = candidate.raw_extracted_data
+            model.extraction_provisional = candidate.extraction_provisional
+            model.extractor_version = candidate.extractor_version
+            for field_name, value in self._blocking_keys(candidate).items():
+                setattr(model, field_name, value)
+            model.save()
+        
+        return self._to_entity(model)
+    
+    IMPORT_FIELDS = (
+        'name', 'email', 'phone', 'company', 'designation', 'skills',
+        'extraction_status', 'extraction_confidence', 'raw_extracted_data',
+        'extraction_provisional', 'extractor_version', 'email_key', 'phone_key', 'name_key', 'updated_at',
+    )
+    
+    def bulk_upsert_by_email(self, candidates: List[Candidate]) -> Tuple[int, int]:
+        # Rows are matched on the exact email, ignoring case (not on the looser
+        # email_key, which folds distinct addresses together for duplicate
+        # detection). A later record for an email already written in this call
+        # updates that row and counts as an update; across calls the oldest
+        # stored candidate with that email is the one updated. Records without
+        # an email are inserted.
+        emails = {_ascii_lower(candidate.email.strip()) for candidate in candidates} - {''}
+        now = timezone.now()
+        deltas: Dict[str, int] = {}
+        
+        def count(key: str, delta: int) -> None:
+            deltas[key] = deltas.get(key, 0) + delta
+        
+        with transaction.atomic():
+            matched: Dict[str, CandidateModel] = {}
+            rows = (
+                CandidateModel.objects.annotate(email_lower=Lower('email'))
+                .filter(email_lower__in=list(emails))
+                .order_by('created_at', 'id')
+            )
+            for model in rows:
+                matched.setdefault(model.email_lower, model)
+            
+            new_models, to_update, updated = [], {}, 0
+            for candidate in candidates:
+                email = _ascii_lower(candidate.email.strip())
+                model = matched.get(email) if email else None
+                if model is None:
+                    model = CandidateModel()
+                    self._apply_import(model, candidate, self._blocking_keys(candidate), now)
+                    new_models.append(model)
+                    count(CANDIDATES_TOTAL, 1)
+                    count(candidate_status_key(model.extraction_status), 1)
+                    if email:
+                        matched[email] = model
+                    continue
+                count(candidate_status_key(model.extraction_status), -1)
+                self._apply_import(model, candidate, self._blocking_keys(candidate), now)
+                count(candidate_status_key(model.extraction_status), 1)
+                if model.pk is not None:
+                    to_update[model.pk] = model
+                updated += 1
+            
+            CandidateModel.objects.bulk_create(new_models, batch_size=500)
+            self._update_rows(list(to_update.values()), self.IMPORT_FIELDS)
+            adjust_counters(deltas)
+        return len(new_models), updated
+    
+    @staticmethod
+    def _update_rows(models: List[CandidateModel], field_names) -> None:
+        # bulk_update() builds a CASE expression per field and row, which costs
+        # milliseconds per row; one parameterized UPDATE run through
+        # executemany() does the same work in a fraction of the time.
+        if not models:
+            return
+        fields = [CandidateModel._meta.get_field(name) for name in field_names]
+        quote = connection.ops.quote_name
+        sql = 'UPDATE {} SET {} WHERE {} = %s'.format(
+            quote(CandidateModel._meta.db_table),
+            ', '.join(f'{quote(field.column)} = %s' for field in fields),
+            quote(CandidateModel._meta.pk.column),
+        )
+        params = [
+            [field.get_db_prep_save(getattr(model, field.attname), connection) for field in fields] + [model.pk]
+            for model in models
+        ]
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, params)
+    
+    @staticmethod
+    def _apply_import(model: CandidateModel, candidate: Candidate, keys: Dict[str, str], now) -> None:
         model.name = candidate.name
         model.email = candidate.email
         model.phone = candidate.phone
@@ -72,9 +285,73 @@ class CandidateRepository(ICandidateRepository):
         model.extraction_status = candidate.extraction_status.value
         model.extraction_confidence = candidate.extraction_confidence
         model.raw_extracted_data = candidate.raw_extracted_data
-        model.save()
+        model.extraction_provisional = candidate.extraction_provisional
+        model.extractor_version = candidate.extractor_version
+        model.email_key = keys['email_key']
+        model.phone_key = keys['phone_key']
+        model.name_key = keys['name_key']
+        # bulk_update() skips auto_now, so the timestamp is set by hand.
+        model.updated_at = now
+    
+    BLOCKING_KEY_FIELDS = ('email_key', 'phone_key', 'name_key')
+    
+    def find_duplicate_clusters(
+        self, key_fields: List[str], limit: Optional[int] = None, offset: int = 0,
+    ) -> Tuple[int, List[Tuple[List[str], List[Candidate]]]]:
+        # Each key column is grouped over its index to find shared values, then
+        # member ids are fetched by those values; clusters linked by any key are
+        # merged. Only the members of the requested page are loaded.
+        parent: Dict[int, int] = {}
         
-        return self._to_entity(model)
+        def root(pk: int) -> int:
+            while parent.setdefault(pk, pk) != pk:
+                parent[pk] = parent[parent[pk]]
+                pk = parent[pk]
+            return pk
+        
+        matched_on: Dict[int, set] = {}
+        for field_name in key_fields:
+            if field_name not in self.BLOCKING_KEY_FIELDS:
+                raise ValueError(f"Unknown blocking key {field_name}")
+            shared = (
+                CandidateModel.objects.exclude(**{field_name: ''})
+                .order_by()
+                .values(field_name)
+                .annotate(n=Count('id'))
+                .filter(n__gt=1)
+                .values_list(field_name, flat=True)
+            )
+            groups: Dict[str, List[int]] = {}
+            rows = CandidateModel.objects.filter(**{f'{field_name}__in': shared}).values_list('id', field_name)
+            for pk, value in rows:
+                groups.setdefault(value, []).append(pk)
+            for members in groups.values():
+                for pk in members:
+                    parent[root(pk)] = root(members[0])
+                    matched_on.setdefault(pk, set()).add(field_name)
+        
+        clusters: Dict[int, List[int]] = {}
+        for pk in parent:
+            clusters.setdefault(root(pk), []).append(pk)
+        
+        # Largest first, then oldest id, so pages are stable between requests.
+        ordered = sorted((sorted(members) for members in clusters.values()), key=lambda m: (-len(m), m[0]))
+        page = ordered[offset:] if limit is None else ordered[offset:offset + limit]
+        models = CandidateModel.objects.in_bulk([pk for members in page for pk in members])
+        result = []
+        for members in page:
+            keys = sorted(set().union(*(matched_on.get(pk, set()) for pk in members)))
+            result.append((keys, [self._to_entity(models[pk]) for pk in members if pk in models]))
+        return len(ordered), result
+    
+    @staticmethod
+    def _blocking_keys(candidate: Candidate) -> Dict[str, str]:
+        keys = BlockingKeyGenerator.generate(candidate.name, candidate.email, candidate.phone)
+        return {
+            'email_key': keys.email_key,
+            'phone_key': keys.phone_key,
+            'name_key': keys.name_key,
+        }
     
     def _to_entity(self, model: CandidateModel) -> Candidate:
         return Candidate(
@@ -89,6 +366,8 @@ class CandidateRepository(ICandidateRepository):
             extraction_status=ExtractionStatus(model.extraction_status),
             extraction_confidence=model.extraction_confidence or 0.0,
             raw_extracted_data=model.raw_extracted_data,
+            extraction_provisional=model.extraction_provisional,
+            extractor_version=model.extractor_version,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
@@ -108,6 +387,27 @@ class DocumentRequestRepository(IDocumentRequestRepository):
         )
         return self._to_entity(model)
     
+    def bulk_create(self, requests: List[DocumentRequest]) -> List[DocumentRequest]:
+        # One transaction, batched INSERTs; candidates are referenced by id only.
+        models = [
+            DocumentRequestModel(
+                candidate_id=request.candidate_id,
+                request_type=request.request_type.value,
+                request_message=request.request_message,
+                communication_channel=request.communication_channel.value,
+                status=request.status.value,
+            )
+            for request in requests
+        ]
+        deltas = {REQUESTS_TOTAL: len(models)}
+        for model in models:
+            key = request_status_key(model.status)
+            deltas[key] = deltas.get(key, 0) + 1
+        with transaction.atomic():
+            models = DocumentRequestModel.objects.bulk_create(models, batch_size=500)
+            adjust_counters(deltas)
+        return [self._to_entity(m) for m in models]
+    
     def get_by_candidate_id(self, candidate_id: int) -> List[DocumentRequest]:
         models = DocumentRequestModel.objects.filter(candidate_id=candidate_id)
         return [self._to_entity(m) for m in models]
@@ -116,9 +416,10 @@ class DocumentRequestRepository(IDocumentRequestRepository):
         if not request.id:
             raise ValueError("Request must have an ID to update")
         
-        model = DocumentRequestModel.objects.get(pk=request.id)
-        model.status = request.status.value
-        model.save()
+        with transaction.atomic():
+            model = DocumentRequestModel.objects.select_for_update().get(pk=request.id)
+            model.status = request.status.value
+            model.save()
         return self._to_entity(model)
     
     def _to_entity(self, model: DocumentRequestModel) -> DocumentRequest:
@@ -151,6 +452,7 @@ class DocumentSubmissionRepository(IDocumentSubmissionRepository):
             candidate=candidate_model,
             document_type=submission.document_type.value,
             document_file=document_file,
+            original_file_path=submission.original_file_path,
             verification_status=submission.verification_status.value,
         )
         return self._to_entity(model)
@@ -167,7 +469,36 @@ class DocumentSubmissionRepository(IDocumentSubmissionRepository):
             candidate_id=model.candidate_id,
             document_type=DocumentType(model.document_type),
             document_file_path=model.document_file.name if model.document_file else '',
+            original_file_path=model.original_file_path,
             verification_status=VerificationStatus(model.verification_status),
             uploaded_at=model.uploaded_at,
         )
 
+
+class ResumeTextRepository(IResumeTextRepository):
+    
+    def save(self, candidate_id: int, text: str, source_name: str = '') -> None:
+        codec, data = compress_text(text)
+        ResumeTextModel.objects.update_or_create(
+            candidate_id=candidate_id,
+            defaults={
+                'codec': codec,
+                'data': data,
+                'text_length': len(text),
+                'source_name': source_name,
+            },
+        )
+    
+    def get(self, candidate_id: int, source_name: Optional[str] = None) -> Optional[str]:
+        queryset = ResumeTextModel.objects.filter(candidate_id=candidate_id)
+        if source_name is not None:
+            queryset = queryset.filter(source_name=source_name)
+        row = queryset.values_list('codec', 'data').first()
+        return decompress_text(*row) if row else None
+
+
+class StatsRepository(IStatsRepository):
+    
+    def get_counts(self) -> Dict[str, int]:
+        # One small table read, independent of how many candidates exist.
+        return read_counters()
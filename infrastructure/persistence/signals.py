@@ -0,0 +1,151 @@
+"""
+Signal handlers for persistence models.
+"""
+from django.conf import settings
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .counters import (
+    CANDIDATES_TOTAL,
+    REQUESTS_TOTAL,
+    SUBMISSIONS_TOTAL,
+    adjust_counters,
+    candidate_status_key,
+    request_status_key,
+    status_change,
+    verification_status_key,
+)
+from .models import CandidateModel, DocumentRequestModel, DocumentSubmissionModel
+
+
+def _release_file(field_file) -> None:
+    _release_name(field_file.storage, field_file.name)
+
+
+def _release_name(storage, name: str) -> None:
+    # Only content-addressed files are reference counted; anything else keeps
+    # the old behaviour of leaving the file on disk. The reference is dropped
+    # once the transaction commits, so a rolled-back delete or update still
+    # finds its file.
+    if name and getattr(storage, 'is_content_addressed', lambda name: False)(name):
+        transaction.on_commit(lambda: storage.delete(name))
+
+
+@receiver(post_delete, sender=CandidateModel)
+def release_resume_file(sender, instance, **kwargs):
+    _release_file(instance.resume_file)
+
+
+@receiver(post_delete, sender=DocumentSubmissionModel)
+def release_document_file(sender, instance, **kwargs):
+    _release_file(instance.document_file)
+    _release_file(instance.thumbnail)
+    _release_file(instance.preview)
+
+
+FILE_FIELDS = {
+    CandidateModel: ('resume_file',),
+    DocumentSubmissionModel: ('document_file', 'thumbnail', 'preview'),
+}
+
+
+@receiver(pre_save, sender=CandidateModel)
+@receiver(pre_save, sender=DocumentSubmissionModel)
+def remember_file_names(sender, instance, update_fields=None, **kwargs):
+    field_names = [
+        name for name in FILE_FIELDS[sender]
+        if update_fields is None or name in update_fields
+    ]
+    instance._replaced_files = {}
+    if instance._state.adding or not field_names:
+        return
+    stored = sender._default_manager.filter(pk=instance.pk).values_list(*field_names).first()
+    if stored is None:
+        return
+    for field_name, old_name in zip(field_names, stored):
+        field_file = getattr(instance, field_name)
+        # An uncommitted file is written during this save and takes a new
+        # reference even when its contents (and so its name) are unchanged.
+        if old_name and (old_name != field_file.name or (field_file and not field_file._committed)):
+            instance._replaced_files[field_name] = old_name
+
+
+@receiver(post_save, sender=CandidateModel)
+@receiver(post_save, sender=DocumentSubmissionModel)
+def release_replaced_files(sender, instance, created, **kwargs):
+    for field_name, old_name in getattr(instance, '_replaced_files', {}).items():
+        _release_name(getattr(instance, field_name).storage, old_name)
+
+
+# Every counted row goes through these handlers, whether it is written by a
+# repository, the admin or a plain save(). CountedModel.save() and deletes
+# (including cascades from the admin) are atomic, so the counters commit or
+# roll back with the rows. Bulk writes skip signals and adjust the counters
+# themselves.
+COUNTED_FIELDS = {
+    CandidateModel: ('extraction_status', CANDIDATES_TOTAL, candidate_status_key),
+    DocumentRequestModel: ('status', REQUESTS_TOTAL, request_status_key),
+    DocumentSubmissionModel: ('verification_status', SUBMISSIONS_TOTAL, verification_status_key),
+}
+
+
+@receiver(pre_save, sender=CandidateModel)
+@receiver(pre_save, sender=DocumentRequestModel)
+@receiver(pre_save, sender=DocumentSubmissionModel)
+def remember_counted_status(sender, instance, update_fields=None, **kwargs):
+    field_name = COUNTED_FIELDS[sender][0]
+    instance._counted_status = None
+    if instance._state.adding or (update_fields is not None and field_name not in update_fields):
+        return
+    # Read the stored value under a row lock rather than trusting the
+    # instance, which may have been loaded before another writer changed it.
+    instance._counted_status = (
+        sender._default_manager.select_for_update()
+        .filter(pk=instance.pk)
+        .values_list(field_name, flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=CandidateModel)
+@receiver(post_save, sender=DocumentRequestModel)
+@receiver(post_save, sender=DocumentSubmissionModel)
+def count_saved_row(sender, instance, created, **kwargs):
+    field_name, total_key, key_for = COUNTED_FIELDS[sender]
+    new_status = getattr(instance, field_name)
+    if created:
+        adjust_counters({total_key: 1, key_for(new_status): 1})
+    elif instance._counted_status is not None:
+        adjust_counters(status_change(key_for, instance._counted_status, new_status))
+
+
+@receiver(post_delete, sender=CandidateModel)
+def count_deleted_candidate(sender, instance, **kwargs):
+    adjust_counters({CANDIDATES_TOTAL: -1, candidate_status_key(instance.extraction_status): -1})
+
+
+@receiver(post_delete, sender=DocumentRequestModel)
+def count_deleted_request(sender, instance, **kwargs):
+    adjust_counters({REQUESTS_TOTAL: -1, request_status_key(instance.status): -1})
+
+
+@receiver(post_delete, sender=DocumentSubmissionModel)
+def count_deleted_submission(sender, instance, **kwargs):
+    adjust_counters({
+        SUBMISSIONS_TOTAL: -1,
+        verification_status_key(instance.verification_status): -1,
+    })
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    pragmas = getattr(settings, 'SQLITE_PRAGMAS', {})
+    if not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
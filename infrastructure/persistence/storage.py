@@ -0,0 +1,98 @@
+"""
+Content-addressed file storage for resumes and identity documents.
+
+Files are stored by the SHA-256 of their contents in sharded directories,
+``<upload_to>/<h[0:2]>/<h[2:4]>/<h><ext>``, so directories stay small and
+identical uploads share one file. A reference count per stored file is kept
+in ``StoredFileModel``; the file is removed when the last reference goes.
+The ``reconcile_stored_files`` command recounts references from the model
+file fields if they ever drift.
+Names that are not content-addressed (files saved before this storage was
+enabled) are handled exactly like ``FileSystemStorage`` would.
+"""
+import hashlib
+import os
+import posixpath
+import re
+import uuid
+
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import F
+
+
+CONTENT_ADDRESSED_NAME = re.compile(r'(?:^|/)[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}(?:\.[\w]+)?$')
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+def hash_content(content) -> str:
+    """SHA-256 of a Django File, leaving it rewound."""
+    digest = hashlib.sha256()
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    for chunk in content.chunks(HASH_CHUNK_SIZE):
+        digest.update(chunk if isinstance(chunk, bytes) else chunk.encode())
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    return digest.hexdigest()
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """FileSystemStorage that names files by content hash, with reference counting."""
+
+    def is_content_addressed(self, name: str) -> bool:
+        return bool(name) and bool(CONTENT_ADDRESSED_NAME.search(name))
+
+    def content_name(self, name: str, digest: str) -> str:
+        """Sharded name for ``digest`` under the directory of ``name``."""
+        directory = posixpath.dirname(name.replace('\\', '/'))
+        extension = os.path.splitext(name)[1].lower()
+        return posixpath.join(directory, digest[:2], digest[2:4], f'{digest}{extension}')
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is decided by the contents in _save.
+        return name
+
+    def _save(self, name, content):
+        from .models import StoredFileModel
+
+        # Upload handlers may already have hashed the stream.
+        digest = getattr(content, 'content_hash', None) or hash_content(content)
+        target = self.content_name(name, digest)
+
+        # Inside a caller's transaction (a model save, which is atomic for the
+        # counted models, or a request transaction) this block is a savepoint,
+        # so the new reference rolls back with the row that would have held it.
+        # The file itself stays on disk; reconcile_stored_files removes it.
+        with transaction.atomic():
+            stored, created = StoredFileModel.objects.select_for_update().get_or_create(
+                name=target,
+                defaults={'content_hash': digest, 'size': content.size or 0, 'ref_count': 0},
+            )
+            if created or not self.exists(target):
+                self._write(target, content)
+            StoredFileModel.objects.filter(pk=stored.pk).update(ref_count=F('ref_count') + 1)
+        return target
+
+    def _write(self, target: str, content) -> None:
+        # Write under a unique temporary name and rename into place, so two
+        # writers of the same content can never see a half-written file.
+        temporary = posixpath.join(posixpath.dirname(target), f'.tmp-{uuid.uuid4().hex}')
+        temporary = super()._save(temporary, content)
+        os.replace(self.path(temporary), self.path(target))
+
+    def delete(self, name):
+        if not self.is_content_addressed(name):
+            return super().delete(name)
+
+        from .models import StoredFileModel
+
+        with transaction.atomic():
+            released = StoredFileModel.objects.filter(name=name, ref_count__gt=1).update(
+                ref_count=F('ref_count') - 1,
+            )
+            if released:
+                return
+            StoredFileModel.objects.filter(name=name).delete()
+            super().delete(name)
@@ -0,0 +1,61 @@
+"""
+Compression for stored resume text.
+
+Text is compressed with zstd when the optional ``zstandard`` package is
+installed and with zlib otherwise. Every blob is stored together with the
+codec that wrote it, so switching codecs never breaks reading older rows.
+"""
+import zlib
+from typing import Tuple
+
+from django.conf import settings
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+
+ZSTD = 'zstd'
+ZLIB = 'zlib'
+# Codec label for text too short to be worth compressing.
+RAW = 'raw'
+
+MIN_COMPRESSED_LENGTH = 64
+
+
+def available_codec() -> str:
+    """The configured codec, or zlib when zstd is configured but not installed."""
+    codec = getattr(settings, 'RESUME_TEXT_CODEC', ZSTD)
+    if codec == ZSTD and zstandard is None:
+        return ZLIB
+    return codec
+
+
+def compress_text(text: str) -> Tuple[str, bytes]:
+    """Return ``(codec, data)`` for the given text."""
+    raw = text.encode('utf-8')
+    if len(raw) < MIN_COMPRESSED_LENGTH:
+        return RAW, raw
+
+    codec = available_codec()
+    if codec == ZSTD:
+        level = getattr(settings, 'RESUME_TEXT_ZSTD_LEVEL', 10)
+        return ZSTD, zstandard.ZstdCompressor(level=level).compress(raw)
+    if codec == ZLIB:
+        level = getattr(settings, 'RESUME_TEXT_ZLIB_LEVEL', 9)
+        return ZLIB, zlib.compress(raw, level)
+    raise ValueError(f"Unknown resume text codec {codec!r}")
+
+
+def decompress_text(codec: str, data: bytes) -> str:
+    data = bytes(data)
+    if codec == RAW:
+        return data.decode('utf-8')
+    if codec == ZLIB:
+        return zlib.decompress(data).decode('utf-8')
+    if codec == ZSTD:
+        if zstandard is None:
+            raise RuntimeError("Resume text was stored with zstd; install the zstandard package to read it")
+        return zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+    raise ValueError(f"Unknown resume text codec {codec!r}")
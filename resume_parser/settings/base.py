@@ -23,6 +23,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'infrastructure.api.middleware.QueryInstrumentationMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -55,10 +56,43 @@ WSGI_APPLICATION = 'resume_parser.wsgi.application'
 # Database
 
 
+# SQLite tuned mode: WAL lets readers run alongside a writer, synchronous=NORMAL
+# is durable enough under WAL, and a busy timeout plus IMMEDIATE transactions
+# make writers queue instead of failing with "database is locked". Pragmas are
+# applied on every new connection (see infrastructure/persistence/signals.py).
+SQLITE_TUNED_MODE = config('SQLITE_TUNED_MODE', default=True, cast=bool)
+SQLITE_BUSY_TIMEOUT_MS = config('SQLITE_BUSY_TIMEOUT_MS', default=5000, cast=int)
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': SQLITE_BUSY_TIMEOUT_MS,
+    'mmap_size': config('SQLITE_MMAP_SIZE', default=256 * 1024 * 1024, cast=int),
+    'cache_size': -config('SQLITE_CACHE_SIZE_KB', default=64 * 1024, cast=int),
+    'temp_store': 'MEMORY',
+    'foreign_keys': 'ON',
+} if SQLITE_TUNED_MODE else {}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Persistent connections; health checks drop ones that went bad.
+        'CONN_MAX_AGE': config('CONN_MAX_AGE', default=600 if SQLITE_TUNED_MODE else 0, cast=int),
+        'CONN_HEALTH_CHECKS': SQLITE_TUNED_MODE,
+        'OPTIONS': {
+            'timeout': SQLITE_BUSY_TIMEOUT_MS / 1000,
+            'transaction_mode': 'IMMEDIATE',
+        } if SQLITE_TUNED_MODE else {},
+    }
+}
+
+# Cache shared by every worker process (document request template pools).
+# The file-based default is shared on one host; point it at Redis or
+# Memcached when running on several hosts.
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': config('CACHE_LOCATION', default=str(BASE_DIR / 'cache')),
     }
 }
 
@@ -91,6 +125,44 @@ STATIC_ROOT = BASE_DIR / config('STATIC_ROOT', default='staticfiles')
 # Media files
 MEDIA_URL = config('MEDIA_URL', default='/media/')
 MEDIA_ROOT = BASE_DIR / config('MEDIA_ROOT', default='media')
+# Media access and delivery (see infrastructure/api/media.py).
+# MEDIA_SERVE_MODE: python, x-accel (nginx) or x-sendfile (Apache/lighttpd).
+MEDIA_REQUIRE_AUTH = config('MEDIA_REQUIRE_AUTH', default=True, cast=bool)
+MEDIA_SIGNATURE_MAX_AGE = config('MEDIA_SIGNATURE_MAX_AGE', default=3600, cast=int)
+MEDIA_SERVE_MODE = config('MEDIA_SERVE_MODE', default='python')
+MEDIA_ACCEL_REDIRECT_PREFIX = config('MEDIA_ACCEL_REDIRECT_PREFIX', default='/protected-media/')
+MEDIA_CACHE_MAX_AGE = config('MEDIA_CACHE_MAX_AGE', default=300, cast=int)
+
+# Uploaded files are stored by content hash in sharded directories
+# (see infrastructure/persistence/storage.py); set to False for plain paths.
+CONTENT_ADDRESSED_STORAGE = config('CONTENT_ADDRESSED_STORAGE', default=True, cast=bool)
+STORAGES = {
+    'default': {
+        'BACKEND': (
+            'infrastructure.persistence.storage.ContentAddressedStorage'
+            if CONTENT_ADDRESSED_STORAGE
+            else 'django.core.files.storage.FileSystemStorage'
+        ),
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+    # Untouched document uploads kept alongside the normalized copies; point
+    # this at cheaper cold storage in production.
+    'originals': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        'OPTIONS': {
+            'location': BASE_DIR / config('DOCUMENT_ORIGINALS_ROOT', default='originals'),
+            'base_url': None,
+        },
+    },
+}
+
+# Records written per bulk_create/bulk_update batch by candidate imports
+CANDIDATE_IMPORT_BATCH_SIZE = config('CANDIDATE_IMPORT_BATCH_SIZE', default=1000, cast=int)
+
+# Rows fetched per database round trip when streaming candidate exports
+CANDIDATE_EXPORT_CHUNK_SIZE = config('CANDIDATE_EXPORT_CHUNK_SIZE', default=2000, cast=int)
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -141,8 +213,60 @@ OPENROUTER_BASE_URL = config(
     default='https://openrouter.ai/api/v1'
 )
 OPENROUTER_MODEL = config('OPENROUTER_MODEL', default='openai/gpt-3.5-turbo')
+# Bump when the extraction prompt changes; together with the model it forms the
+# extractor_version stored on candidates, which `manage.py reextract` selects on.
+RESUME_EXTRACTION_PROMPT_VERSION = config('RESUME_EXTRACTION_PROMPT_VERSION', default='1')
+REEXTRACT_WORKERS = config('REEXTRACT_WORKERS', default=4, cast=int)
+
+# Extracted resume text is stored compressed in resume_texts: zstd when the
+# zstandard package is installed, zlib otherwise.
+RESUME_TEXT_CODEC = config('RESUME_TEXT_CODEC', default='zstd')
+RESUME_TEXT_ZSTD_LEVEL = config('RESUME_TEXT_ZSTD_LEVEL', default=10, cast=int)
+RESUME_TEXT_ZLIB_LEVEL = config('RESUME_TEXT_ZLIB_LEVEL', default=9, cast=int)
+
+# PDF text backend: pypdf2, pypdf, pdfminer, pypdfium2 (when installed), 'auto'
+# (fastest installed) or 'benchmark' (time the installed backends on the PDFs
+# under RESUME_PDF_BENCHMARK_CORPUS once per process and keep the fastest).
+RESUME_PDF_BACKEND = config('RESUME_PDF_BACKEND', default='auto')
+RESUME_PDF_BENCHMARK_CORPUS = config('RESUME_PDF_BENCHMARK_CORPUS', default='')
+# PDFs with at least this many pages are extracted in parallel page ranges
+# on a process pool of RESUME_PDF_WORKERS (0 = one per CPU); 0 disables.
+RESUME_PDF_PARALLEL_MIN_PAGES = config('RESUME_PDF_PARALLEL_MIN_PAGES', default=40, cast=int)
+RESUME_PDF_WORKERS = config('RESUME_PDF_WORKERS', default=0, cast=int)
+
+# Resume extraction deadline in ms (0 disables). When the LLM is slower, a
+# provisional regex extraction is saved and upgraded in the background.
+RESUME_EXTRACTION_DEADLINE_MS = config('RESUME_EXTRACTION_DEADLINE_MS', default=0, cast=int)
+RESUME_PROVISIONAL_CONFIDENCE_FACTOR = config('RESUME_PROVISIONAL_CONFIDENCE_FACTOR', default=0.5, cast=float)
+
+# Threads used to generate messages for bulk document requests
+BULK_REQUEST_DOCUMENTS_WORKERS = config('BULK_REQUEST_DOCUMENTS_WORKERS', default=8, cast=int)
 
 # File upload settings
+# Uploads are streamed to temporary files by StreamingHashUploadHandler, which
+# hashes them, checks magic bytes and enforces the per-field size limits below.
+FILE_UPLOAD_HANDLERS = [
+    'infrastructure.api.upload_handlers.StreamingHashUploadHandler',
+]
+UPLOAD_MAX_FILE_SIZE = config('UPLOAD_MAX_FILE_SIZE', default=10 * 1024 * 1024, cast=int)
+UPLOAD_FIELD_RULES = {
+    'resume_file': {'max_size': UPLOAD_MAX_FILE_SIZE, 'types': ['pdf', 'docx']},
+    'document_file': {'max_size': UPLOAD_MAX_FILE_SIZE, 'types': ['jpeg', 'png', 'webp', 'pdf']},
+    # CSV/NDJSON text has no magic bytes, so only the size is checked. The API
+    # imports inside the request; bigger files go through `manage.py import_candidates`.
+    'import_file': {'max_size': config('UPLOAD_IMPORT_MAX_SIZE', default=20 * 1024 * 1024, cast=int)},
+}
+# Normalization of submitted document photos
+DOCUMENT_MAX_DIMENSION = config('DOCUMENT_MAX_DIMENSION', default=2000, cast=int)
+DOCUMENT_NORMALIZED_FORMAT = config('DOCUMENT_NORMALIZED_FORMAT', default='JPEG')  # JPEG or WEBP
+DOCUMENT_NORMALIZED_QUALITY = config('DOCUMENT_NORMALIZED_QUALITY', default=85, cast=int)
+DOCUMENT_KEEP_ORIGINALS = config('DOCUMENT_KEEP_ORIGINALS', default=False, cast=bool)
+
+# Thumbnail/preview derivatives for submitted documents
+DOCUMENT_THUMBNAIL_SIZE = config('DOCUMENT_THUMBNAIL_SIZE', default=256, cast=int)
+DOCUMENT_PREVIEW_SIZE = config('DOCUMENT_PREVIEW_SIZE', default=1280, cast=int)
+DOCUMENT_DERIVATIVE_FORMAT = config('DOCUMENT_DERIVATIVE_FORMAT', default='WEBP')  # WEBP or JPEG
+DOCUMENT_DERIVATIVE_QUALITY = config('DOCUMENT_DERIVATIVE_QUALITY', default=80, cast=int)
 FILE_UPLOAD_MAX_MEMORY_SIZE = config(
     'FILE_UPLOAD_MAX_MEMORY_SIZE',
     default=10 * 1024 * 1024,  # 10MB
@@ -154,6 +278,31 @@ DATA_UPLOAD_MAX_MEMORY_SIZE = config(
     cast=int
 )
 
+# Email delivery (messages are queued in the outbox and sent by drain_email_outbox)
+EMAIL_BACKEND = config('EMAIL_BACKEND', default='django.core.mail.backends.smtp.EmailBackend')
+EMAIL_HOST = config('EMAIL_HOST', default='localhost')
+EMAIL_PORT = config('EMAIL_PORT', default=25, cast=int)
+EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
+EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
+EMAIL_USE_TLS = config('EMAIL_USE_TLS', default=False, cast=bool)
+DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='noreply@example.com')
+EMAIL_OUTBOX_BATCH_SIZE = config('EMAIL_OUTBOX_BATCH_SIZE', default=100, cast=int)
+EMAIL_OUTBOX_MAX_ATTEMPTS = config('EMAIL_OUTBOX_MAX_ATTEMPTS', default=5, cast=int)
+EMAIL_OUTBOX_RETRY_BASE_SECONDS = config('EMAIL_OUTBOX_RETRY_BASE_SECONDS', default=60, cast=int)
+
+# SQL instrumentation (per-request query count, SQL time and N+1 detection)
+QUERY_INSTRUMENTATION_ENABLED = config('QUERY_INSTRUMENTATION_ENABLED', default=True, cast=bool)
+QUERY_INSTRUMENTATION_SLOW_QUERY_MS = config('QUERY_INSTRUMENTATION_SLOW_QUERY_MS', default=100, cast=float)
+QUERY_INSTRUMENTATION_SLOWEST_COUNT = config('QUERY_INSTRUMENTATION_SLOWEST_COUNT', default=3, cast=int)
+QUERY_INSTRUMENTATION_NPLUSONE_THRESHOLD = config('QUERY_INSTRUMENTATION_NPLUSONE_THRESHOLD', default=5, cast=int)
+
+# On-demand request profiling (send the token in X-Profile or ?profile=)
+PROFILING_ENABLED = config('PROFILING_ENABLED', default=False, cast=bool)
+PROFILING_TOKEN = config('PROFILING_TOKEN', default='')
+PROFILING_MODE = config('PROFILING_MODE', default='cprofile')  # cprofile or sampling
+PROFILING_SAMPLE_INTERVAL = config('PROFILING_SAMPLE_INTERVAL', default=0.005, cast=float)
+PROFILING_OUTPUT_DIR = BASE_DIR / config('PROFILING_OUTPUT_DIR', default='profiles')
+
 # Security settings (override in production)
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
@@ -48,8 +48,10 @@ LOGGING = {
 }
 
 
-# Development email backend (console for testing)
-EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+# Development email backend: outbox deliveries are written to files
+# (set EMAIL_BACKEND to the locmem or console backend to change that)
+EMAIL_BACKEND = config('EMAIL_BACKEND', default='django.core.mail.backends.filebased.EmailBackend')
+EMAIL_FILE_PATH = BASE_DIR / config('EMAIL_FILE_PATH', default='sent_emails')
 
 
 
@@ -14,16 +14,22 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
+
+from infrastructure.api.media import MediaFileView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/candidates/', include('infrastructure.api.urls')),
+    # Uploaded media is served through an access-checked view in every
+    # environment; see MEDIA_SERVE_MODE for proxy offload.
+    re_path(
+        rf'^{re.escape(settings.MEDIA_URL.lstrip("/"))}(?P<path>.+)$',
+        MediaFileView.as_view(),
+        name='media',
+    ),
 ]
-
-
-if settings.DEBUG:
-        urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)